@@ -0,0 +1,284 @@
+# ----------------------------------------------------------------------
+# |
+# |  CommitCache.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 11:04:26
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains a persistent, on-disk cache of commit information.
+
+A commit's message, author, date, and modified files never change, so this information is stored in
+the repository's git directory (keyed by the commit's hexsha) and reused across invocations. The cache
+is strictly an optimization; any problems encountered while reading or writing it result in the
+information being retrieved from git instead.
+"""
+
+import sqlite3
+import time
+import zlib
+
+from datetime import datetime
+from pathlib import Path
+from typing import ClassVar, Optional, TYPE_CHECKING
+
+from AutoGitSemVer.GitEx import LogRecord
+
+if TYPE_CHECKING:
+    from typing_extensions import Self  # pragma: no cover
+
+
+# ----------------------------------------------------------------------
+class CommitCache:
+    """Persistent cache of `LogRecord`s stored in '<git dir>/autogitsemver/commits.db'."""
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Data
+    # |
+    # ----------------------------------------------------------------------
+    VERSION: ClassVar[int] = 1
+
+    DIRECTORY_NAME: ClassVar[str] = "autogitsemver"
+    FILENAME: ClassVar[str] = "commits.db"
+
+    DEFAULT_MAX_NUM_COMMITS: ClassVar[int] = 250_000
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Open(
+        cls,
+        git_dir: Path,
+        *,
+        max_num_commits: int = DEFAULT_MAX_NUM_COMMITS,
+    ) -> Optional["CommitCache"]:
+        """Opens (or creates) the cache; returns None if the cache is not available."""
+
+        filename = git_dir / cls.DIRECTORY_NAME / cls.FILENAME
+
+        try:
+            filename.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return None
+
+        # Try twice; the first failure may be the result of a corrupted or incompatible file, which will be
+        # removed before the second attempt.
+        for _ in range(2):
+            try:
+                return cls(_Connect(filename), max_num_commits)
+            except sqlite3.Error:
+                try:
+                    filename.unlink()
+                except OSError:
+                    return None
+
+        return None  # pragma: no cover
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        max_num_commits: int,
+    ):
+        self._connection: Optional[sqlite3.Connection] = connection
+        self._max_num_commits = max_num_commits
+
+        self._used: list[str] = []
+
+        self.num_hits = 0
+        self.num_misses = 0
+
+    # ----------------------------------------------------------------------
+    def __enter__(self) -> "Self":
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args) -> None:
+        self.Close()
+
+    # ----------------------------------------------------------------------
+    def Get(
+        self,
+        hexsha: str,
+    ) -> Optional[LogRecord]:
+        """Returns the cached record for the commit (if any)."""
+
+        if self._connection is None:
+            self.num_misses += 1
+            return None
+
+        try:
+            row = self._connection.execute(
+                "SELECT data, checksum FROM commits WHERE hexsha = ?",
+                (hexsha,),
+            ).fetchone()
+
+            if row is None:
+                self.num_misses += 1
+                return None
+
+            data, checksum = row
+
+            if zlib.crc32(data) != checksum:
+                # The entry is corrupt; remove it so that it is repopulated
+                self._connection.execute("DELETE FROM commits WHERE hexsha = ?", (hexsha,))
+
+                self.num_misses += 1
+                return None
+
+            record = _Deserialize(hexsha, data)
+
+        except (sqlite3.Error, zlib.error, UnicodeDecodeError, ValueError):
+            self._Disable()
+
+            self.num_misses += 1
+            return None
+
+        self._used.append(hexsha)
+
+        self.num_hits += 1
+        return record
+
+    # ----------------------------------------------------------------------
+    def Add(
+        self,
+        records: list[LogRecord],
+    ) -> None:
+        """Adds records to the cache."""
+
+        if self._connection is None or not records:
+            return
+
+        now = int(time.time())
+
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO commits (hexsha, data, checksum, last_used) VALUES (?, ?, ?, ?)",
+                    [
+                        (record.hexsha, data, zlib.crc32(data), now)
+                        for record in records
+                        for data in [_Serialize(record)]
+                    ],
+                )
+        except sqlite3.Error:
+            self._Disable()
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        """Records which entries were used, evicts the least recently used entries, and closes the cache."""
+
+        if self._connection is None:
+            return
+
+        try:
+            with self._connection:
+                now = int(time.time())
+
+                for index in range(0, len(self._used), _MAX_SQL_VARIABLES):
+                    batch = self._used[index : index + _MAX_SQL_VARIABLES]
+
+                    self._connection.execute(
+                        "UPDATE commits SET last_used = ? WHERE hexsha IN ({})".format(
+                            ", ".join("?" * len(batch)),
+                        ),
+                        (now, *batch),
+                    )
+
+                num_commits = self._connection.execute("SELECT COUNT(*) FROM commits").fetchone()[0]
+
+                if num_commits > self._max_num_commits:
+                    self._connection.execute(
+                        "DELETE FROM commits WHERE hexsha IN (SELECT hexsha FROM commits ORDER BY last_used LIMIT ?)",
+                        (num_commits - self._max_num_commits,),
+                    )
+        except sqlite3.Error:
+            pass
+
+        self._Disable()
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _Disable(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+        self._used = []
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_MAX_SQL_VARIABLES = 500
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _Connect(
+    filename: Path,
+) -> sqlite3.Connection:
+    connection = sqlite3.connect(filename, timeout=5.0)
+
+    try:
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+
+        if version != CommitCache.VERSION:
+            with connection:
+                connection.execute("DROP TABLE IF EXISTS commits")
+                connection.execute(
+                    "CREATE TABLE commits (hexsha TEXT PRIMARY KEY, data BLOB NOT NULL, checksum INTEGER NOT NULL, last_used INTEGER NOT NULL) WITHOUT ROWID",
+                )
+                connection.execute("CREATE INDEX commits_last_used ON commits (last_used)")
+                connection.execute("PRAGMA user_version = {}".format(CommitCache.VERSION))
+
+    except:
+        connection.close()
+        raise
+
+    return connection
+
+
+# ----------------------------------------------------------------------
+def _Serialize(
+    record: LogRecord,
+) -> bytes:
+    return zlib.compress(
+        "\0".join(
+            [
+                record.author,
+                record.author_date.isoformat(),
+                record.message,
+                *record.filenames,
+            ],
+        ).encode("utf-8", errors="surrogateescape"),
+    )
+
+
+# ----------------------------------------------------------------------
+def _Deserialize(
+    hexsha: str,
+    data: bytes,
+) -> LogRecord:
+    author, author_date, message, *filenames = (
+        zlib.decompress(data).decode("utf-8", errors="surrogateescape").split("\0")
+    )
+
+    return LogRecord(hexsha, author, datetime.fromisoformat(author_date), message, filenames)
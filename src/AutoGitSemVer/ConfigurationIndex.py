@@ -0,0 +1,344 @@
+# ----------------------------------------------------------------------
+# |
+# |  ConfigurationIndex.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 15:02:37
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains an index that maps files within a repository to the configuration that owns them."""
+
+import json
+import os
+import threading
+
+from pathlib import Path, PurePath, PurePosixPath
+from typing import Optional
+
+from AutoGitSemVer import GitEx, Profiler
+from AutoGitSemVer.JsonStore import JsonStore
+
+
+# ----------------------------------------------------------------------
+class ConfigurationIndex:
+    """Maps files within a repository to the configuration file that owns them.
+
+    A file is owned by the configuration file in the nearest directory at or above the file's directory
+    (this is the same search performed by `Lib.GetConfigurationFilename`). Lookups use the index rather
+    than the file system and results are memoized per directory.
+    """
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def FromWorkingTree(
+        cls,
+        repository_root: Path,
+        configuration_filenames: list[str],
+        *,
+        additional_filenames: Optional[list[Path]] = None,
+    ) -> "ConfigurationIndex":
+        """Creates an index from the tracked and untracked (but not ignored) files in the working tree.
+
+        `additional_filenames` are configuration files that are included in the index even if they are
+        ignored by git.
+        """
+
+        candidates = cls._GetWorkingTreeConfigurationFilenames(repository_root, configuration_filenames)
+
+        candidates += [
+            filename.relative_to(repository_root).as_posix() for filename in additional_filenames or []
+        ]
+
+        return cls(
+            repository_root,
+            configuration_filenames,
+            [candidate for candidate in candidates if (repository_root / candidate).is_file()],
+        )
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def FromTree(
+        cls,
+        repository_root: Path,
+        configuration_filenames: list[str],
+        treeish: str = "HEAD",
+        *,
+        additional_filenames: Optional[list[Path]] = None,
+        include_working_tree: bool = False,
+        store: Optional[JsonStore] = None,
+        object_reader: Optional[GitEx.ObjectReader] = None,
+    ) -> "ConfigurationIndex":
+        """Creates an index from the files committed in a tree (by default, the tree associated with HEAD).
+
+        By default, the working tree isn't accessed, so the index is correct for sparse checkouts (where configuration
+        files may not be on disk) and includes files that have since been deleted from the working tree.
+        The configuration files found in a tree are cached (by tree hexsha) in-process and in `store`.
+
+        `additional_filenames` are configuration files that are included in the index even if they have
+        not been committed. When `include_working_tree` is True, the configuration files that exist in the
+        working tree (including those that are untracked but not ignored) are included as well, so the
+        index matches the one created by `FromWorkingTree` for files on disk; these files are available via
+        `uncommitted_filenames`. `object_reader` is used to resolve the tree (if provided).
+        """
+
+        filenames: list[str] = []
+        uncommitted_filenames: list[str] = []
+
+        tree_revision = "{}^{{tree}}".format(treeish)
+
+        if object_reader is None:
+            tree = GitEx.ResolveObject(repository_root, tree_revision)
+        else:
+            info = object_reader.GetInfo(tree_revision)
+            tree = None if info is None else info[0]
+
+        if tree is not None:
+            filenames += cls._GetTreeConfigurationFilenames(
+                repository_root,
+                configuration_filenames,
+                tree,
+                store,
+            )
+
+        if include_working_tree:
+            committed_filenames = set(filenames)
+
+            uncommitted_filenames += sorted(
+                filename
+                for filename in cls._GetWorkingTreeConfigurationFilenames(
+                    repository_root,
+                    configuration_filenames,
+                )
+                if filename not in committed_filenames and (repository_root / filename).is_file()
+            )
+
+            filenames += uncommitted_filenames
+
+        filenames += [
+            filename.relative_to(repository_root).as_posix() for filename in additional_filenames or []
+        ]
+
+        return cls(
+            repository_root,
+            configuration_filenames,
+            filenames,
+            uncommitted_filenames=uncommitted_filenames,
+        )
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        repository_root: Path,
+        configuration_filenames: list[str],
+        filenames: list[str],
+        *,
+        uncommitted_filenames: Optional[list[str]] = None,
+    ):
+        """`filenames` are the configuration files relative to the repository root, in posix form.
+
+        `uncommitted_filenames` are the files in `filenames` that were found in the working tree rather than
+        in a committed tree.
+        """
+
+        filename_priorities = {filename: index for index, filename in enumerate(configuration_filenames)}
+
+        # Directories are stored as posix strings relative to the repository root (the repository root
+        # itself is "").
+        configuration_filename_lookup: dict[str, str] = {}
+
+        for filename in filenames:
+            directory, _, name = filename.rpartition("/")
+
+            priority = filename_priorities.get(name)
+            if priority is None:
+                continue
+
+            existing = configuration_filename_lookup.get(directory)
+            if existing is not None and filename_priorities[existing.rpartition("/")[2]] < priority:
+                continue
+
+            configuration_filename_lookup[directory] = filename
+
+        self.repository_root = repository_root
+        self.uncommitted_filenames = uncommitted_filenames or []
+
+        self._configuration_filename_lookup = configuration_filename_lookup
+        self._owner_lookup: dict[str, Optional[str]] = {
+            directory: directory for directory in configuration_filename_lookup
+        }
+        self._root_lookup: dict[Optional[str], Path] = {}
+
+    # ----------------------------------------------------------------------
+    @property
+    def configuration_filenames(self) -> list[Path]:
+        """Returns all of the configuration files in the index."""
+
+        return [
+            self.repository_root / filename
+            for _, filename in sorted(self._configuration_filename_lookup.items())
+        ]
+
+    # ----------------------------------------------------------------------
+    def GetConfigurationFilename(
+        self,
+        filename: PurePath,
+    ) -> Optional[Path]:
+        """Returns the configuration file that owns the file (which is relative to the repository root)."""
+
+        directory = self._GetOwnerDirectory(filename.parent.as_posix())
+        if directory is None:
+            return None
+
+        return self.repository_root / self._configuration_filename_lookup[directory]
+
+    # ----------------------------------------------------------------------
+    def GetConfigurationRoot(
+        self,
+        filename: PurePath,
+    ) -> Path:
+        """Returns the root of the configuration that owns the file (which is relative to the repository root).
+
+        The repository root is returned when the file isn't owned by a configuration file.
+        """
+
+        return self.GetConfigurationRootFromString(filename.as_posix())
+
+    # ----------------------------------------------------------------------
+    def GetConfigurationRootFromString(
+        self,
+        filename: str,
+    ) -> Path:
+        """Returns the root of the configuration that owns the file, provided as a posix path relative to the repository root.
+
+        This is equivalent to `GetConfigurationRoot`, but doesn't require a `PurePath` object.
+        """
+
+        directory = self._GetOwnerDirectory(filename.rpartition("/")[0])
+
+        root = self._root_lookup.get(directory)
+        if root is None:
+            root = self.repository_root / PurePosixPath(directory or "")
+            self._root_lookup[directory] = root
+
+        return root
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetWorkingTreeConfigurationFilenames(
+        repository_root: Path,
+        configuration_filenames: list[str],
+    ) -> list[str]:
+        return [
+            os.fsdecode(token)
+            for token in GitEx.EnumNullDelimitedOutput(
+                repository_root,
+                [
+                    "ls-files",
+                    "-z",
+                    "--cached",
+                    "--others",
+                    "--exclude-standard",
+                    "--",
+                    *(":(glob)**/{}".format(filename) for filename in configuration_filenames),
+                ],
+            )
+        ]
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetTreeConfigurationFilenames(
+        repository_root: Path,
+        configuration_filenames: list[str],
+        tree: str,
+        store: Optional[JsonStore],
+    ) -> list[str]:
+        cache_key = json.dumps([tree, configuration_filenames])
+
+        with _tree_filenames_cache_lock:
+            filenames = _tree_filenames_cache.get(cache_key)
+
+        if filenames is not None:
+            Profiler.Increment("configuration_index_cache.hits")
+            return filenames
+
+        if store is not None:
+            filenames = store.Load(cache_key)
+
+            if not isinstance(filenames, list):
+                filenames = None
+
+        if filenames is None:
+            Profiler.Increment("configuration_index_cache.misses")
+
+            filenames = [
+                filename
+                for token in GitEx.EnumNullDelimitedOutput(
+                    repository_root,
+                    ["ls-tree", "-r", "-z", "--name-only", "--full-tree", tree],
+                )
+                for filename in [os.fsdecode(token)]
+                if filename.rpartition("/")[2] in configuration_filenames
+            ]
+
+            if store is not None:
+                store.Save(cache_key, filenames)
+        else:
+            Profiler.Increment("configuration_index_cache.hits")
+
+        assert filenames is not None
+
+        with _tree_filenames_cache_lock:
+            if cache_key not in _tree_filenames_cache and len(_tree_filenames_cache) >= _MAX_NUM_CACHED_TREES:
+                del _tree_filenames_cache[next(iter(_tree_filenames_cache))]
+
+            _tree_filenames_cache[cache_key] = filenames
+
+        return filenames
+
+    # ----------------------------------------------------------------------
+    def _GetOwnerDirectory(
+        self,
+        directory: str,
+    ) -> Optional[str]:
+        if directory == ".":
+            directory = ""
+
+        unresolved: list[str] = []
+
+        while directory not in self._owner_lookup:
+            unresolved.append(directory)
+
+            if not directory:
+                owner = None
+                break
+
+            directory = directory.rpartition("/")[0]
+        else:
+            owner = self._owner_lookup[directory]
+
+        for unresolved_directory in unresolved:
+            self._owner_lookup[unresolved_directory] = owner
+
+        return owner
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_MAX_NUM_CACHED_TREES = 32
+
+# Configuration filenames found in trees, keyed by tree hexsha and configuration filenames; trees are
+# immutable, so these values never need to be invalidated.
+_tree_filenames_cache: dict[str, list[str]] = {}
+_tree_filenames_cache_lock = threading.Lock()
@@ -11,13 +11,19 @@
 # |  Distributed under the MIT License.
 # |
 # ----------------------------------------------------------------------
-"""Automatically generates semantic versions based on changes in a git repository."""
+"""Automatically generates semantic versions based on changes in a git repository.
 
+Information about configurations and commits is cached in '<git dir>/autogitsemver' (even when only querying the version) so that subsequent invocations are faster; the directory can be deleted at any time.
+"""
+
+import contextlib
+import json
 import sys
 
+from enum import Enum
 from io import StringIO
 from pathlib import Path
-from typing import Annotated, Callable, Optional
+from typing import Annotated, Any, Callable, Optional
 
 import typer
 
@@ -26,21 +32,45 @@ from dbrownell_Common.Streams.DoneManager import DoneManager, Flags as DoneManag
 from dbrownell_Common.Streams.StreamDecorator import TextWriterT  # type: ignore [import-untyped]
 from typer.core import TyperGroup  # type: ignore [import-untyped]
 
-from AutoGitSemVer import (
+from AutoGitSemVer import GitEx, Profiler, Server
+from AutoGitSemVer.Lib import (
     GenerateStyle,
     GetSemanticVersion,
     GetSemanticVersionResult,
-    __version__,
+    GetSemanticVersions,
+    WatchSemanticVersion,
 )
 
 
+# ----------------------------------------------------------------------
+class OutputFormat(str, Enum):
+    """Specifies the way in which results are written."""
+
+    Text = "Text"
+    Json = "Json"
+
+
 # ----------------------------------------------------------------------
 class NaturalOrderGrouper(TyperGroup):
     # pylint: disable=missing-class-docstring
+
+    # Invoked when the command line doesn't begin with a command name, so that `autogitsemver [PATH]`
+    # continues to work now that there are multiple commands.
+    DEFAULT_COMMAND_NAME = "Generate"
+
     # ----------------------------------------------------------------------
     def list_commands(self, *args, **kwargs):  # pylint: disable=unused-argument
         return self.commands.keys()
 
+    # ----------------------------------------------------------------------
+    def parse_args(self, ctx, args):
+        # Invoke the default command unless a command was explicitly specified or help for the
+        # group was requested.
+        if args and args[0] not in self.commands and args[0] not in ctx.help_option_names:
+            args = [self.DEFAULT_COMMAND_NAME, *args]
+
+        return super().parse_args(ctx, args)
+
 
 # ----------------------------------------------------------------------
 app = typer.Typer(
@@ -104,6 +134,66 @@ def Generate(
             help="Do not include the build metadata section of the generated semantic version.",
         ),
     ] = False,
+    use_checkpoints: Annotated[
+        bool,
+        typer.Option(
+            "--use-checkpoints",
+            help="Save information in the repository's git directory so that subsequent invocations only need to enumerate changes made since this invocation.",
+        ),
+    ] = False,
+    use_pathspecs: Annotated[
+        bool,
+        typer.Option(
+            "--use-pathspecs",
+            help="Only enumerate commits that modify files impacting the configuration; this is faster for configurations within large repositories (especially after running 'UpdateCommitGraph').",
+        ),
+    ] = False,
+    no_server: Annotated[
+        bool,
+        typer.Option(
+            "--no-server",
+            help="Do not generate the semantic version with the server started by 'Serve', even if it is running.",
+        ),
+    ] = False,
+    watch: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            help="Generate a new semantic version whenever it changes as HEAD moves, tags change, or the working tree becomes dirty or clean (until Ctrl+C is pressed); only the commits added since the previous semantic version are enumerated and errors don't stop the watch.",
+        ),
+    ] = False,
+    watch_interval: Annotated[
+        float,
+        typer.Option(
+            "--watch-interval",
+            min=0.0,
+            help="Number of seconds between checks for changes when '--watch' is provided.",
+        ),
+    ] = 1.0,
+    output: Annotated[
+        OutputFormat,
+        typer.Option(
+            "--output",
+            case_sensitive=False,
+            help="Specifies the way in which results are written; 'Json' writes the semantic version along with information about how it was calculated (base tag, applied deltas, timing, etc.) and no other information. The semantic version is generated in this process rather than with the server.",
+        ),
+    ] = OutputFormat.Text,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Display the time spent in each phase along with git and cache statistics (written to stderr when '--quiet' is provided); the semantic version is generated in this process rather than with the server.",
+        ),
+    ] = False,
+    profile_json: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--profile-json",
+            dir_okay=False,
+            resolve_path=True,
+            help="Write the time spent in each phase along with git and cache statistics to this JSON file; the semantic version is generated in this process rather than with the server.",
+        ),
+    ] = None,
     verbose: Annotated[
         bool,
         typer.Option(
@@ -134,13 +224,82 @@ def Generate(
     ] = False,
 ) -> None:
     if version:
+        from AutoGitSemVer import __version__  # pylint: disable=import-outside-toplevel
+
         sys.stdout.write("autogitsemver v{}\n".format(__version__))
         sys.exit(0)
 
+    if watch:
+        sink = StringIO()
+
+        with (
+            DoneManager.CreateCommandLine(
+                sink if quiet else sys.stdout,
+                flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
+            ) as dm,
+            ExitStack(lambda: sys.stdout.write(sink.getvalue()) if dm.result != 0 else None),
+        ):
+            try:
+                for result in WatchSemanticVersion(
+                    dm,
+                    path,
+                    interval=watch_interval,
+                    prerelease_name=prerelease_name,
+                    include_branch_name_when_necessary=not no_branch_name,
+                    no_prefix=no_prefix,
+                    no_metadata=no_metadata,
+                    style=style,
+                    use_pathspecs=use_pathspecs,
+                ):
+                    if quiet:
+                        sys.stdout.write("{}\n".format(result.semantic_version_string))
+                        sys.stdout.flush()
+
+                        # The output is only displayed when errors are encountered, so don't retain
+                        # output for versions that were generated successfully (unless errors were
+                        # encountered while generating previous versions).
+                        if dm.result == 0:
+                            sink.seek(0)
+                            sink.truncate()
+
+            except KeyboardInterrupt:
+                pass
+
+        return
+
+    # Profiles and traces describe the work performed in this process, so the server isn't used when
+    # profiling or when writing JSON.
+    profile_data: Optional[Profiler.Profile] = (
+        Profiler.Profile() if profile or profile_json is not None or output == OutputFormat.Json else None
+    )
+
     output_stream: Optional[TextWriterT] = None
     postprocess_func: Optional[Callable[[DoneManager, Optional[GetSemanticVersionResult]], None]] = None
 
-    if quiet:
+    if output == OutputFormat.Json:
+        sink = StringIO()
+
+        output_stream = sink
+
+        # ----------------------------------------------------------------------
+        def PostprocessJsonData(
+            dm: DoneManager,
+            result: Optional[GetSemanticVersionResult],
+        ) -> None:
+            if dm.result != 0:
+                sys.stdout.write(sink.getvalue())
+            else:
+                assert result is not None
+                assert profile_data is not None
+
+                json.dump(_CreateJsonResult(result, profile_data), sys.stdout, indent=2)
+                sys.stdout.write("\n")
+
+        # ----------------------------------------------------------------------
+
+        postprocess_func = PostprocessJsonData
+
+    elif quiet:
         sink = StringIO()
 
         output_stream = sink
@@ -181,7 +340,195 @@ def Generate(
         result: Optional[GetSemanticVersionResult] = None
 
         with ExitStack(lambda: postprocess_func(dm, result)):
-            result = GetSemanticVersion(
+            response: Optional[Server.GenerateResponse] = None
+
+            if not no_server and profile_data is None:
+                response = Server.Generate(
+                    path,
+                    prerelease_name=prerelease_name,
+                    include_branch_name_when_necessary=not no_branch_name,
+                    no_prefix=no_prefix,
+                    no_metadata=no_metadata,
+                    style=style,
+                    use_checkpoints=use_checkpoints,
+                    use_pathspecs=use_pathspecs,
+                    verbose=verbose,
+                    debug=debug,
+                )
+
+            if response is not None:
+                dm.WriteLine(response.output.rstrip())
+
+                dm.result = response.result
+                result = response.semantic_version_result
+
+            else:
+                with profile_data or contextlib.nullcontext():
+                    result = GetSemanticVersion(
+                        dm,
+                        path,
+                        prerelease_name=prerelease_name,
+                        include_branch_name_when_necessary=not no_branch_name,
+                        no_prefix=no_prefix,
+                        no_metadata=no_metadata,
+                        style=style,
+                        use_checkpoints=use_checkpoints,
+                        use_pathspecs=use_pathspecs,
+                    )
+
+                if profile_data is not None:
+                    if profile:
+                        if quiet or output == OutputFormat.Json:
+                            sys.stderr.write("{}\n".format(profile_data.ToTable()))
+                        else:
+                            dm.WriteLine("\n{}\n".format(profile_data.ToTable()))
+
+                    if profile_json is not None:
+                        with profile_json.open("w") as f:
+                            json.dump(profile_data.ToJson(), f, indent=2)
+
+
+# ----------------------------------------------------------------------
+@app.command(
+    "GenerateAll",
+    help="Generates semantic versions for every AutoGitSemVer configuration file in a git repository, enumerating the repository's history once.",
+    no_args_is_help=False,
+)
+def GenerateAll(
+    path: Annotated[
+        Path,
+        typer.Argument(
+            file_okay=False,
+            exists=True,
+            resolve_path=True,
+            help="Root of the git repository.",
+        ),
+    ] = Path.cwd(),
+    style: Annotated[
+        GenerateStyle,
+        typer.Option(
+            "--style",
+            case_sensitive=False,
+            help="Specifies the way in which the semantic versions are generated; this is useful when targets using the generated semantic versions do not fully support the semantic version specification.",
+        ),
+    ] = GenerateStyle.Standard,
+    prerelease_name: Annotated[
+        Optional[str],
+        typer.Option(
+            "--prerelease-name",
+            help="Create semantic version strings with this prerelease name.",
+        ),
+    ] = None,
+    no_prefix: Annotated[
+        bool,
+        typer.Option(
+            "--no-prefix",
+            help="Do not include the prefix in the generated semantic versions.",
+        ),
+    ] = False,
+    no_branch_name: Annotated[
+        bool,
+        typer.Option(
+            "--no-branch-name",
+            help="Do not include the branch name in the prerelease section of the generated semantic versions.",
+        ),
+    ] = False,
+    no_metadata: Annotated[
+        bool,
+        typer.Option(
+            "--no-metadata",
+            help="Do not include the build metadata section of the generated semantic versions.",
+        ),
+    ] = False,
+    output: Annotated[
+        OutputFormat,
+        typer.Option(
+            "--output",
+            case_sensitive=False,
+            help="Specifies the way in which results are written; 'Json' writes a list of results and no other information.",
+        ),
+    ] = OutputFormat.Text,
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            help="Write verbose information to the terminal.",
+        ),
+    ] = False,
+    debug: Annotated[
+        bool,
+        typer.Option(
+            "--debug",
+            help="Write debug information to the terminal.",
+        ),
+    ] = False,
+) -> None:
+    output_stream: Optional[TextWriterT] = None
+    postprocess_func: Optional[Callable[[DoneManager, Optional[list[GetSemanticVersionResult]]], None]] = None
+
+    if output == OutputFormat.Json:
+        sink = StringIO()
+
+        output_stream = sink
+
+        # ----------------------------------------------------------------------
+        def PostprocessJsonData(
+            dm: DoneManager,
+            results: Optional[list[GetSemanticVersionResult]],
+        ) -> None:
+            if dm.result != 0:
+                sys.stdout.write(sink.getvalue())
+            else:
+                assert results is not None
+
+                json.dump(
+                    [
+                        {
+                            "configuration_filename": (
+                                None
+                                if result.configuration_filename is None
+                                else str(result.configuration_filename)
+                            ),
+                            "semantic_version": str(result.semantic_version),
+                            "semantic_version_string": result.semantic_version_string,
+                        }
+                        for result in results
+                    ],
+                    sys.stdout,
+                    indent=2,
+                )
+
+                sys.stdout.write("\n")
+
+        # ----------------------------------------------------------------------
+
+        postprocess_func = PostprocessJsonData
+
+    elif output == OutputFormat.Text:
+        output_stream = sys.stdout
+
+        # ----------------------------------------------------------------------
+        def PostprocessNone(*args, **kwargs):
+            return None
+
+        # ----------------------------------------------------------------------
+
+        postprocess_func = PostprocessNone
+
+    else:
+        assert False, output  # pragma: no cover
+
+    assert output_stream is not None
+    assert postprocess_func is not None
+
+    with DoneManager.CreateCommandLine(
+        output_stream,
+        flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
+    ) as dm:
+        results: Optional[list[GetSemanticVersionResult]] = None
+
+        with ExitStack(lambda: postprocess_func(dm, results)):
+            results = GetSemanticVersions(
                 dm,
                 path,
                 prerelease_name=prerelease_name,
@@ -192,6 +539,138 @@ def Generate(
             )
 
 
+# ----------------------------------------------------------------------
+@app.command(
+    "UpdateCommitGraph",
+    help="Writes (or refreshes) the git commit-graph with changed-path Bloom filters, which makes '--use-pathspecs' significantly faster.",
+    no_args_is_help=False,
+)
+def UpdateCommitGraph(
+    path: Annotated[
+        Path,
+        typer.Argument(
+            file_okay=False,
+            exists=True,
+            resolve_path=True,
+            help="Path within the git repository.",
+        ),
+    ] = Path.cwd(),
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            help="Write verbose information to the terminal.",
+        ),
+    ] = False,
+    debug: Annotated[
+        bool,
+        typer.Option(
+            "--debug",
+            help="Write debug information to the terminal.",
+        ),
+    ] = False,
+) -> None:
+    with (
+        DoneManager.CreateCommandLine(
+            sys.stdout,
+            flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
+        ) as dm,
+        dm.Nested("Writing the commit-graph..."),
+    ):
+        GitEx.WriteCommitGraph(path)
+
+
+# ----------------------------------------------------------------------
+@app.command(
+    "Serve",
+    help="Runs a server that generates semantic versions for 'Generate' (which uses the server automatically when it is running); this avoids startup costs and keeps caches warm across invocations.",
+    no_args_is_help=False,
+)
+def Serve(
+    socket_filename: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--socket",
+            dir_okay=False,
+            resolve_path=True,
+            help="Unix domain socket used to communicate with the server; the default is provided by the environment variable '{}' or a file in the temporary directory.".format(
+                Server.SOCKET_ENVIRONMENT_VARIABLE_NAME
+            ),
+        ),
+    ] = None,
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            help="Write verbose information to the terminal.",
+        ),
+    ] = False,
+    debug: Annotated[
+        bool,
+        typer.Option(
+            "--debug",
+            help="Write debug information to the terminal.",
+        ),
+    ] = False,
+) -> None:
+    with (
+        DoneManager.CreateCommandLine(
+            sys.stdout,
+            flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
+        ) as dm,
+        Server.Server(socket_filename) as server,
+    ):
+        dm.WriteLine("Listening at '{}' (press Ctrl+C to exit)...".format(server.socket_filename))
+
+        try:
+            server.ServeForever()
+        except KeyboardInterrupt:
+            pass
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _CreateJsonResult(
+    result: GetSemanticVersionResult,
+    profile_data: Profiler.Profile,
+) -> dict[str, Any]:
+    """Returns the result (and information about how it was calculated) in a form that can be serialized as JSON."""
+
+    assert result.trace is not None
+
+    return {
+        "configuration_filename": (
+            None if result.configuration_filename is None else str(result.configuration_filename)
+        ),
+        "semantic_version": str(result.semantic_version),
+        "semantic_version_string": result.semantic_version_string,
+        "components": {
+            "major": result.semantic_version.major,
+            "minor": result.semantic_version.minor,
+            "patch": result.semantic_version.patch,
+            "prerelease": list(result.semantic_version.prerelease),
+            "build": list(result.semantic_version.build),
+        },
+        "base_version": str(result.trace.base_version),
+        "base_tag": result.trace.base_tag,
+        "base_commit": result.trace.base_commit,
+        "num_commits_scanned": result.trace.num_commits_scanned,
+        "num_commits_applied": result.trace.num_commits_applied,
+        "num_commits_reused_from_checkpoint": result.trace.num_commits_reused_from_checkpoint,
+        "version_deltas": [
+            {
+                "commit": commit,
+                "delta": str(version_delta),
+            }
+            for commit, version_delta in result.trace.version_deltas
+        ],
+        "timing": profile_data.ToJson(),
+    }
+
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
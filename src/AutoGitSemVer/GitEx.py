@@ -0,0 +1,721 @@
+# ----------------------------------------------------------------------
+# |
+# |  GitEx.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 09:12:44
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains functionality that streams output from long-running git processes."""
+
+import contextvars
+import hashlib
+import os
+import subprocess
+import threading
+import weakref
+
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Generator, Optional, TYPE_CHECKING
+
+from AutoGitSemVer import Profiler
+
+if TYPE_CHECKING:
+    from typing_extensions import Self  # pragma: no cover
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Types
+# |
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class LogRecord:
+    """A single commit parsed from the output of `git log`."""
+
+    hexsha: str
+    author: str
+    author_date: datetime
+    message: str
+
+    filenames: list[str]
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class Status:
+    """A snapshot of the working tree's status."""
+
+    head: Optional[str]  # None if there aren't any commits
+    branch_name: Optional[str]  # None if HEAD is detached
+
+    is_dirty: bool  # True if there are staged or unstaged changes to tracked files
+    staged_filenames: list[str]  # Files with changes staged in the index (relative to the root)
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class TagRecord:
+    """A tag that (directly or via an annotated tag) refers to a commit."""
+
+    name: str
+    hexsha: str  # The commit's hexsha
+
+
+# ----------------------------------------------------------------------
+class CancellationScope:
+    """Terminates the git processes spawned within the scope when the scope is cancelled.
+
+    The scope applies to the current context, which includes work started with `asyncio.to_thread`. Once
+    cancelled, running processes are killed (so readers of their output fail promptly) and attempts to
+    spawn new processes raise an exception.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        self._processes: weakref.WeakSet[subprocess.Popen] = weakref.WeakSet()
+        self._is_cancelled = False
+        self._lock = threading.Lock()
+
+        self._token: Optional[contextvars.Token] = None
+
+    # ----------------------------------------------------------------------
+    def __enter__(self) -> "Self":
+        assert self._token is None
+        self._token = _cancellation_scope.set(self)
+
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args, **kwargs) -> None:
+        assert self._token is not None
+
+        _cancellation_scope.reset(self._token)
+        self._token = None
+
+    # ----------------------------------------------------------------------
+    @property
+    def is_cancelled(self) -> bool:
+        """True if the scope has been cancelled."""
+
+        return self._is_cancelled
+
+    # ----------------------------------------------------------------------
+    def Cancel(self) -> None:
+        """Cancels the scope, killing any running processes spawned within it."""
+
+        with self._lock:
+            self._is_cancelled = True
+            processes = list(self._processes)
+
+        for process in processes:
+            _Kill(process)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _Register(
+        self,
+        process: subprocess.Popen,
+    ) -> None:
+        with self._lock:
+            if not self._is_cancelled:
+                self._processes.add(process)
+                return
+
+        # The scope was cancelled while the process was being spawned
+        _Kill(process)
+
+
+# ----------------------------------------------------------------------
+class ObjectReader:
+    """Reads individual objects with long-lived `git cat-file` processes.
+
+    The processes are started on demand and are reused for all subsequent reads, so reading many objects
+    doesn't require a process per object. `Close` (or exiting the context) shuts the processes down.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        working_dir: Path,
+    ):
+        self.working_dir = working_dir
+
+        self._batch_process: Optional[subprocess.Popen] = None
+        self._batch_check_process: Optional[subprocess.Popen] = None
+
+    # ----------------------------------------------------------------------
+    def __enter__(self) -> "Self":
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args) -> None:
+        self.Close()
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        """Shuts down the processes (if any)."""
+
+        for process in [self._batch_process, self._batch_check_process]:
+            if process is None:
+                continue
+
+            assert process.stdin is not None
+            assert process.stdout is not None
+
+            try:
+                # cat-file exits once its input is closed
+                process.stdin.close()
+                process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+                process.wait()
+
+            process.stdout.close()
+
+        self._batch_process = None
+        self._batch_check_process = None
+
+    # ----------------------------------------------------------------------
+    def GetInfo(
+        self,
+        revision: str,
+    ) -> Optional[tuple[str, str, int]]:
+        """Returns the hexsha, type, and size of the object that the revision refers to (if any)."""
+
+        if self._batch_check_process is None:
+            self._batch_check_process = self._Start("--batch-check")
+
+        return self._Request(self._batch_check_process, revision)
+
+    # ----------------------------------------------------------------------
+    def Read(
+        self,
+        revision: str,
+    ) -> Optional[tuple[str, str, bytes]]:
+        """Returns the hexsha, type, and content of the object that the revision refers to (if any)."""
+
+        if self._batch_process is None:
+            self._batch_process = self._Start("--batch")
+
+        info = self._Request(self._batch_process, revision)
+        if info is None:
+            return None
+
+        hexsha, object_type, size = info
+
+        assert self._batch_process.stdout is not None
+
+        content = self._batch_process.stdout.read(size)
+        self._batch_process.stdout.read(1)  # Newline
+
+        Profiler.Increment("git.bytes_read", size + 1)
+
+        return hexsha, object_type, content
+
+    # ----------------------------------------------------------------------
+    def GetParents(
+        self,
+        revision: str,
+    ) -> list[str]:
+        """Returns the parents of the commit that the revision refers to."""
+
+        result = self.Read(revision)
+        if result is None or result[1] != "commit":
+            raise Exception("'{}' is not a valid commit.".format(revision))
+
+        parents: list[str] = []
+
+        # The parents are in the commit's headers, which are terminated by an empty line
+        for line in result[2].split(b"\n"):
+            if not line:
+                break
+
+            if line.startswith(b"parent "):
+                parents.append(line[len(b"parent ") :].decode("ascii"))
+
+        return parents
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _Start(
+        self,
+        mode: str,
+    ) -> subprocess.Popen:
+        return _Popen(
+            self.working_dir,
+            ["cat-file", mode],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Request(
+        process: subprocess.Popen,
+        revision: str,
+    ) -> Optional[tuple[str, str, int]]:
+        assert "\n" not in revision, revision
+        assert process.stdin is not None
+        assert process.stdout is not None
+
+        process.stdin.write(revision.encode("utf-8") + b"\n")
+        process.stdin.flush()
+
+        line = process.stdout.readline()
+        if not line:
+            raise Exception("'git cat-file' terminated unexpectedly.")
+
+        Profiler.Increment("git.bytes_read", len(line))
+
+        # Errors are written as "<revision> missing" or "<revision> ambiguous"
+        parts = line.split()
+        if len(parts) != 3:
+            return None
+
+        return parts[0].decode("ascii"), parts[1].decode("ascii"), int(parts[2])
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+
+
+# ----------------------------------------------------------------------
+def ContainsMerges(
+    working_dir: Path,
+    revisions: list[str],
+) -> bool:
+    """Returns True if any of the commits specified by the revisions (for example, ["HEAD", "^v1.0.0"]) are merge commits."""
+
+    result = _Run(working_dir, ["rev-list", "--merges", "--max-count=1", *revisions, "--"])
+
+    if result.returncode != 0:
+        raise Exception(
+            "'git rev-list' failed: {}".format(result.stderr.decode("utf-8", errors="replace").strip()),
+        )
+
+    return bool(result.stdout.strip())
+
+
+# ----------------------------------------------------------------------
+def EnumNullDelimitedOutput(
+    working_dir: Path,
+    args: list[str],
+    *,
+    input: Optional[bytes] = None,  # pylint: disable=redefined-builtin
+    chunk_size: int = 64 * 1024,
+) -> Generator[bytes, None, None]:
+    """Runs a git command and incrementally yields the NUL-delimited tokens that it writes to stdout.
+
+    The git process is terminated if the caller stops iterating before all of the output has been
+    consumed. When provided, `input` is written to stdin; it must be a command that reads all of
+    its input before writing any output (for example, `git log --stdin`).
+    """
+
+    with _Popen(
+        working_dir,
+        args,
+        stdin=subprocess.DEVNULL if input is None else subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    ) as process:
+        assert process.stdout is not None
+        assert process.stderr is not None
+
+        is_complete = False
+
+        try:
+            if input is not None:
+                assert process.stdin is not None
+
+                process.stdin.write(input)
+                process.stdin.close()
+
+            remainder = b""
+
+            while True:
+                chunk = process.stdout.read1(chunk_size)
+                if not chunk:
+                    break
+
+                Profiler.Increment("git.bytes_read", len(chunk))
+
+                tokens = (remainder + chunk).split(b"\0")
+                remainder = tokens.pop()
+
+                yield from tokens
+
+            if remainder:
+                yield remainder
+
+            is_complete = True
+
+        finally:
+            if not is_complete:
+                process.kill()
+
+        stderr = process.stderr.read()
+
+        if process.wait() != 0:
+            raise Exception(
+                "'git {}' failed: {}".format(
+                    " ".join(args),
+                    stderr.decode("utf-8", errors="replace").strip(),
+                ),
+            )
+
+
+# ----------------------------------------------------------------------
+def EnumLogRecords(
+    working_dir: Path,
+    args: list[str],
+    *,
+    input: Optional[bytes] = None,  # pylint: disable=redefined-builtin
+    pathspecs: Optional[list[str]] = None,
+) -> Generator[LogRecord, None, None]:
+    """Enumerates commits and the files that they modify from a single `git log` process.
+
+    `args` contains the revisions to walk (and any options that control the walk). Filenames are
+    extracted in bulk rather than running a diff for every commit; the command line options match the
+    semantics of GitPython's `Commit.stats` (the root commit is diffed against the empty tree and
+    renames are reported as a deletion and an addition).
+
+    When provided, `pathspecs` limit the commits enumerated to those that modify matching files; the
+    records still contain all of the files modified by those commits.
+    """
+
+    tokens = EnumNullDelimitedOutput(
+        working_dir,
+        [
+            "log",
+            "--no-show-signature",
+            "--no-renames",
+            "--no-relative",
+            "--root",
+            "--name-only",
+            "-z",
+            "--format={}".format(_LOG_FORMAT),
+            *(["--full-diff"] if pathspecs else []),
+            *args,
+            "--",
+            *(pathspecs or []),
+        ],
+        input=input,
+    )
+
+    try:
+        record: Optional[LogRecord] = None
+
+        for token in tokens:
+            if not token:
+                if record is not None:
+                    yield record
+
+                record = LogRecord(
+                    next(tokens).decode("ascii"),
+                    next(tokens).decode("utf-8", errors="replace"),
+                    datetime.fromisoformat(next(tokens).decode("ascii")),
+                    next(tokens).decode("utf-8", errors="replace"),
+                    [],
+                )
+
+                continue
+
+            assert record is not None
+
+            # The first filename is separated from the commit's message by a newline
+            if not record.filenames:
+                assert token.startswith(b"\n"), token
+                token = token[1:]
+
+            record.filenames.append(os.fsdecode(token))
+
+        if record is not None:
+            yield record
+
+    finally:
+        tokens.close()
+
+
+# ----------------------------------------------------------------------
+def EnumTagRecords(
+    working_dir: Path,
+    patterns: Optional[list[str]] = None,
+) -> Generator[TagRecord, None, None]:
+    """Enumerates tags (sorted by name) from a single `git for-each-ref` process.
+
+    Annotated tags are peeled to the commit that they refer to without reading any objects. `patterns`
+    are globs (relative to 'refs/tags/') that limit the tags enumerated; tags that refer to objects
+    other than commits are skipped.
+    """
+
+    tokens = EnumNullDelimitedOutput(
+        working_dir,
+        [
+            "for-each-ref",
+            "--format=%(refname)%00%(objecttype)%00%(objectname)%00%(*objecttype)%00%(*objectname)%00",
+            *(["refs/tags/{}".format(pattern) for pattern in patterns] if patterns else ["refs/tags"]),
+        ],
+    )
+
+    try:
+        for token in tokens:
+            # Records are separated by a newline
+            refname = os.fsdecode(token.lstrip(b"\n"))
+            if not refname:
+                continue
+
+            object_type = next(tokens)
+            hexsha = next(tokens)
+            peeled_object_type = next(tokens)
+            peeled_hexsha = next(tokens)
+
+            if object_type == b"tag":
+                object_type = peeled_object_type
+                hexsha = peeled_hexsha
+
+            if object_type != b"commit":
+                continue
+
+            yield TagRecord(refname.removeprefix("refs/tags/"), hexsha.decode("ascii"))
+
+    finally:
+        tokens.close()
+
+
+# ----------------------------------------------------------------------
+def GetNumSpawnedProcesses() -> int:
+    """Returns the number of git processes spawned by this module (which is useful when testing)."""
+
+    return _num_spawned_processes
+
+
+# ----------------------------------------------------------------------
+def GetRefsFingerprint(
+    working_dir: Path,
+    pattern: str,
+) -> str:
+    """Returns a value that changes when any of the refs matching the pattern are added, removed, or moved."""
+
+    return hashlib.sha256(
+        b"\0".join(
+            EnumNullDelimitedOutput(
+                working_dir,
+                ["for-each-ref", "--format=%(refname)%00%(objectname)", pattern],
+            ),
+        ),
+    ).hexdigest()
+
+
+# ----------------------------------------------------------------------
+def GetStatus(
+    working_dir: Path,
+) -> Status:
+    """Returns a snapshot of the working tree's status, parsed from a single `git status` process.
+
+    Untracked files are not considered, so git doesn't need to scan for them. git uses the file system
+    monitor (core.fsmonitor) and untracked cache (core.untrackedCache) when they are configured.
+    """
+
+    head: Optional[str] = None
+    branch_name: Optional[str] = None
+    is_dirty = False
+    staged_filenames: list[str] = []
+
+    tokens = EnumNullDelimitedOutput(
+        working_dir,
+        [
+            "--no-optional-locks",
+            "status",
+            "--porcelain=v2",
+            "-z",
+            "--branch",
+            "--untracked-files=no",
+            "--no-renames",
+        ],
+    )
+
+    try:
+        for token in tokens:
+            if token.startswith(b"# "):
+                header, _, value = token[2:].decode("utf-8", errors="surrogateescape").partition(" ")
+
+                if header == "branch.oid":
+                    head = None if value == "(initial)" else value
+                elif header == "branch.head":
+                    branch_name = None if value == "(detached)" else value
+
+                continue
+
+            entry_type = token[:1]
+
+            if entry_type == b"1":
+                # 1 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <path>
+                fields = token.split(b" ", 8)
+            elif entry_type == b"2":
+                # 2 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <X><score> <path>, followed by the original path
+                # (this isn't generated with --no-renames, but is handled for completeness)
+                fields = token.split(b" ", 9)
+                next(tokens)
+            elif entry_type == b"u":
+                # u <XY> <sub> <m1> <m2> <m3> <mW> <h1> <h2> <h3> <path>
+                fields = token.split(b" ", 10)
+            else:
+                assert False, token  # pragma: no cover
+
+            is_dirty = True
+
+            if fields[1][:1] != b".":
+                staged_filenames.append(os.fsdecode(fields[-1]))
+
+    finally:
+        tokens.close()
+
+    return Status(head, branch_name, is_dirty, staged_filenames)
+
+
+# ----------------------------------------------------------------------
+def IsAncestor(
+    working_dir: Path,
+    ancestor: str,
+    descendant: str,
+) -> bool:
+    """Returns True if `ancestor` is an ancestor of (or the same commit as) `descendant`."""
+
+    result = _Run(working_dir, ["merge-base", "--is-ancestor", ancestor, descendant])
+
+    # Note that any errors (for example, a commit that no longer exists) are treated as `False`
+    return result.returncode == 0
+
+
+# ----------------------------------------------------------------------
+def ResolveObject(
+    working_dir: Path,
+    revision: str,
+) -> Optional[str]:
+    """Returns the hexsha of the object that the revision (for example, "HEAD^{tree}") refers to (if any)."""
+
+    result = _Run(working_dir, ["rev-parse", "--verify", "--quiet", revision])
+
+    if result.returncode != 0:
+        return None
+
+    return result.stdout.decode("ascii").strip()
+
+
+# ----------------------------------------------------------------------
+def WriteCommitGraph(
+    working_dir: Path,
+) -> None:
+    """Writes (or refreshes) the repository's commit-graph, including changed-path Bloom filters.
+
+    Bloom filters allow git to quickly skip commits that don't modify the files matched by a pathspec.
+    """
+
+    result = _Run(working_dir, ["commit-graph", "write", "--reachable", "--changed-paths"])
+
+    if result.returncode != 0:
+        raise Exception(
+            "'git commit-graph write' failed: {}".format(
+                result.stderr.decode("utf-8", errors="replace").strip(),
+            ),
+        )
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+# The log output is a single, continuous stream of NUL-delimited tokens. Each record begins with an
+# empty token (which can never be a filename) and is followed by the record's fields and then the
+# names of the files modified by the commit (if any).
+_LOG_FORMAT = "%x00%H%x00%an%x00%aI%x00%B"
+
+_num_spawned_processes = 0
+_num_spawned_processes_lock = threading.Lock()
+
+_cancellation_scope: contextvars.ContextVar[Optional[CancellationScope]] = contextvars.ContextVar(
+    "cancellation_scope",
+    default=None,
+)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _Kill(
+    process: subprocess.Popen,
+) -> None:
+    if process.poll() is not None:
+        return
+
+    try:
+        process.kill()
+    except OSError:  # pragma: no cover
+        # The process exited after it was polled
+        pass
+
+
+# ----------------------------------------------------------------------
+def _Popen(
+    working_dir: Path,
+    args: list[str],
+    **kwargs: Any,
+) -> subprocess.Popen:
+    global _num_spawned_processes  # pylint: disable=global-statement
+
+    cancellation_scope = _cancellation_scope.get()
+
+    if cancellation_scope is not None and cancellation_scope.is_cancelled:
+        raise Exception("The operation was cancelled.")
+
+    with _num_spawned_processes_lock:
+        _num_spawned_processes += 1
+
+    Profiler.Increment("git.processes")
+
+    process = subprocess.Popen(["git", *args], cwd=working_dir, **kwargs)
+
+    if cancellation_scope is not None:
+        cancellation_scope._Register(process)  # pylint: disable=protected-access
+
+    return process
+
+
+# ----------------------------------------------------------------------
+def _Run(
+    working_dir: Path,
+    args: list[str],
+) -> subprocess.CompletedProcess:
+    with _Popen(
+        working_dir,
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    ) as process:
+        stdout, stderr = process.communicate()
+
+    Profiler.Increment("git.bytes_read", len(stdout))
+
+    return subprocess.CompletedProcess(process.args, process.returncode, stdout, stderr)
@@ -0,0 +1,182 @@
+# ----------------------------------------------------------------------
+# |
+# |  JsonStore.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 13:21:09
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains a small, persistent key/value store of JSON content stored in the repository's git directory.
+
+Like the commit cache, the store is strictly an optimization; content that is missing, corrupted, or
+was written by a different version is ignored and problems encountered while writing are suppressed.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+
+from pathlib import Path
+from typing import Any, ClassVar, Optional
+
+from AutoGitSemVer.CommitCache import CommitCache
+
+
+# ----------------------------------------------------------------------
+class JsonStore:
+    """Key/value store where each value is saved as a JSON file in '<git dir>/autogitsemver/<name>'."""
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Data
+    # |
+    # ----------------------------------------------------------------------
+    DIRECTORY_NAME: ClassVar[str] = CommitCache.DIRECTORY_NAME
+
+    DEFAULT_MAX_NUM_ITEMS: ClassVar[int] = 256
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Open(
+        cls,
+        git_dir: Path,
+        name: str,
+        version: int,
+        *,
+        max_num_items: int = DEFAULT_MAX_NUM_ITEMS,
+    ) -> Optional["JsonStore"]:
+        """Opens (or creates) the store; returns None if the store is not available."""
+
+        directory = git_dir / cls.DIRECTORY_NAME / name
+
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return None
+
+        return cls(directory, version, max_num_items)
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        directory: Path,
+        version: int,
+        max_num_items: int,
+    ):
+        self.directory = directory
+        self.version = version
+        self.max_num_items = max_num_items
+
+    # ----------------------------------------------------------------------
+    def Load(
+        self,
+        key: str,
+    ) -> Optional[Any]:
+        """Returns the content associated with the key (if any)."""
+
+        filename = self._GetFilename(key)
+
+        try:
+            with filename.open(encoding="utf-8") as f:
+                data = json.load(f)
+
+            if (
+                not isinstance(data, dict)
+                or data.get("version") != self.version
+                or data.get("key") != key
+                or data.get("checksum") != _CalculateChecksum(data.get("content"))
+            ):
+                return None
+
+            # Update the modified time so that this item isn't evicted
+            os.utime(filename)
+
+        except (OSError, ValueError):
+            return None
+
+        return data["content"]
+
+    # ----------------------------------------------------------------------
+    def Save(
+        self,
+        key: str,
+        content: Any,
+    ) -> None:
+        """Associates the content with the key, evicting the least recently used items if necessary."""
+
+        temp_filename: Optional[Path] = None
+
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.directory,
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                temp_filename = Path(f.name)
+
+                json.dump(
+                    {
+                        "version": self.version,
+                        "key": key,
+                        "checksum": _CalculateChecksum(content),
+                        "content": content,
+                    },
+                    f,
+                )
+
+            # Replacing the file is atomic, so concurrent readers will never see partially written content
+            os.replace(temp_filename, self._GetFilename(key))
+            temp_filename = None
+
+            filenames = sorted(
+                self.directory.glob("*.json"),
+                key=lambda filename: filename.stat().st_mtime_ns,
+            )
+
+            for filename in filenames[: max(0, len(filenames) - self.max_num_items)]:
+                filename.unlink()
+
+        except OSError:
+            pass
+
+        finally:
+            # Don't leave the temporary file behind if it couldn't be written or replaced
+            if temp_filename is not None:
+                with contextlib.suppress(OSError):
+                    temp_filename.unlink()
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _GetFilename(
+        self,
+        key: str,
+    ) -> Path:
+        return self.directory / "{}.json".format(hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _CalculateChecksum(
+    content: Any,
+) -> int:
+    return zlib.crc32(json.dumps(content, sort_keys=True).encode("utf-8"))
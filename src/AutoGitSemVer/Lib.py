@@ -13,27 +13,45 @@
 # ----------------------------------------------------------------------
 """Contains functionality used to generate a semantic version based on recent changes in an active git repository."""
 
+import bisect
+import contextlib
+import copy
+import functools
+import hashlib
 import itertools
 import json
 import os
 import platform
 import re
+import threading
+import time
+import types
 
-from dataclasses import dataclass, field
+from collections import deque, OrderedDict
+from concurrent.futures import Executor, Future
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
 from enum import Enum
+from io import StringIO
 from pathlib import Path, PurePath
-from typing import Any, Callable, cast, ClassVar, Generator, Optional
+from typing import Any, Callable, cast, ClassVar, Generator, Mapping, Optional, Sequence, TYPE_CHECKING
 
-import git
-import rtyaml  # type: ignore [import-untyped]
-
-from dbrownell_Common.InflectEx import inflect
 from dbrownell_Common import PathEx
-from dbrownell_Common.Streams.DoneManager import DoneManager
-from jsonschema import Draft202012Validator, validators  # type: ignore [import-untyped]
+from dbrownell_Common.Streams.DoneManager import DISPLAYED_EXCEPTION_ATTRIBUTE_NAME, DoneManager
 from semantic_version import Version as SemVer  # type: ignore [import-untyped]
 
+from AutoGitSemVer import GitEx, Profiler
+from AutoGitSemVer.CommitCache import CommitCache
+from AutoGitSemVer.ConfigurationIndex import ConfigurationIndex
+from AutoGitSemVer.JsonStore import JsonStore
+from AutoGitSemVer.PathTable import PathList, PathTable
+
+# `asyncio`, `git`, `jsonschema`, and `rtyaml` are expensive to import and are only needed by some code
+# paths, so they are imported by the functions that use them; this keeps the command line tool's startup
+# time low.
+if TYPE_CHECKING:
+    import git  # pragma: no cover
+
 
 # ----------------------------------------------------------------------
 # |
@@ -89,11 +107,18 @@ class GetSemanticVersionResult:
     semantic_version: SemVer
     semantic_version_string: str
 
+    # Information about how the semantic version was calculated (populated by `GetSemanticVersion`)
+    trace: Optional["GetSemanticVersionTrace"] = field(default=None, kw_only=True, compare=False)
+
 
 # ----------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommitInfo:
-    """Information about a commit."""
+    """Information about a commit.
+
+    Commits created by `EnumCommits` store their files in a table shared by all of the commits in the
+    enumeration (see `PathTable`), where `PurePath` objects are only created when a file is accessed.
+    """
 
     # ----------------------------------------------------------------------
     WORKING_CHANGES_COMMIT_ID: ClassVar[str] = "<working>"
@@ -105,7 +130,7 @@ class CommitInfo:
     author: str
     author_date: datetime
 
-    files: list[PurePath]
+    files: Sequence[PurePath]
 
 
 # ----------------------------------------------------------------------
@@ -132,6 +157,25 @@ class VersionDelta:
         )
 
 
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class GetSemanticVersionTrace:
+    """Information about how a semantic version was calculated by GetSemanticVersion."""
+
+    # ----------------------------------------------------------------------
+    base_version: VersionDelta  # The version of the base tag or the configuration's initial version
+    base_tag: Optional[str]
+    base_commit: Optional[str]
+
+    num_commits_scanned: int
+    num_commits_applied: int
+    num_commits_reused_from_checkpoint: int
+
+    # The deltas applied to the base version (from newest to oldest) and the commits that they were
+    # extracted from; the commit is None for deltas reused from a checkpoint.
+    version_deltas: list[tuple[Optional[str], VersionDelta]]
+
+
 # ----------------------------------------------------------------------
 # |
 # |  Public Functions
@@ -155,6 +199,34 @@ def DefaultCommitDataExtractor(
     return VersionDelta(0, 0, 1, None, None)
 
 
+# ----------------------------------------------------------------------
+def DefaultCommitDataBatchExtractor(
+    commit_infos: list[CommitInfo],
+) -> list[Optional[VersionDelta]]:
+    """Batch version of `DefaultCommitDataExtractor` that produces the same results."""
+
+    # Search the descriptions of all of the commits at once (git commit messages can't contain null
+    # characters, so matches can't span descriptions).
+    description_end_offsets = list(
+        itertools.accumulate(len(commit_info.description) + 1 for commit_info in commit_infos),
+    )
+
+    priorities = [len(_DEFAULT_COMMIT_DATA_VERSION_DELTAS)] * len(commit_infos)
+
+    for match in _DEFAULT_COMMIT_DATA_REGEX.finditer(
+        "\0".join(commit_info.description for commit_info in commit_infos),
+    ):
+        index = bisect.bisect_right(description_end_offsets, match.start())
+        priorities[index] = min(priorities[index], _DEFAULT_COMMIT_DATA_PRIORITIES[match.group("keyword")])
+
+    return [
+        _DEFAULT_COMMIT_DATA_VERSION_DELTAS[priority]
+        if priority < len(_DEFAULT_COMMIT_DATA_VERSION_DELTAS)
+        else _DEFAULT_COMMIT_DATA_PATCH_VERSION_DELTA
+        for priority in priorities
+    ]
+
+
 # ----------------------------------------------------------------------
 def GetSemanticVersion(
     dm: DoneManager,
@@ -175,345 +247,657 @@ def GetSemanticVersion(
         ],
         Optional[VersionDelta],  # None indicates that the commit does not impact the version
     ] = DefaultCommitDataExtractor,
+    commit_delta_batch_extraction_func: Optional[
+        Callable[
+            [list[CommitInfo]],
+            list[Optional[VersionDelta]],  # None indicates that the commit does not impact the version
+        ]
+    ] = None,
+    executor: Optional[Executor] = None,
+    use_checkpoints: bool = False,
+    extractor_id: Optional[str] = None,
+    use_pathspecs: bool = False,
+    use_cache: bool = True,
+    environment: Optional[Mapping[str, str]] = None,
 ) -> GetSemanticVersionResult:
-    """Returns a semantic version based on git changes that impact the specified path."""
+    """Returns a semantic version based on git changes that impact the specified path.
+
+    When `use_checkpoints` is True, the information calculated while enumerating changes is saved in
+    the repository's git directory, keyed by the configuration; subsequent invocations only enumerate
+    the commits added since the saved HEAD. Checkpoints are invalidated when tags change, when HEAD is
+    no longer a descendant of the saved HEAD, when the commits added since the saved HEAD include merges,
+    and when configuration files are modified. Checkpoints are
+    also keyed by the commit delta extraction function, which is identified by `extractor_id` (when
+    provided) or by its module and qualified name; checkpoints aren't used when the function can't be
+    identified reliably (for example, lambdas, closures, `functools.partial` objects, and callable
+    instances) and `extractor_id` isn't provided.
+
+    When `use_pathspecs` is True, git only enumerates the commits that modify files in the
+    configuration's directory or its additional dependencies; this is significantly faster for
+    configurations deep within large repositories (especially when the repository's commit-graph
+    includes changed-path Bloom filters; see `GitEx.WriteCommitGraph`). The results are the same.
+
+    When `use_cache` is True, information about configurations and commits is cached in the repository's
+    git directory (see `GetConfiguration` and `EnumCommits`).
+
+    When `commit_delta_batch_extraction_func` is provided, it is used instead of
+    `commit_delta_extraction_func` and is invoked with batches of commits; it must return a delta (or None)
+    for each commit in the batch. When `executor` is provided, batches are extracted concurrently with the
+    executor (functions used with process pools must be picklable); deltas are always applied in commit
+    order, so the results are the same.
+
+    `environment` contains the environment variables used to determine the prerelease name (the default is
+    `os.environ`).
+    """
+
+    return _GetSemanticVersionImpl(
+        dm,
+        path,
+        prerelease_name=prerelease_name,
+        include_branch_name_when_necessary=include_branch_name_when_necessary,
+        include_timestamp_when_necessary=include_timestamp_when_necessary,
+        include_computer_name_when_necessary=include_computer_name_when_necessary,
+        no_prefix=no_prefix,
+        no_metadata=no_metadata,
+        configuration_filenames=configuration_filenames,
+        style=style,
+        commit_delta_extraction_func=commit_delta_extraction_func,
+        commit_delta_batch_extraction_func=commit_delta_batch_extraction_func,
+        executor=executor,
+        use_checkpoints=use_checkpoints,
+        extractor_id=extractor_id,
+        use_pathspecs=use_pathspecs,
+        use_cache=use_cache,
+        environment=environment,
+        memory_checkpoint_store=None,
+    )
 
-    configuration_filenames = configuration_filenames or DEFAULT_CONFIGURATION_FILENAMES
 
-    repository_root = GetGitRoot(path)
-    if repository_root is None:
-        raise Exception("'{}' does not appear to be a git repository.".format(path))
+# ----------------------------------------------------------------------
+def GetSemanticVersions(
+    dm: DoneManager,
+    repository_root: Path,
+    *,
+    prerelease_name: Optional[str] = None,
+    include_branch_name_when_necessary: bool = True,
+    include_timestamp_when_necessary: bool = True,
+    include_computer_name_when_necessary: bool = True,
+    no_prefix: bool = False,
+    no_metadata: bool = False,
+    configuration_filenames: Optional[list[str]] = None,
+    style: GenerateStyle = GenerateStyle.Standard,
+    commit_delta_extraction_func: Callable[
+        [
+            DoneManager,
+            CommitInfo,
+        ],
+        Optional[VersionDelta],  # None indicates that the commit does not impact the version
+    ] = DefaultCommitDataExtractor,
+    commit_delta_batch_extraction_func: Optional[
+        Callable[
+            [list[CommitInfo]],
+            list[Optional[VersionDelta]],  # None indicates that the commit does not impact the version
+        ]
+    ] = None,
+    executor: Optional[Executor] = None,
+    use_cache: bool = True,
+) -> list[GetSemanticVersionResult]:
+    """Returns a semantic version for every configuration file in the repository.
+
+    The results are the same as those produced by calling `GetSemanticVersion` for each configuration
+    root, but the repository's history is only enumerated once; each commit is routed to the
+    configuration roots that own the files that it modifies.
+
+    When `use_cache` is True, information about configurations and commits is cached in the repository's
+    git directory (see `GetConfiguration` and `EnumCommits`).
+    """
 
-    # Get the most applicable configuration
-    configuration: Optional[Configuration] = None
+    configuration_filenames = configuration_filenames or DEFAULT_CONFIGURATION_FILENAMES
 
-    # ----------------------------------------------------------------------
-    def DisplayConfiguration() -> str:
-        if configuration is None:
-            return "configuration errors were encountered"
+    if GetGitRoot(repository_root) != repository_root:
+        raise Exception("'{}' is not the root of a git repository.".format(repository_root))
 
-        if configuration.filename is None:
-            return "default configuration info will be used"
+    import git  # pylint: disable=import-outside-toplevel
 
-        return "configuration info found at '{}'".format(configuration.filename)
+    repo = git.Repo(repository_root)
 
-    # ----------------------------------------------------------------------
+    configuration_store = (
+        JsonStore.Open(Path(repo.common_dir), "configurations", _CONFIGURATION_VERSION) if use_cache else None
+    )
+
+    index: Optional[ConfigurationIndex] = None
+    states: dict[Path, _RootState] = {}
 
-    with dm.Nested(
-        "Loading AutoGitSemVer configuration...",
-        DisplayConfiguration,
+    with (
+        dm.Nested(
+            "Loading AutoGitSemVer configurations...",
+            lambda: (
+                None
+                if index is None
+                else "{} found".format(_FormatCount("configuration file", len(index.configuration_filenames)))
+            ),
+        ),
+        Profiler.Phase("load_configuration"),
     ):
-        configuration = GetConfiguration(path, configuration_filenames)
+        index = ConfigurationIndex.FromWorkingTree(repository_root, configuration_filenames)
+
+        for configuration_filename in index.configuration_filenames:
+            configuration = GetConfiguration(
+                configuration_filename.parent,
+                configuration_filenames,
+                use_cache=use_cache,
+                store=configuration_store,
+            )
+            assert configuration.filename == configuration_filename, (
+                configuration.filename,
+                configuration_filename,
+            )
 
-    changes_processed: int = 0
-    version_deltas: list[VersionDelta] = []
+            states[configuration_filename.parent] = _RootState(
+                configuration,
+                _CreateVersionRegex(configuration),
+                _GetInitialVersion(configuration),
+            )
 
-    with dm.Nested(
-        "Enumerating changes...",
-        [
-            lambda: "{} processed".format(inflect.no("change", changes_processed)),
-            lambda: "{} applied [{:.02f}%]".format(
-                inflect.no("change", len(version_deltas)),
-                0 if changes_processed == 0 else ((len(version_deltas) / changes_processed) * 100),
-            ),
-        ],
-    ) as enumerate_dm:
-        root_path = configuration.filename.parent if configuration.filename else repository_root
+        if not states:
+            # Use the default configuration for the entire repository, just as `GetSemanticVersion` would
+            configuration = GetConfiguration(
+                repository_root,
+                configuration_filenames,
+                use_cache=use_cache,
+                store=configuration_store,
+            )
 
-        additional_dependency_lookup: set[Path] = set()
+            states[repository_root] = _RootState(
+                configuration,
+                _CreateVersionRegex(configuration),
+                _GetInitialVersion(configuration),
+            )
 
-        for additional_dependency in configuration.additional_dependencies:
-            if additional_dependency.is_file():
-                additional_dependency_lookup.add(additional_dependency)
-                continue
+    changes_processed: int = 0
+    changes_applied: int = 0
+
+    with (
+        dm.Nested(
+            "Enumerating changes...",
+            [
+                lambda: "{} processed".format(_FormatCount("change", changes_processed)),
+                lambda: "{} applied".format(_FormatCount("change", changes_applied)),
+            ],
+            # Clear the progress status when complete
+            preserve_status=False,
+        ) as enumerate_dm,
+        Profiler.Phase("enumerate_changes"),
+        GitEx.ObjectReader(repository_root) as object_reader,
+    ):
+        additional_dependency_lookup: dict[str, list[_RootState]] = {}
+
+        for state in states.values():
+            for additional_dependency in _CreateAdditionalDependencyLookup(
+                repository_root,
+                state.configuration,
+            ):
+                additional_dependency_lookup.setdefault(additional_dependency, []).append(state)
 
-            if additional_dependency.is_dir():
-                for ad_root, _, ad_filenames in os.walk(additional_dependency):
-                    ad_root_path = Path(ad_root)
+        num_incomplete = len(states)
 
-                    for ad_filename in ad_filenames:
-                        additional_dependency_lookup.add(ad_root_path / ad_filename)
+        # The status is used for the entire run, as it is expensive to calculate for large repositories
+        with Profiler.Phase("status"):
+            status = GitEx.GetStatus(repository_root)
 
-                continue
+        tag_patterns: dict[str, None] = {}  # Use a dict to remove duplicates while maintaining order
 
-            assert False, additional_dependency  # pragma: no cover
+        for state in states.values():
+            tag_patterns.update(
+                (tag_pattern, None) for tag_pattern in _CreateTagPatterns(state.configuration)
+            )
+
+        delta_extractor = _CommitDeltaExtractor(
+            enumerate_dm,
+            commit_delta_extraction_func,
+            commit_delta_batch_extraction_func,
+            executor,
+        )
 
         # ----------------------------------------------------------------------
-        def IsAdditionalDependency(
-            filename: Path,
-        ) -> bool:
-            return filename in additional_dependency_lookup
+        def ApplyDeltas(
+            results: list[tuple[CommitInfo, Any, Optional[VersionDelta]]],
+        ) -> None:
+            nonlocal changes_applied
+
+            for commit, root_states, delta_applied in results:
+                for state in root_states:
+                    # Nested output is expensive to create, so only create it when it will be displayed
+                    if enumerate_dm.is_verbose:
+                        with enumerate_dm.VerboseNested(
+                            "Processing '{}' ({}) for '{}'".format(
+                                commit.id,
+                                commit.author_date,
+                                state.configuration.filename,
+                            ),
+                            lambda delta_applied=delta_applied: str(delta_applied) if delta_applied else None,
+                        ):
+                            pass
+
+                    if delta_applied is None:
+                        continue
+
+                    state.version_deltas.append(delta_applied)
+                    changes_applied += 1
 
         # ----------------------------------------------------------------------
-        def GetConfigurationPathForFile(
-            filename: Path,
-        ) -> Path:
-            result = GetConfigurationFilename(filename.parent, configuration_filenames)
 
-            if result is not None:
-                return result.parent
+        progress = _ProgressReporter(enumerate_dm)
 
-            return repository_root
+        for commit in EnumCommits(
+            repo,
+            tag_patterns=list(tag_patterns),
+            object_reader=object_reader,
+            status=status,
+            use_cache=use_cache,
+        ):
+            changes_processed += 1
+            progress.Update(changes_processed, changes_applied)
 
-        # ----------------------------------------------------------------------
-        def ShouldProcess(
-            commit: CommitInfo,
-        ) -> bool:
-            for filename in commit.files:
-                fullpath = repository_root / filename
+            # Route the commit to the roots impacted by its files (a dict is used to maintain order while
+            # removing duplicates)
+            commit_states: dict[int, _RootState] = {}
 
-                if (
-                    PathEx.IsDescendant(fullpath, root_path)
-                    and GetConfigurationPathForFile(fullpath) == root_path
-                ) or IsAdditionalDependency(fullpath):
-                    return True
+            for filename in _EnumPosixFilenames(commit.files):
+                state = states.get(index.GetConfigurationRootFromString(filename))
+                if state is not None:
+                    commit_states[id(state)] = state
 
-            return False
+                if additional_dependency_lookup:
+                    for prefix in _EnumPathPrefixes(filename):
+                        for state in additional_dependency_lookup.get(prefix, []):
+                            commit_states[id(state)] = state
 
-        # ----------------------------------------------------------------------
+            untagged_states: list[_RootState] = []
 
-        version_regex_str = r"(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)(?:-(?P<prerelease>[^\+]+))?(?:\+(?P<metadata>.+))?"
+            for state in commit_states.values():
+                if state.is_tagged:
+                    continue
 
-        if configuration.version_prefix:
-            version_regex_str = r"^{}{}{}$".format(
-                re.escape(configuration.version_prefix),
-                "" if configuration.version_prefix.endswith("v") else "v?",
-                version_regex_str,
-            )
-        else:
-            version_regex_str = r"^v?{}$".format(version_regex_str)
+                tag_version = _ExtractVersionFromTags(state.version_regex, commit.tags)
+                if tag_version is None:
+                    untagged_states.append(state)
+                    continue
 
-        version_regex = re.compile(version_regex_str)
+                # Apply the deltas of the commits that precede the tagged commit
+                ApplyDeltas(delta_extractor.Flush())
 
-        # ----------------------------------------------------------------------
-        def ExtractVersionFromTags(
-            tags: list[str],
-        ) -> Optional[VersionDelta]:
-            for tag in tags:
-                match = version_regex.search(tag)
-                if match is None:
-                    continue
+                with enumerate_dm.VerboseNested(
+                    "Processing '{}' ({}) for '{}'".format(
+                        commit.id,
+                        commit.author_date,
+                        state.configuration.filename,
+                    ),
+                    lambda tag_version=tag_version: str(tag_version),
+                ):
+                    state.initial_version = tag_version
+                    state.is_tagged = True
 
-                return VersionDelta(
-                    int(match.group("major")),
-                    int(match.group("minor")),
-                    int(match.group("patch")),
-                    match.group("prerelease"),
-                    match.group("metadata"),
-                )
+                    num_incomplete -= 1
 
-            return None
+            if untagged_states:
+                ApplyDeltas(delta_extractor.Add(commit, untagged_states))
 
-        # ----------------------------------------------------------------------
+            if num_incomplete == 0:
+                break
 
-        repo = git.Repo(repository_root)
+        ApplyDeltas(delta_extractor.Flush())
 
-        initial_version = VersionDelta(
-            configuration.initial_version.major or 0,
-            configuration.initial_version.minor or 0,
-            configuration.initial_version.patch or 0,
-            None,
-            None,
-        )
+        Profiler.Increment("commits.scanned", changes_processed)
+        Profiler.Increment("commits.applied", changes_applied)
 
-        for commit in EnumCommits(repo):
-            changes_processed += 1
+    results: list[GetSemanticVersionResult] = []
 
-            if not ShouldProcess(commit):
-                continue
+    with (
+        dm.Nested("Calculating semantic versions...") as calculate_dm,
+        Profiler.Phase("calculate_version"),
+    ):
+        branch_name = _GetBranchName(status)
+        is_dirty = status.is_dirty
+
+        for state in states.values():
+            results.append(
+                _CalculateSemanticVersion(
+                    state.configuration,
+                    state.initial_version,
+                    state.version_deltas,
+                    prerelease_name=prerelease_name,
+                    include_branch_name_when_necessary=include_branch_name_when_necessary,
+                    include_timestamp_when_necessary=include_timestamp_when_necessary,
+                    include_computer_name_when_necessary=include_computer_name_when_necessary,
+                    no_prefix=no_prefix,
+                    no_metadata=no_metadata,
+                    style=style,
+                    branch_name=branch_name,
+                    is_dirty=is_dirty,
+                    environment=None,
+                ),
+            )
 
-            delta_applied: Optional[VersionDelta] = None
+        display_names = [
+            (
+                result.configuration_filename.relative_to(repository_root).as_posix()
+                if result.configuration_filename
+                else "<default configuration>"
+            )
+            for result in results
+        ]
 
-            with enumerate_dm.VerboseNested(
-                "Processing '{}' ({})".format(commit.id, commit.author_date),
-                lambda: str(delta_applied) if delta_applied else None,
-            ):
-                delta_applied = ExtractVersionFromTags(commit.tags)
-                if delta_applied is not None:
-                    initial_version = delta_applied
-                    break
+        display_name_width = max(len(display_name) for display_name in display_names)
 
-                delta_applied = commit_delta_extraction_func(enumerate_dm, commit)
-                if delta_applied is None:
-                    continue
+        for display_name, result in zip(display_names, results):
+            calculate_dm.WriteLine(
+                "{:<{}}  {}".format(display_name, display_name_width, result.semantic_version_string),
+            )
+
+    return results
 
-                version_deltas.append(delta_applied)
 
-    with dm.Nested("Calculating semantic version...") as calculate_dm:
-        major = initial_version.major
-        minor = initial_version.minor
-        patch = initial_version.patch
+# ----------------------------------------------------------------------
+def WatchSemanticVersion(
+    dm: DoneManager,
+    path: Path,
+    *,
+    interval: float = 1.0,
+    prerelease_name: Optional[str] = None,
+    include_branch_name_when_necessary: bool = True,
+    include_timestamp_when_necessary: bool = True,
+    include_computer_name_when_necessary: bool = True,
+    no_prefix: bool = False,
+    no_metadata: bool = False,
+    configuration_filenames: Optional[list[str]] = None,
+    style: GenerateStyle = GenerateStyle.Standard,
+    commit_delta_extraction_func: Callable[
+        [
+            DoneManager,
+            CommitInfo,
+        ],
+        Optional[VersionDelta],  # None indicates that the commit does not impact the version
+    ] = DefaultCommitDataExtractor,
+    commit_delta_batch_extraction_func: Optional[
+        Callable[
+            [list[CommitInfo]],
+            list[Optional[VersionDelta]],  # None indicates that the commit does not impact the version
+        ]
+    ] = None,
+    executor: Optional[Executor] = None,
+    use_pathspecs: bool = False,
+    use_cache: bool = True,
+) -> Generator[GetSemanticVersionResult, None, None]:
+    """Yields a semantic version for the specified path, and then yields a new semantic version whenever it changes (as HEAD moves, tags change, or the working tree becomes dirty or clean).
+
+    The repository's git directory is polled (every `interval` seconds) by checking the file system
+    information of HEAD, the index, and refs; the working tree's dirty state is checked with a status
+    snapshot. The information calculated while enumerating changes is kept in memory, so only the commits
+    added since the previous HEAD are enumerated; all commits are enumerated when the new commits include
+    merges or when tags change (see `use_checkpoints` in `GetSemanticVersion`).
+
+    Errors encountered while calculating a version are written to `dm` and polling continues; the
+    version is calculated again when the repository changes.
+    """
+
+    repository_root = GetGitRoot(path)
+    if repository_root is None:
+        raise Exception("'{}' does not appear to be a git repository.".format(path))
 
-        prerelease: list[str] = list(initial_version.prerelease or [])
-        metadata: list[str] = list(initial_version.build_metadata or [])
+    import git  # pylint: disable=import-outside-toplevel
 
-        for version_delta in reversed(version_deltas):
-            if version_delta.major:
-                major += version_delta.major
-                minor = 0
-                patch = 0
+    repo = git.Repo(repository_root)
 
-                prerelease = []
-                metadata = []
+    git_dir = Path(repo.git_dir)
+    common_dir = Path(repo.common_dir)
 
-            if version_delta.minor:
-                minor += version_delta.minor
-                patch = 0
+    checkpoint_store = _MemoryStore()
 
-                prerelease = []
-                metadata = []
+    previous_state: Optional[tuple[Any, ...]] = None
+    previous_semantic_version_string: Optional[str] = None
 
-            if version_delta.patch:
-                patch += version_delta.patch
+    while True:
+        result: Optional[GetSemanticVersionResult] = None
+
+        try:
+            # The state is an inexpensive fingerprint (file system information and a single status
+            # process); the version is only calculated when it changes. The state is captured before the
+            # version is calculated, so changes made during the calculation are detected by the next poll.
+            status = GitEx.GetStatus(repository_root)
+
+            state = (
+                _GetRepositoryMetadataState(git_dir, common_dir),
+                status.head,
+                status.is_dirty,
+            )
 
-                prerelease = []
-                metadata = []
+            if state != previous_state:
+                # The state is updated before the version is calculated, so that errors are only
+                # reported again when the repository changes.
+                previous_state = state
+
+                result = _GetSemanticVersionImpl(
+                    dm,
+                    path,
+                    prerelease_name=prerelease_name,
+                    include_branch_name_when_necessary=include_branch_name_when_necessary,
+                    include_timestamp_when_necessary=include_timestamp_when_necessary,
+                    include_computer_name_when_necessary=include_computer_name_when_necessary,
+                    no_prefix=no_prefix,
+                    no_metadata=no_metadata,
+                    configuration_filenames=configuration_filenames,
+                    style=style,
+                    commit_delta_extraction_func=commit_delta_extraction_func,
+                    commit_delta_batch_extraction_func=commit_delta_batch_extraction_func,
+                    executor=executor,
+                    use_checkpoints=True,
+                    extractor_id=None,
+                    use_pathspecs=use_pathspecs,
+                    use_cache=use_cache,
+                    environment=None,
+                    memory_checkpoint_store=checkpoint_store,
+                )
 
-            if version_delta.prerelease:
-                prerelease.append(version_delta.prerelease)
-            if version_delta.build_metadata:
-                metadata.append(version_delta.build_metadata)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            # Exceptions raised within nested output have already been written
+            if not getattr(ex, DISPLAYED_EXCEPTION_ATTRIBUTE_NAME, False):
+                dm.WriteError("{}\n".format(ex))
 
-        if major == 0 and minor == 0:
-            # If here, we are going to bump the minor version, so subtract a value from the patch value
-            minor = 1
+        if result is not None and result.semantic_version_string != previous_semantic_version_string:
+            previous_semantic_version_string = result.semantic_version_string
+            yield result
 
-            if patch > 0:
-                patch -= 1
+        time.sleep(interval)
 
-        # Augment the prerelease items (if necessary)
-        augmented_prerelease: list[str] = []
 
-        prerelease_name = prerelease_name or os.getenv(  # pylint: disable=invalid-envvar-value
-            configuration.prerelease_environment_variable_name
+# ----------------------------------------------------------------------
+async def GetSemanticVersionAsync(
+    dm: DoneManager,
+    path: Path,
+    *,
+    prerelease_name: Optional[str] = None,
+    include_branch_name_when_necessary: bool = True,
+    include_timestamp_when_necessary: bool = True,
+    include_computer_name_when_necessary: bool = True,
+    no_prefix: bool = False,
+    no_metadata: bool = False,
+    configuration_filenames: Optional[list[str]] = None,
+    style: GenerateStyle = GenerateStyle.Standard,
+    commit_delta_extraction_func: Callable[
+        [
+            DoneManager,
+            CommitInfo,
+        ],
+        Optional[VersionDelta],  # None indicates that the commit does not impact the version
+    ] = DefaultCommitDataExtractor,
+    commit_delta_batch_extraction_func: Optional[
+        Callable[
+            [list[CommitInfo]],
+            list[Optional[VersionDelta]],  # None indicates that the commit does not impact the version
+        ]
+    ] = None,
+    executor: Optional[Executor] = None,
+    use_checkpoints: bool = False,
+    extractor_id: Optional[str] = None,
+    use_pathspecs: bool = False,
+    use_cache: bool = True,
+    environment: Optional[Mapping[str, str]] = None,
+) -> GetSemanticVersionResult:
+    """Asynchronous version of `GetSemanticVersion` that produces the same results.
+
+    The work is performed on a worker thread so that the event loop isn't blocked. When the awaiting task
+    is cancelled, the git processes spawned on behalf of the calculation are killed and the task is
+    cancelled once the worker thread has exited.
+    """
+
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    with GitEx.CancellationScope() as cancellation_scope:
+        # The cancellation scope is propagated to the worker thread with the current context
+        task = asyncio.ensure_future(
+            asyncio.to_thread(
+                GetSemanticVersion,
+                dm,
+                path,
+                prerelease_name=prerelease_name,
+                include_branch_name_when_necessary=include_branch_name_when_necessary,
+                include_timestamp_when_necessary=include_timestamp_when_necessary,
+                include_computer_name_when_necessary=include_computer_name_when_necessary,
+                no_prefix=no_prefix,
+                no_metadata=no_metadata,
+                configuration_filenames=configuration_filenames,
+                style=style,
+                commit_delta_extraction_func=commit_delta_extraction_func,
+                commit_delta_batch_extraction_func=commit_delta_batch_extraction_func,
+                executor=executor,
+                use_checkpoints=use_checkpoints,
+                extractor_id=extractor_id,
+                use_pathspecs=use_pathspecs,
+                use_cache=use_cache,
+                environment=environment,
+            ),
         )
-        if prerelease_name is not None:
-            augmented_prerelease.append(prerelease_name)
 
-        # ----------------------------------------------------------------------
-        def GetBranchName() -> str:
-            try:
-                return repo.active_branch.name
-            except TypeError:
-                return "<detached head>"
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            cancellation_scope.Cancel()
 
-        # ----------------------------------------------------------------------
+            # Wait for the worker thread to exit, as it can't be interrupted
+            with contextlib.suppress(BaseException):
+                await task
 
-        branch_name = GetBranchName()
+            raise
 
-        if (
-            configuration.include_branch_name_when_necessary
-            and include_branch_name_when_necessary
-            and branch_name not in configuration.main_branch_names
-        ):
-            augmented_prerelease.append(branch_name)
-
-        # Augment the metadata items (if necessary)
-        augmented_metadata: list[str] = []
-
-        if configuration.include_timestamp_when_necessary and include_timestamp_when_necessary:
-            now = datetime.now()
-
-            augmented_metadata.append(
-                "{:04d}{:02d}{:02d}{:02d}{:02d}{:02d}".format(
-                    now.year,
-                    now.month,
-                    now.day,
-                    now.hour,
-                    now.minute,
-                    now.second,
-                ),
-            )
 
-        if configuration.include_computer_name_when_necessary and include_computer_name_when_necessary:
-            augmented_metadata.append(platform.node())
+# ----------------------------------------------------------------------
+async def GatherSemanticVersionsAsync(
+    dm: DoneManager,
+    paths: list[Path],
+    *,
+    max_concurrency: int = 8,
+    **get_semantic_version_async_kwargs: Any,
+) -> list[GetSemanticVersionResult]:
+    """Returns a semantic version for each of the paths (in the same order), calculating at most `max_concurrency` at a time.
 
-        if repo.is_dirty():
-            augmented_metadata.append("working_changes")
+    The paths may be in the same or different repositories; keyword arguments are forwarded to
+    `GetSemanticVersionAsync`. The output for each path is written once its semantic version has been
+    calculated. When any calculation fails or the task is cancelled, the remaining calculations are
+    cancelled.
+    """
 
-        # Combine the elements
-        prerelease = augmented_prerelease + prerelease
-        metadata = augmented_metadata + metadata
+    import asyncio  # pylint: disable=import-outside-toplevel
 
-        if style == GenerateStyle.Standard:
-            # No changes are necessary
-            pass
-        elif style == GenerateStyle.AllPrerelease:
-            prerelease += metadata
-            metadata = []
-        elif style == GenerateStyle.AllMetadata:
-            metadata = prerelease + metadata
-            prerelease = []
-        else:
-            assert False, style  # pragma: no cover
-
-        # Create the semantic version
-        semver = SemVer(
-            major=major,
-            minor=minor,
-            patch=patch,
-            prerelease=(None if no_prefix else tuple(prerelease)),
-            build=None if no_metadata else tuple(metadata),
-        )
+    if max_concurrency < 1:
+        raise Exception("'max_concurrency' must be greater than 0.")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    # ----------------------------------------------------------------------
+    async def Impl(
+        path: Path,
+    ) -> GetSemanticVersionResult:
+        async with semaphore:
+            # Output is buffered, as it would be interleaved when written concurrently
+            sink = StringIO()
+
+            try:
+                with DoneManager.Create(sink, "'{}'".format(path), flags=dm.flags) as path_dm:
+                    return await GetSemanticVersionAsync(path_dm, path, **get_semantic_version_async_kwargs)
+            finally:
+                dm.WriteLine(sink.getvalue().rstrip())
+
+    # ----------------------------------------------------------------------
 
-        semver_string = f"{configuration.version_prefix or ''}{semver}"
+    tasks = [asyncio.ensure_future(Impl(path)) for path in paths]
 
-        calculate_dm.WriteLine(semver_string)
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
 
-    return GetSemanticVersionResult(configuration.filename, semver, semver_string)
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 # ----------------------------------------------------------------------
 def GetConfiguration(
     path: Path,
     configuration_filenames: Optional[list[str]] = None,
+    *,
+    use_cache: bool = True,
+    store: Optional[JsonStore] = None,
 ) -> Configuration:
-    """Returns the configuration data impacting the specified path."""
+    """Returns the configuration data impacting the specified path.
+
+    When `use_cache` is True, validated configuration content is cached in-process (and in `store`, if
+    provided) keyed by the configuration file's path, modification time, and size; configuration files
+    are only parsed again when they change.
+    """
 
     # Get the configuration filename
-    configuration_filename: Optional[Path] = GetConfigurationFilename(path, configuration_filenames)
+    configuration_filename: Optional[Path] = GetConfigurationFilename(
+        path,
+        configuration_filenames,
+        use_cache=use_cache,
+    )
 
     # Get the configuration content
-    configuration_content: dict[str, Any] = {}
-
-    if configuration_filename is not None:
-        with configuration_filename.open() as f:
-            if configuration_filename.suffix in [".yaml", ".yml"]:
-                configuration_content = cast(dict[str, Any], rtyaml.load(f))
-            elif configuration_filename.suffix == ".json":
-                configuration_content = json.load(f)
-            else:
-                assert False, configuration_filename  # pragma: no cover
-
-    # Load the schema
-    schema_filename = Path(__file__).parent / "AutoGitSemVerSchema.json"
-    if not schema_filename.is_file():
-        raise Exception("The filename '{}' does not exist.".format(schema_filename))  # pragma: no cover
-
-    with schema_filename.open() as f:
-        schema_content = json.load(f)
-
-    # Create the configuration validator. The special class is augmented to apply defaults to the
-    # configuration. This code is based on https://python-jsonschema.readthedocs.io/en/latest/faq/
-    validator_class = Draft202012Validator
-    validate_properties = validator_class.VALIDATORS["properties"]
+    configuration_content: Optional[dict[str, Any]] = None
+    cache_key: Optional[str] = None
+
+    if configuration_filename is not None and use_cache:
+        cache_key = _CreateConfigurationCacheKey(configuration_filename)
+        if cache_key is not None:
+            configuration_content = _LoadCachedConfigurationContent(cache_key, store)
+
+            Profiler.Increment(
+                "configuration_cache.hits"
+                if configuration_content is not None
+                else "configuration_cache.misses"
+            )
 
-    # ----------------------------------------------------------------------
-    def SetDefaults(validator, properties, instance, schema):
-        for prop, sub_schema in properties.items():
-            default_schema = sub_schema.get("default", None)
-            if default_schema is not None:
-                instance.setdefault(prop, default_schema)
+    if configuration_content is None:
+        configuration_content = {}
 
-            for error in validate_properties(validator, properties, instance, schema):
-                yield error
+        if configuration_filename is not None:
+            with configuration_filename.open() as f:
+                if configuration_filename.suffix in [".yaml", ".yml"]:
+                    import rtyaml  # type: ignore [import-untyped]  # pylint: disable=import-outside-toplevel
 
-    # ----------------------------------------------------------------------
+                    configuration_content = cast(dict[str, Any], rtyaml.load(f))
+                elif configuration_filename.suffix == ".json":
+                    configuration_content = json.load(f)
+                else:
+                    assert False, configuration_filename  # pragma: no cover
 
-    validator = validators.extend(validator_class, {"properties": SetDefaults})(schema_content)
+        # Validate the configuration data
+        _GetConfigurationValidator().validate(configuration_content)
 
-    # Validate the configuration data
-    validator.validate(configuration_content)
+        if cache_key is not None:
+            _SaveCachedConfigurationContent(cache_key, configuration_content, store)
 
     additional_dependencies: list[Path] = []
 
@@ -531,7 +915,8 @@ def GetConfiguration(
         configuration_content.get("version_prefix", None),
         configuration_content["prerelease_environment_variable_name"],
         SemVer.coerce(configuration_content["initial_version"]),
-        configuration_content["main_branch_names"],
+        # Cached content is shared, so the configuration gets its own copy of mutable values
+        list(configuration_content["main_branch_names"]),
         additional_dependencies,
         include_branch_name_when_necessary=configuration_content["include_branch_name_when_necessary"],
         include_timestamp_when_necessary=configuration_content["include_timestamp_when_necessary"],
@@ -543,21 +928,66 @@ def GetConfiguration(
 def GetConfigurationFilename(
     path: Path,
     configuration_filenames: Optional[list[str]] = None,
+    *,
+    use_cache: bool = True,
 ) -> Optional[Path]:
-    """Returns the configuration filename impacting the specified path."""
+    """Returns the configuration filename impacting the specified path.
+
+    When `use_cache` is True, results are cached in-process along with the modified times of the
+    directories searched; the directories are only searched again when one of them changes.
+    """
 
     configuration_filenames = configuration_filenames or DEFAULT_CONFIGURATION_FILENAMES
 
+    cache_key = json.dumps([str(path), configuration_filenames])
+
+    if use_cache:
+        with _configuration_cache_lock:
+            cache_entry = _configuration_filename_cache.get(cache_key)
+            if cache_entry is not None:
+                _configuration_filename_cache.move_to_end(cache_key)
+
+        if cache_entry is not None:
+            result, directory_modified_times = cache_entry
+
+            if all(
+                _GetModifiedTime(directory) == modified_time
+                for directory, modified_time in directory_modified_times
+            ):
+                Profiler.Increment("configuration_filename_cache.hits")
+                return result
+
+        Profiler.Increment("configuration_filename_cache.misses")
+
+    directory_modified_times: list[tuple[Path, Optional[int]]] = []
+    result: Optional[Path] = None
+
     for parent in itertools.chain([path], path.parents):
+        # The modified time is captured before searching, so changes made while searching invalidate the
+        # cached result.
+        directory_modified_times.append((parent, _GetModifiedTime(parent)))
+
         for potential_configuration_filename in configuration_filenames:
             potential_filename = parent / potential_configuration_filename
             if potential_filename.is_file():
-                return potential_filename
+                result = potential_filename
+                break
 
-        if (parent / ".git").is_dir():
+        if result is not None or (parent / ".git").is_dir():
             break
 
-    return None
+    if use_cache and not any(
+        modified_time is None or _IsRecentlyModified(modified_time)
+        for _, modified_time in directory_modified_times
+    ):
+        with _configuration_cache_lock:
+            _configuration_filename_cache[cache_key] = (result, directory_modified_times)
+            _configuration_filename_cache.move_to_end(cache_key)
+
+            while len(_configuration_filename_cache) > _MAX_NUM_CACHED_CONFIGURATIONS:
+                _configuration_filename_cache.popitem(last=False)
+
+    return result
 
 
 # ----------------------------------------------------------------------
@@ -573,9 +1003,45 @@ def GetGitRoot(path: Path) -> Optional[Path]:
 
 # ----------------------------------------------------------------------
 def EnumCommits(
-    repo_or_path: git.Repo | Path,
+    repo_or_path: "git.Repo | Path",
+    *,
+    revisions: Optional[list[str]] = None,
+    use_cache: bool = True,
+    pathspecs: Optional[list[str]] = None,
+    tag_patterns: Optional[list[str]] = None,
+    object_reader: Optional[GitEx.ObjectReader] = None,
+    status: Optional[GitEx.Status] = None,
+    is_terminal_commit_func: Optional[Callable[[CommitInfo], bool]] = None,
 ) -> Generator[CommitInfo, None, None]:
-    """Enumerates git commits for the specified repository and branch."""
+    """Enumerates git commits for the specified repository and branch.
+
+    `revisions` are the revisions to walk (for example, `["HEAD", "^<sha>"]` to only enumerate the
+    commits added since `<sha>`); the default is `["HEAD"]`.
+
+    `pathspecs` limit the commits enumerated to those that modify matching files, which allows git to
+    skip commits using the changed-path Bloom filters in the commit-graph (if available). The files
+    associated with each commit are not limited by the pathspecs.
+
+    `tag_patterns` are globs (relative to 'refs/tags/') that limit the tags associated with commits;
+    tags that don't match are filtered out before any objects are read.
+
+    Individual objects are read with `object_reader` (if provided) or with a reader that is closed when
+    the enumeration is complete. Working changes are determined by `status` (if provided) or by a new
+    status snapshot.
+
+    Information about commits is persisted in a cache stored in the repository's git directory when
+    `use_cache` is True, so that git is only queried for commits that have not been seen before.
+
+    When `is_terminal_commit_func` is provided, the enumeration ends with the first tagged commit for
+    which the function returns True (the function is only invoked for tagged commits). Commit hashes are
+    walked first, which is inexpensive, and information is only retrieved for the commits that precede
+    the terminal commit (and for tagged candidates); the work performed is bounded by the distance to
+    the nearest version tag rather than by the length of the history.
+    """
+
+    import git  # pylint: disable=import-outside-toplevel
+
+    revisions = revisions or ["HEAD"]
 
     if isinstance(repo_or_path, Path):
         repo = git.Repo(repo_or_path)
@@ -584,55 +1050,1523 @@ def EnumCommits(
     else:
         assert False, repo_or_path  # pragma: no cover
 
+    working_dir = Path(repo.working_dir)
+
     # Return the working changes (if any)
-    if repo.is_dirty():
+    if status is None:
+        status = GitEx.GetStatus(working_dir)
+
+    # Files are shared by all of the commits enumerated
+    path_table = PathTable()
+
+    if status.is_dirty:
         yield CommitInfo(
             CommitInfo.WORKING_CHANGES_COMMIT_ID,
             "",
             [],
             "",
             datetime.now(),
-            [PurePath(diff.a_path) for diff in repo.active_branch.commit.diff()],
+            path_table.CreateList(status.staged_filenames),
         )
 
     # Enumerate commits
-    git_tags: dict[str, list[git.Tag]] = {}
+    with Profiler.Phase("tags"):
+        if object_reader is None:
+            with GitEx.ObjectReader(working_dir) as temporary_object_reader:
+                tag_lookup = _CreateTagLookup(temporary_object_reader, tag_patterns)
+        else:
+            tag_lookup = _CreateTagLookup(object_reader, tag_patterns)
 
-    for tag in repo.tags:
-        # Tags are most often associated with merges into a mainline branch, but we are filtering merges
-        # out in the code below. Therefore, associate the tag with a parent that isn't a merge commit.
-        if len(tag.commit.parents) <= 1:
-            # We are looking at a direct commit to the branch
-            git_tags.setdefault(tag.commit.hexsha, []).append(tag)
-            continue
+    cache = CommitCache.Open(Path(repo.common_dir)) if use_cache else None
 
-        # We are looking at a merge
-        for parent in tag.commit.parents:
-            if len(parent.parents) == 1:
-                git_tags.setdefault(parent.hexsha, []).append(tag)
+    # ----------------------------------------------------------------------
+    def CreateCommitInfo(
+        record: GitEx.LogRecord,
+    ) -> CommitInfo:
+        return CommitInfo(
+            record.hexsha,
+            record.message,
+            tag_lookup.get(record.hexsha, []),
+            record.author,
+            record.author_date,
+            path_table.CreateList(record.filenames),
+        )
+
+    # ----------------------------------------------------------------------
+
+    if is_terminal_commit_func is not None:
+        records = _EnumLogRecordsUntilTerminal(
+            working_dir,
+            cache,
+            revisions,
+            pathspecs,
+            tag_lookup,
+            lambda record: is_terminal_commit_func(CreateCommitInfo(record)),
+        )
+    elif cache is None:
+        records = GitEx.EnumLogRecords(
+            working_dir,
+            [*_WALK_OPTIONS, *(_PATHSPEC_WALK_OPTIONS if pathspecs else []), *revisions],
+            pathspecs=pathspecs,
+        )
+    else:
+        records = _EnumCachedLogRecords(working_dir, cache, revisions, pathspecs)
+
+    try:
+        while True:
+            # The phase can't span the `yield`, as the caller's code would be attributed to it
+            with Profiler.Phase("retrieve_commits"):
+                record = next(records, None)
+
+            if record is None:
                 break
 
-    offset = 0
+            yield CreateCommitInfo(record)
+    finally:
+        records.close()
 
-    while True:
-        commits = list(repo.iter_commits("HEAD", max_count=50, skip=offset, topo_order=True))
-        if not commits:
-            break
+        if cache is not None:
+            Profiler.Increment("commit_cache.hits", cache.num_hits)
+            Profiler.Increment("commit_cache.misses", cache.num_misses)
 
-        offset += len(commits)
+            cache.Close()
 
-        for commit in commits:
-            # Ignore merge commits
-            if len(commit.parents) > 1:
-                continue
 
-            assert isinstance(commit.message, str), commit.message
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _Checkpoint:
+    """Information calculated while enumerating changes, saved so that it can be reused by subsequent invocations."""
 
-            yield CommitInfo(
-                commit.hexsha,
-                commit.message,
-                [tag.name for tag in git_tags.get(commit.hexsha, [])],
-                commit.author.name or "",
-                commit.authored_datetime,
-                [PurePath(path) for path in commit.stats.files],
-            )
+    head: str
+    tags_fingerprint: str
+
+    initial_version: VersionDelta
+    base_tag: Optional[str]
+    base_commit: Optional[str]
+
+    version_deltas: list[VersionDelta]
+
+
+# ----------------------------------------------------------------------
+@dataclass
+class _RootState:
+    """Information calculated for a configuration root while enumerating changes in `GetSemanticVersions`."""
+
+    configuration: Configuration
+    version_regex: re.Pattern
+
+    initial_version: VersionDelta
+    version_deltas: list[VersionDelta] = field(default_factory=list)
+
+    is_tagged: bool = field(default=False)
+
+
+# ----------------------------------------------------------------------
+class _MemoryStore:
+    """Key/value store with the same interface as `JsonStore` that keeps the most recently saved content in memory."""
+
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        self._key: Optional[str] = None
+        self._content: Optional[Any] = None
+
+    # ----------------------------------------------------------------------
+    def Load(
+        self,
+        key: str,
+    ) -> Optional[Any]:
+        return self._content if key == self._key else None
+
+    # ----------------------------------------------------------------------
+    def Save(
+        self,
+        key: str,
+        content: Any,
+    ) -> None:
+        self._key = key
+        self._content = content
+
+
+# ----------------------------------------------------------------------
+class _CommitDeltaExtractor:
+    """Extracts version deltas from commits in batches (optionally with an executor) while maintaining commit order."""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        dm: DoneManager,
+        commit_delta_extraction_func: Callable[[DoneManager, CommitInfo], Optional[VersionDelta]],
+        commit_delta_batch_extraction_func: Optional[
+            Callable[[list[CommitInfo]], list[Optional[VersionDelta]]]
+        ],
+        executor: Optional[Executor],
+    ):
+        if commit_delta_batch_extraction_func is None:
+            if commit_delta_extraction_func is DefaultCommitDataExtractor:
+                commit_delta_batch_extraction_func = DefaultCommitDataBatchExtractor
+            else:
+                commit_delta_batch_extraction_func = functools.partial(
+                    _ExtractCommitDeltas,
+                    dm,
+                    commit_delta_extraction_func,
+                )
+
+        self._batch_extraction_func = commit_delta_batch_extraction_func
+        self._executor = executor
+
+        self._pending_items: list[tuple[CommitInfo, Any]] = []
+        self._pending_batches: deque[
+            tuple[
+                list[tuple[CommitInfo, Any]],
+                Future | list[Optional[VersionDelta]],
+            ]
+        ] = deque()
+
+    # ----------------------------------------------------------------------
+    def Add(
+        self,
+        commit: CommitInfo,
+        context: Any,
+    ) -> list[tuple[CommitInfo, Any, Optional[VersionDelta]]]:
+        """Adds a commit; returns the (commit, context, delta) tuples of the batches that have been extracted."""
+
+        self._pending_items.append((commit, context))
+
+        if len(self._pending_items) < _COMMIT_DELTA_BATCH_SIZE:
+            return []
+
+        with Profiler.Phase("extract_deltas"):
+            self._Submit()
+            return self._Collect(wait=False)
+
+    # ----------------------------------------------------------------------
+    def Flush(self) -> list[tuple[CommitInfo, Any, Optional[VersionDelta]]]:
+        """Returns the (commit, context, delta) tuples of all commits that have been added."""
+
+        with Profiler.Phase("extract_deltas"):
+            if self._pending_items:
+                self._Submit()
+
+            return self._Collect(wait=True)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _Submit(self) -> None:
+        items = self._pending_items
+        self._pending_items = []
+
+        commits = [commit for commit, _ in items]
+
+        if self._executor is None:
+            self._pending_batches.append((items, self._batch_extraction_func(commits)))
+        else:
+            self._pending_batches.append((items, self._executor.submit(self._batch_extraction_func, commits)))
+
+    # ----------------------------------------------------------------------
+    def _Collect(
+        self,
+        *,
+        wait: bool,
+    ) -> list[tuple[CommitInfo, Any, Optional[VersionDelta]]]:
+        results: list[tuple[CommitInfo, Any, Optional[VersionDelta]]] = []
+
+        while self._pending_batches:
+            items, deltas = self._pending_batches[0]
+
+            if isinstance(deltas, Future):
+                # Wait for the oldest batch when there are too many batches in flight, so that the
+                # enumeration of commits doesn't get too far ahead of the extraction of deltas.
+                if (
+                    not wait
+                    and not deltas.done()
+                    and len(self._pending_batches) <= _MAX_NUM_PENDING_COMMIT_DELTA_BATCHES
+                ):
+                    break
+
+                deltas = deltas.result()
+
+            self._pending_batches.popleft()
+
+            if len(deltas) != len(items):
+                raise Exception(
+                    "The commit delta batch extraction function returned {} for {}.".format(
+                        _FormatCount("result", len(deltas)),
+                        _FormatCount("commit", len(items)),
+                    ),
+                )
+
+            results += [(commit, context, delta) for (commit, context), delta in zip(items, deltas)]
+
+        return results
+
+
+# ----------------------------------------------------------------------
+class _ProgressReporter:
+    """Periodically displays the number of changes processed and applied while enumerating changes.
+
+    Progress is only displayed on interactive streams and is rate-limited, so that the cost of reporting
+    doesn't depend on the number of commits enumerated (information about each commit is only displayed
+    when verbose output is requested).
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        dm: DoneManager,
+    ):
+        self._dm: Optional[DoneManager] = dm if dm.capabilities.is_interactive else None
+        self._next_update_time = time.perf_counter() + _PROGRESS_INTERVAL
+
+    # ----------------------------------------------------------------------
+    def Update(
+        self,
+        num_processed: int,
+        num_applied: int,
+    ) -> None:
+        # The time is only checked periodically, as this is called for every commit
+        if self._dm is None or num_processed % _PROGRESS_CHECK_INTERVAL:
+            return
+
+        now = time.perf_counter()
+        if now < self._next_update_time:
+            return
+
+        self._next_update_time = now + _PROGRESS_INTERVAL
+
+        self._dm.WriteStatus(
+            "{} processed, {} applied".format(
+                _FormatCount("change", num_processed),
+                _FormatCount("change", num_applied),
+            ),
+        )
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_WALK_OPTIONS: list[str] = [
+    "--topo-order",
+    "--no-merges",  # Merge commits are not considered when calculating the version
+]
+
+_PATHSPEC_WALK_OPTIONS: list[str] = [
+    # Don't simplify history when limiting the walk with pathspecs, as the commits enumerated must be
+    # the same as those found in an unlimited walk (minus those that don't modify matching files).
+    "--full-history",
+]
+
+_CHECKPOINT_VERSION = 2
+_CONFIGURATION_INDEX_VERSION = 1
+
+_INITIAL_CACHE_MISS_BATCH_SIZE = 32
+_MAX_CACHE_MISS_BATCH_SIZE = 4096
+
+_CONFIGURATION_VERSION = 1
+
+_COMMIT_DELTA_BATCH_SIZE = 256
+_MAX_NUM_PENDING_COMMIT_DELTA_BATCHES = 16
+
+_PROGRESS_CHECK_INTERVAL = 256  # Number of commits
+_PROGRESS_INTERVAL = 0.25  # Seconds
+
+_DEFAULT_COMMIT_DATA_REGEX = re.compile(r"\+(?P<keyword>major|minor|patch|feature)")
+
+# The keywords searched by `DefaultCommitDataExtractor`, in the order in which they are searched
+_DEFAULT_COMMIT_DATA_PRIORITIES: dict[str, int] = {
+    "major": 0,
+    "minor": 1,
+    "patch": 2,
+    "feature": 3,
+}
+
+_DEFAULT_COMMIT_DATA_VERSION_DELTAS: list[VersionDelta] = [
+    VersionDelta(1, 0, 0, None, None),
+    VersionDelta(0, 1, 0, None, None),
+    VersionDelta(0, 0, 1, None, None),
+    VersionDelta(0, 1, 0, None, None),
+]
+
+_DEFAULT_COMMIT_DATA_PATCH_VERSION_DELTA = VersionDelta(0, 0, 1, None, None)
+_MAX_NUM_CACHED_CONFIGURATIONS = 256
+_RECENTLY_MODIFIED_THRESHOLD_NS = 2_000_000_000  # The coarsest common modified time resolution (FAT)
+
+# Least recently used caches of configuration filenames (validated with the modified times of the
+# directories searched) and validated configuration content (keyed by configuration file path, modified
+# time, and size).
+_configuration_filename_cache: OrderedDict[str, tuple[Optional[Path], list[tuple[Path, Optional[int]]]]] = (
+    OrderedDict()
+)
+_configuration_content_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_configuration_cache_lock = threading.Lock()
+
+# The configuration validator is created on first use and shared by all subsequent calls.
+_configuration_validator: Optional[Any] = None
+_configuration_validator_lock = threading.Lock()
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _CalculateSemanticVersion(
+    configuration: Configuration,
+    initial_version: VersionDelta,
+    version_deltas: list[VersionDelta],
+    *,
+    prerelease_name: Optional[str],
+    include_branch_name_when_necessary: bool,
+    include_timestamp_when_necessary: bool,
+    include_computer_name_when_necessary: bool,
+    no_prefix: bool,
+    no_metadata: bool,
+    style: GenerateStyle,
+    branch_name: str,
+    is_dirty: bool,
+    environment: Optional[Mapping[str, str]],
+) -> GetSemanticVersionResult:
+    """Applies the version deltas (which are ordered from newest to oldest) to the initial version."""
+
+    major = initial_version.major
+    minor = initial_version.minor
+    patch = initial_version.patch
+
+    prerelease: list[str] = list(initial_version.prerelease or [])
+    metadata: list[str] = list(initial_version.build_metadata or [])
+
+    for version_delta in reversed(version_deltas):
+        if version_delta.major:
+            major += version_delta.major
+            minor = 0
+            patch = 0
+
+            prerelease = []
+            metadata = []
+
+        if version_delta.minor:
+            minor += version_delta.minor
+            patch = 0
+
+            prerelease = []
+            metadata = []
+
+        if version_delta.patch:
+            patch += version_delta.patch
+
+            prerelease = []
+            metadata = []
+
+        if version_delta.prerelease:
+            prerelease.append(version_delta.prerelease)
+        if version_delta.build_metadata:
+            metadata.append(version_delta.build_metadata)
+
+    if major == 0 and minor == 0:
+        # If here, we are going to bump the minor version, so subtract a value from the patch value
+        minor = 1
+
+        if patch > 0:
+            patch -= 1
+
+    # Augment the prerelease items (if necessary)
+    augmented_prerelease: list[str] = []
+
+    prerelease_name = prerelease_name or (os.environ if environment is None else environment).get(
+        configuration.prerelease_environment_variable_name
+    )
+    if prerelease_name is not None:
+        augmented_prerelease.append(prerelease_name)
+
+    if (
+        configuration.include_branch_name_when_necessary
+        and include_branch_name_when_necessary
+        and branch_name not in configuration.main_branch_names
+    ):
+        augmented_prerelease.append(branch_name)
+
+    # Augment the metadata items (if necessary)
+    augmented_metadata: list[str] = []
+
+    if configuration.include_timestamp_when_necessary and include_timestamp_when_necessary:
+        now = datetime.now()
+
+        augmented_metadata.append(
+            "{:04d}{:02d}{:02d}{:02d}{:02d}{:02d}".format(
+                now.year,
+                now.month,
+                now.day,
+                now.hour,
+                now.minute,
+                now.second,
+            ),
+        )
+
+    if configuration.include_computer_name_when_necessary and include_computer_name_when_necessary:
+        augmented_metadata.append(platform.node())
+
+    if is_dirty:
+        augmented_metadata.append("working_changes")
+
+    # Combine the elements
+    prerelease = augmented_prerelease + prerelease
+    metadata = augmented_metadata + metadata
+
+    if style == GenerateStyle.Standard:
+        # No changes are necessary
+        pass
+    elif style == GenerateStyle.AllPrerelease:
+        prerelease += metadata
+        metadata = []
+    elif style == GenerateStyle.AllMetadata:
+        metadata = prerelease + metadata
+        prerelease = []
+    else:
+        assert False, style  # pragma: no cover
+
+    # Create the semantic version
+    semver = SemVer(
+        major=major,
+        minor=minor,
+        patch=patch,
+        prerelease=(None if no_prefix else tuple(prerelease)),
+        build=None if no_metadata else tuple(metadata),
+    )
+
+    return GetSemanticVersionResult(
+        configuration.filename,
+        semver,
+        f"{configuration.version_prefix or ''}{semver}",
+    )
+
+
+# ----------------------------------------------------------------------
+def _CreateAdditionalDependencyLookup(
+    repository_root: Path,
+    configuration: Configuration,
+) -> set[str]:
+    """Returns the additional dependencies as posix paths relative to the repository root.
+
+    A file matches when the file itself or one of its ancestors is in the lookup (see `_EnumPathPrefixes`),
+    so the cost is independent of the number of files within dependency directories and files that have
+    since been deleted are matched.
+    """
+
+    additional_dependency_lookup: set[str] = set()
+
+    for additional_dependency in configuration.additional_dependencies:
+        # Files outside of the repository never appear in commits
+        if not PathEx.IsDescendant(additional_dependency, repository_root):
+            continue
+
+        additional_dependency_lookup.add(additional_dependency.relative_to(repository_root).as_posix())
+
+    return additional_dependency_lookup
+
+
+# ----------------------------------------------------------------------
+def _CreateConfigurationCacheKey(
+    configuration_filename: Path,
+) -> Optional[str]:
+    try:
+        stat_result = configuration_filename.stat()
+    except OSError:
+        return None
+
+    if _IsRecentlyModified(stat_result.st_mtime_ns):
+        return None
+
+    return json.dumps([str(configuration_filename), stat_result.st_mtime_ns, stat_result.st_size])
+
+
+# ----------------------------------------------------------------------
+def _CreatePathspecs(
+    repository_root: Path,
+    root_path: Path,
+    configuration: Configuration,
+) -> Optional[list[str]]:
+    """Returns pathspecs that match the files that may impact the configuration (or None if all files may)."""
+
+    if root_path == repository_root:
+        return None
+
+    pathspecs: list[str] = []
+
+    for path in [root_path, *configuration.additional_dependencies]:
+        if not PathEx.IsDescendant(path, repository_root):
+            return None
+
+        # Files in nested configuration roots also match this pathspec; they are excluded when the commits
+        # are processed (excluding them here would prevent git from using Bloom filters).
+        pathspecs.append(":(literal){}".format(path.relative_to(repository_root).as_posix()))
+
+    return pathspecs
+
+
+# ----------------------------------------------------------------------
+def _CreateTagLookup(
+    object_reader: GitEx.ObjectReader,
+    tag_patterns: Optional[list[str]],
+) -> dict[str, list[str]]:
+    """Returns the names of tags associated with each commit hexsha."""
+
+    parents_lookup: dict[str, list[str]] = {}
+
+    # ----------------------------------------------------------------------
+    def GetParents(
+        hexsha: str,
+    ) -> list[str]:
+        parents = parents_lookup.get(hexsha)
+        if parents is None:
+            parents = object_reader.GetParents(hexsha)
+            parents_lookup[hexsha] = parents
+
+        return parents
+
+    # ----------------------------------------------------------------------
+
+    tag_lookup: dict[str, list[str]] = {}
+
+    for tag_record in GitEx.EnumTagRecords(object_reader.working_dir, tag_patterns):
+        # Tags are most often associated with merges into a mainline branch, but we are filtering merges
+        # out when enumerating commits. Therefore, associate the tag with a parent that isn't a merge
+        # commit.
+        parents = GetParents(tag_record.hexsha)
+
+        if len(parents) <= 1:
+            # We are looking at a direct commit to the branch
+            tag_lookup.setdefault(tag_record.hexsha, []).append(tag_record.name)
+            continue
+
+        # We are looking at a merge
+        for parent in parents:
+            if len(GetParents(parent)) == 1:
+                tag_lookup.setdefault(parent, []).append(tag_record.name)
+                break
+
+    return tag_lookup
+
+
+# ----------------------------------------------------------------------
+def _CreateTagPatterns(
+    configuration: Configuration,
+) -> list[str]:
+    """Returns globs that match all of the tags that could match the configuration's version regex."""
+
+    # Escape characters that have special meaning in git's wildmatch
+    prefix = re.sub(r"([\\*?\[\]])", r"\\\1", configuration.version_prefix or "")
+
+    if prefix.endswith("v"):
+        return ["{}[0-9]*".format(prefix)]
+
+    return ["{}[0-9]*".format(prefix), "{}v[0-9]*".format(prefix)]
+
+
+# ----------------------------------------------------------------------
+def _CreateVersionRegex(
+    configuration: Configuration,
+) -> re.Pattern:
+    version_regex_str = (
+        r"(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)(?:-(?P<prerelease>[^\+]+))?(?:\+(?P<metadata>.+))?"
+    )
+
+    if configuration.version_prefix:
+        version_regex_str = r"^{}{}{}$".format(
+            re.escape(configuration.version_prefix),
+            "" if configuration.version_prefix.endswith("v") else "v?",
+            version_regex_str,
+        )
+    else:
+        version_regex_str = r"^v?{}$".format(version_regex_str)
+
+    return re.compile(version_regex_str)
+
+
+# ----------------------------------------------------------------------
+def _EnumCachedLogRecords(
+    working_dir: Path,
+    cache: CommitCache,
+    revisions: list[str],
+    pathspecs: Optional[list[str]],
+) -> Generator[GitEx.LogRecord, None, None]:
+    """Enumerates commits, retrieving information from git only for those commits that are not cached.
+
+    The commit hashes are streamed from a walk that doesn't generate diffs (which is inexpensive). Runs
+    of consecutive cache misses are retrieved with a single `git log` process; the size of these
+    batches grows geometrically so that a cold cache doesn't require a process per commit and a warm
+    cache doesn't retrieve more than necessary when the caller stops iterating early.
+    """
+
+    hexshas = GitEx.EnumNullDelimitedOutput(
+        working_dir,
+        [
+            "log",
+            "-z",
+            "--format=%H",
+            *_WALK_OPTIONS,
+            *(_PATHSPEC_WALK_OPTIONS if pathspecs else []),
+            *revisions,
+            "--",
+            *(pathspecs or []),
+        ],
+    )
+
+    try:
+        batch_size = _INITIAL_CACHE_MISS_BATCH_SIZE
+
+        for token in hexshas:
+            record = cache.Get(token.decode("ascii"))
+            if record is not None:
+                yield record
+                continue
+
+            misses: list[bytes] = [token]
+            next_record: Optional[GitEx.LogRecord] = None
+
+            for token in hexshas:
+                next_record = cache.Get(token.decode("ascii"))
+                if next_record is not None:
+                    break
+
+                misses.append(token)
+
+                if len(misses) == batch_size:
+                    break
+
+            records = list(
+                GitEx.EnumLogRecords(
+                    working_dir,
+                    ["--no-walk=unsorted", "--stdin"],
+                    input=b"\n".join(misses) + b"\n",
+                ),
+            )
+
+            assert [record.hexsha.encode("ascii") for record in records] == misses
+
+            cache.Add(records)
+
+            yield from records
+
+            if next_record is not None:
+                yield next_record
+
+            batch_size = min(batch_size * 2, _MAX_CACHE_MISS_BATCH_SIZE)
+
+    finally:
+        hexshas.close()
+
+
+# ----------------------------------------------------------------------
+def _EnumLogRecordsUntilTerminal(
+    working_dir: Path,
+    cache: Optional[CommitCache],
+    revisions: list[str],
+    pathspecs: Optional[list[str]],
+    tag_lookup: dict[str, list[str]],
+    is_terminal_func: Callable[[GitEx.LogRecord], bool],
+) -> Generator[GitEx.LogRecord, None, None]:
+    """Enumerates commits up to and including the first tagged commit for which `is_terminal_func` returns True.
+
+    The commit hashes are streamed from a walk that doesn't generate diffs (which is inexpensive) and
+    buffered in windows. The tagged commits in a window are retrieved with a single `git log` process
+    while searching for the terminal commit; the window's commits up to the terminal commit (or all of
+    them) are then retrieved with another process (less any cached commits). Windows grow geometrically
+    to a bounded size, so the history isn't walked far beyond a nearby terminal commit, the number of
+    processes doesn't depend on the number of tags, and memory remains bounded when the terminal commit
+    is far away (or doesn't exist).
+    """
+
+    hexshas = GitEx.EnumNullDelimitedOutput(
+        working_dir,
+        [
+            "log",
+            "-z",
+            "--format=%H",
+            *_WALK_OPTIONS,
+            *(_PATHSPEC_WALK_OPTIONS if pathspecs else []),
+            *revisions,
+            "--",
+            *(pathspecs or []),
+        ],
+    )
+
+    # ----------------------------------------------------------------------
+    def LoadRecords(
+        tokens: list[bytes],
+        known_records: dict[bytes, GitEx.LogRecord],
+    ) -> list[GitEx.LogRecord]:
+        results: list[Optional[GitEx.LogRecord]] = []
+        misses: list[bytes] = []
+
+        for token in tokens:
+            record = known_records.get(token)
+
+            if record is None and cache is not None:
+                record = cache.Get(token.decode("ascii"))
+
+            if record is None:
+                misses.append(token)
+
+            results.append(record)
+
+        if misses:
+            records = list(
+                GitEx.EnumLogRecords(
+                    working_dir,
+                    ["--no-walk=unsorted", "--stdin"],
+                    input=b"\n".join(misses) + b"\n",
+                ),
+            )
+
+            assert [record.hexsha.encode("ascii") for record in records] == misses
+
+            if cache is not None:
+                cache.Add(records)
+
+            records_iter = iter(records)
+            results = [record or next(records_iter) for record in results]
+
+        return cast(list[GitEx.LogRecord], results)
+
+    # ----------------------------------------------------------------------
+
+    try:
+        window_size = min(_INITIAL_CACHE_MISS_BATCH_SIZE, _MAX_CACHE_MISS_BATCH_SIZE)
+
+        while True:
+            window = list(itertools.islice(hexshas, window_size))
+            if not window:
+                break
+
+            tagged_tokens = [token for token in window if token.decode("ascii") in tag_lookup]
+            known_records = dict(zip(tagged_tokens, LoadRecords(tagged_tokens, {})))
+
+            for index, token in enumerate(window):
+                record = known_records.get(token)
+
+                if record is not None and is_terminal_func(record):
+                    yield from LoadRecords(window[: index + 1], known_records)
+                    return
+
+            yield from LoadRecords(window, known_records)
+
+            window_size = min(window_size * 2, _MAX_CACHE_MISS_BATCH_SIZE)
+
+    finally:
+        hexshas.close()
+
+
+# ----------------------------------------------------------------------
+def _EnumPathPrefixes(
+    filename: str,
+) -> Generator[str, None, None]:
+    """Enumerates the posix file and its ancestors (in the form used by `_CreateAdditionalDependencyLookup`)."""
+
+    yield filename
+
+    while "/" in filename:
+        filename = filename.rpartition("/")[0]
+        yield filename
+
+    yield "."
+
+
+# ----------------------------------------------------------------------
+def _EnumPosixFilenames(
+    files: Sequence[PurePath],
+) -> Generator[str, None, None]:
+    """Enumerates the files as posix paths, without creating `PurePath` objects for files stored in a `PathTable`."""
+
+    if isinstance(files, PathList):
+        yield from files.EnumStrings()
+    else:
+        yield from (filename.as_posix() for filename in files)
+
+
+# ----------------------------------------------------------------------
+def _ExtractCommitDeltas(
+    dm: DoneManager,
+    commit_delta_extraction_func: Callable[[DoneManager, CommitInfo], Optional[VersionDelta]],
+    commit_infos: list[CommitInfo],
+) -> list[Optional[VersionDelta]]:
+    return [commit_delta_extraction_func(dm, commit_info) for commit_info in commit_infos]
+
+
+# ----------------------------------------------------------------------
+def _ExtractVersionFromTags(
+    version_regex: re.Pattern,
+    tags: list[str],
+) -> Optional[VersionDelta]:
+    for tag in tags:
+        match = version_regex.search(tag)
+        if match is None:
+            continue
+
+        return VersionDelta(
+            int(match.group("major")),
+            int(match.group("minor")),
+            int(match.group("patch")),
+            match.group("prerelease"),
+            match.group("metadata"),
+        )
+
+    return None
+
+
+# ----------------------------------------------------------------------
+def _FormatCount(
+    noun: str,
+    count: int,
+) -> str:
+    # This produces the same output as `inflect.no` for the regular nouns used in this module (inflect is
+    # expensive to import).
+    if count == 0:
+        return "no {}s".format(noun)
+
+    return "{} {}{}".format(count, noun, "" if count == 1 else "s")
+
+
+# ----------------------------------------------------------------------
+def _GetBranchName(
+    status: GitEx.Status,
+) -> str:
+    return status.branch_name or "<detached head>"
+
+
+# ----------------------------------------------------------------------
+def _GetConfigurationValidator() -> Any:
+    global _configuration_validator  # pylint: disable=global-statement
+
+    validator = _configuration_validator
+    if validator is not None:
+        return validator
+
+    with _configuration_validator_lock:
+        if _configuration_validator is not None:
+            return _configuration_validator
+
+        # Load the schema
+        schema_filename = Path(__file__).parent / "AutoGitSemVerSchema.json"
+        if not schema_filename.is_file():
+            raise Exception("The filename '{}' does not exist.".format(schema_filename))  # pragma: no cover
+
+        with schema_filename.open() as f:
+            schema_content = json.load(f)
+
+        # Create the configuration validator. The special class is augmented to apply defaults to the
+        # configuration. This code is based on https://python-jsonschema.readthedocs.io/en/latest/faq/
+        from jsonschema import Draft202012Validator, validators  # type: ignore [import-untyped]  # pylint: disable=import-outside-toplevel
+
+        validator_class = Draft202012Validator
+        validate_properties = validator_class.VALIDATORS["properties"]
+
+        # ----------------------------------------------------------------------
+        def SetDefaults(validator, properties, instance, schema):
+            for prop, sub_schema in properties.items():
+                default_schema = sub_schema.get("default", None)
+                if default_schema is not None:
+                    # The schema is shared across calls, so mutable defaults must not be shared with
+                    # the configuration.
+                    instance.setdefault(prop, copy.deepcopy(default_schema))
+
+                for error in validate_properties(validator, properties, instance, schema):
+                    yield error
+
+        # ----------------------------------------------------------------------
+
+        _configuration_validator = validators.extend(validator_class, {"properties": SetDefaults})(
+            schema_content
+        )
+
+        return _configuration_validator
+
+
+# ----------------------------------------------------------------------
+def _GetExtractorId(
+    func: Callable,
+) -> Optional[str]:
+    """Returns a value that identifies the extraction function across invocations, or None if the function can't be identified reliably."""
+
+    # Partials, callable instances, and bound methods carry state that isn't reflected in their names
+    if not isinstance(func, types.FunctionType):
+        return None
+
+    # Lambdas and nested functions share names within a scope, and closures capture state
+    if func.__closure__ is not None or "<" in func.__qualname__:
+        return None
+
+    return "{}.{}".format(func.__module__, func.__qualname__)
+
+
+# ----------------------------------------------------------------------
+def _GetInitialVersion(
+    configuration: Configuration,
+) -> VersionDelta:
+    return VersionDelta(
+        configuration.initial_version.major or 0,
+        configuration.initial_version.minor or 0,
+        configuration.initial_version.patch or 0,
+        None,
+        None,
+    )
+
+
+# ----------------------------------------------------------------------
+def _GetModifiedTime(
+    path: Path,
+) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+# ----------------------------------------------------------------------
+def _GetRepositoryMetadataState(
+    git_dir: Path,
+    common_dir: Path,
+) -> list[tuple[str, int, int, int]]:
+    """Returns file system information that changes when HEAD, the index, or any ref is modified.
+
+    git updates these files by writing a lock file and renaming it, so the inode changes with every update
+    (even when the modified time does not, due to its limited resolution).
+    """
+
+    filenames: list[Path] = [git_dir / "HEAD", git_dir / "index", common_dir / "packed-refs"]
+
+    for root, _, refs_filenames in os.walk(common_dir / "refs"):
+        root_path = Path(root)
+
+        filenames += (root_path / refs_filename for refs_filename in refs_filenames)
+
+    state: list[tuple[str, int, int, int]] = []
+
+    for filename in filenames:
+        try:
+            stat_result = filename.stat()
+        except OSError:
+            continue
+
+        state.append((str(filename), stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size))
+
+    return state
+
+
+# ----------------------------------------------------------------------
+def _GetSemanticVersionImpl(
+    dm: DoneManager,
+    path: Path,
+    *,
+    prerelease_name: Optional[str],
+    include_branch_name_when_necessary: bool,
+    include_timestamp_when_necessary: bool,
+    include_computer_name_when_necessary: bool,
+    no_prefix: bool,
+    no_metadata: bool,
+    configuration_filenames: Optional[list[str]],
+    style: GenerateStyle,
+    commit_delta_extraction_func: Callable[
+        [
+            DoneManager,
+            CommitInfo,
+        ],
+        Optional[VersionDelta],  # None indicates that the commit does not impact the version
+    ],
+    commit_delta_batch_extraction_func: Optional[
+        Callable[
+            [list[CommitInfo]],
+            list[Optional[VersionDelta]],  # None indicates that the commit does not impact the version
+        ]
+    ],
+    executor: Optional[Executor],
+    use_checkpoints: bool,
+    extractor_id: Optional[str],
+    use_pathspecs: bool,
+    use_cache: bool,
+    environment: Optional[Mapping[str, str]],
+    memory_checkpoint_store: Optional["_MemoryStore"],
+) -> GetSemanticVersionResult:
+    """Implements `GetSemanticVersion`; checkpoints are saved in `memory_checkpoint_store` (when provided) rather than in the repository's git directory."""
+
+    configuration_filenames = configuration_filenames or DEFAULT_CONFIGURATION_FILENAMES
+
+    repository_root = GetGitRoot(path)
+    if repository_root is None:
+        raise Exception("'{}' does not appear to be a git repository.".format(path))
+
+    import git  # pylint: disable=import-outside-toplevel
+
+    repo = git.Repo(repository_root)
+
+    configuration_store = (
+        JsonStore.Open(Path(repo.common_dir), "configurations", _CONFIGURATION_VERSION) if use_cache else None
+    )
+
+    # Get the most applicable configuration
+    configuration: Optional[Configuration] = None
+
+    # ----------------------------------------------------------------------
+    def DisplayConfiguration() -> str:
+        if configuration is None:
+            return "configuration errors were encountered"
+
+        if configuration.filename is None:
+            return "default configuration info will be used"
+
+        return "configuration info found at '{}'".format(configuration.filename)
+
+    # ----------------------------------------------------------------------
+
+    with (
+        dm.Nested(
+            "Loading AutoGitSemVer configuration...",
+            DisplayConfiguration,
+        ),
+        Profiler.Phase("load_configuration"),
+    ):
+        configuration = GetConfiguration(
+            path,
+            configuration_filenames,
+            use_cache=use_cache,
+            store=configuration_store,
+        )
+
+    changes_processed: int = 0
+    version_deltas: list[VersionDelta] = []
+    version_delta_commits: list[Optional[str]] = []
+    num_checkpoint_version_deltas: int = 0
+
+    with (
+        dm.Nested(
+            "Enumerating changes...",
+            [
+                lambda: "{} processed".format(_FormatCount("change", changes_processed)),
+                lambda: "{} applied [{:.02f}%]".format(
+                    _FormatCount("change", len(version_deltas) - num_checkpoint_version_deltas),
+                    0
+                    if changes_processed == 0
+                    else (((len(version_deltas) - num_checkpoint_version_deltas) / changes_processed) * 100),
+                ),
+                lambda: (
+                    "{} reused from the checkpoint".format(
+                        _FormatCount("change", num_checkpoint_version_deltas)
+                    )
+                    if num_checkpoint_version_deltas
+                    else None
+                ),
+            ],
+            # Clear the progress status when complete
+            preserve_status=False,
+        ) as enumerate_dm,
+        Profiler.Phase("enumerate_changes"),
+        GitEx.ObjectReader(repository_root) as object_reader,
+    ):
+        root_path = configuration.filename.parent if configuration.filename else repository_root
+
+        additional_dependency_lookup = _CreateAdditionalDependencyLookup(repository_root, configuration)
+
+        # The status is used for the entire run, as it is expensive to calculate for large repositories
+        with Profiler.Phase("status"):
+            status = GitEx.GetStatus(repository_root)
+
+        # Ownership is resolved with an index of the committed configuration files (rather than by
+        # searching for configuration files on the file system) as commits may modify many files and
+        # configuration files may not be on disk in sparse checkouts. Configuration files in the working
+        # tree that haven't been committed are included so that ownership matches `GetSemanticVersions`.
+        with Profiler.Phase("configuration_index"):
+            configuration_index = ConfigurationIndex.FromTree(
+                repository_root,
+                configuration_filenames,
+                additional_filenames=[configuration.filename] if configuration.filename else None,
+                include_working_tree=True,
+                store=(
+                    JsonStore.Open(
+                        Path(repo.common_dir),
+                        "configuration_indexes",
+                        _CONFIGURATION_INDEX_VERSION,
+                    )
+                    if use_cache
+                    else None
+                ),
+                object_reader=object_reader,
+            )
+
+        version_regex = _CreateVersionRegex(configuration)
+
+        # ----------------------------------------------------------------------
+        def IsVersionTagged(
+            commit: CommitInfo,
+        ) -> bool:
+            return ShouldProcess(commit) and _ExtractVersionFromTags(version_regex, commit.tags) is not None
+
+        # ----------------------------------------------------------------------
+
+        enum_commits_kwargs: dict[str, Any] = {
+            # Tags that can't possibly contain a version are filtered out by git
+            "tag_patterns": _CreateTagPatterns(configuration),
+            "object_reader": object_reader,
+            "status": status,
+            "use_cache": use_cache,
+            # Enumeration stops at the nearest version tag, so information about the commits that precede
+            # it isn't retrieved.
+            "is_terminal_commit_func": IsVersionTagged,
+        }
+
+        if use_pathspecs:
+            pathspecs = _CreatePathspecs(repository_root, root_path, configuration)
+            if pathspecs is not None:
+                enum_commits_kwargs["pathspecs"] = pathspecs
+
+        # ----------------------------------------------------------------------
+        def ShouldProcess(
+            commit: CommitInfo,
+        ) -> bool:
+            with Profiler.Phase("should_process"):
+                for filename in _EnumPosixFilenames(commit.files):
+                    if configuration_index.GetConfigurationRootFromString(filename) == root_path or (
+                        additional_dependency_lookup
+                        and any(
+                            prefix in additional_dependency_lookup for prefix in _EnumPathPrefixes(filename)
+                        )
+                    ):
+                        return True
+
+                return False
+
+        # ----------------------------------------------------------------------
+
+        configuration_initial_version = _GetInitialVersion(configuration)
+
+        initial_version = configuration_initial_version
+
+        # ----------------------------------------------------------------------
+        def EnumerateChanges(
+            revisions: Optional[list[str]],
+            checkpoint: Optional[_Checkpoint],
+        ) -> bool:
+            """Returns False if the changes modify configuration files and the checkpoint can't be used."""
+
+            nonlocal changes_processed, num_checkpoint_version_deltas, initial_version, is_tagged
+            nonlocal base_tag, base_commit, modifies_working_configuration
+
+            changes_processed = 0
+            num_checkpoint_version_deltas = 0
+            version_deltas.clear()
+            version_delta_commits.clear()
+            working_version_deltas.clear()
+
+            initial_version = configuration_initial_version
+            is_tagged = False
+            base_tag = None
+            base_commit = None
+
+            kwargs = dict(enum_commits_kwargs)
+
+            if revisions is not None:
+                kwargs["revisions"] = revisions
+
+            delta_extractor = _CommitDeltaExtractor(
+                enumerate_dm,
+                commit_delta_extraction_func,
+                commit_delta_batch_extraction_func,
+                executor,
+            )
+
+            # ----------------------------------------------------------------------
+            def ApplyDeltas(
+                results: list[tuple[CommitInfo, Any, Optional[VersionDelta]]],
+            ) -> None:
+                for commit, _, delta_applied in results:
+                    # Nested output is expensive to create, so only create it when it will be displayed
+                    if enumerate_dm.is_verbose:
+                        with enumerate_dm.VerboseNested(
+                            "Processing '{}' ({})".format(commit.id, commit.author_date),
+                            lambda delta_applied=delta_applied: str(delta_applied) if delta_applied else None,
+                        ):
+                            pass
+
+                    if delta_applied is None:
+                        continue
+
+                    if commit.id == CommitInfo.WORKING_CHANGES_COMMIT_ID:
+                        working_version_deltas.append(delta_applied)
+
+                    version_deltas.append(delta_applied)
+                    version_delta_commits.append(commit.id)
+
+            # ----------------------------------------------------------------------
+
+            progress = _ProgressReporter(enumerate_dm)
+
+            for commit in EnumCommits(repo, **kwargs):
+                if any(
+                    filename.rpartition("/")[2] in configuration_filenames
+                    for filename in _EnumPosixFilenames(commit.files)
+                ):
+                    if commit.id == CommitInfo.WORKING_CHANGES_COMMIT_ID:
+                        modifies_working_configuration = True
+
+                    if checkpoint is not None:
+                        return False
+
+                changes_processed += 1
+                progress.Update(changes_processed, len(version_deltas))
+
+                if not ShouldProcess(commit):
+                    continue
+
+                tag_version = _ExtractVersionFromTags(version_regex, commit.tags)
+                if tag_version is not None:
+                    # Apply the deltas of the commits that precede the tagged commit
+                    ApplyDeltas(delta_extractor.Flush())
+
+                    with enumerate_dm.VerboseNested(
+                        "Processing '{}' ({})".format(commit.id, commit.author_date),
+                        lambda tag_version=tag_version: str(tag_version),
+                    ):
+                        initial_version = tag_version
+                        is_tagged = True
+
+                        base_tag = next(tag for tag in commit.tags if version_regex.search(tag) is not None)
+                        base_commit = commit.id
+
+                    break
+
+                ApplyDeltas(delta_extractor.Add(commit, None))
+
+            ApplyDeltas(delta_extractor.Flush())
+
+            if checkpoint is not None and not is_tagged:
+                initial_version = checkpoint.initial_version
+                base_tag = checkpoint.base_tag
+                base_commit = checkpoint.base_commit
+
+                version_deltas.extend(checkpoint.version_deltas)
+                version_delta_commits.extend([None] * len(checkpoint.version_deltas))
+
+                num_checkpoint_version_deltas = len(checkpoint.version_deltas)
+
+            return True
+
+        # ----------------------------------------------------------------------
+
+        is_tagged = False
+        base_tag: Optional[str] = None
+        base_commit: Optional[str] = None
+        modifies_working_configuration = False
+        working_version_deltas: list[VersionDelta] = []
+
+        # The extraction function doesn't need to be identified when checkpoints are kept in memory, as the
+        # store is only used with a single function.
+        if use_checkpoints and extractor_id is None and memory_checkpoint_store is None:
+            extractor_id = _GetExtractorId(commit_delta_batch_extraction_func or commit_delta_extraction_func)
+
+            if extractor_id is None:
+                enumerate_dm.WriteInfo(
+                    "Checkpoints will not be used because the commit delta extraction function can't be identified reliably; provide 'extractor_id' to use checkpoints with this function.\n",
+                )
+
+                use_checkpoints = False
+
+        if not use_checkpoints:
+            EnumerateChanges(None, None)
+        else:
+            if status.head is None:
+                raise Exception("'{}' does not have any commits.".format(repository_root))
+
+            head = status.head
+            tags_fingerprint = GitEx.GetRefsFingerprint(repository_root, "refs/tags")
+
+            checkpoint_key = json.dumps(
+                [
+                    configuration.filename.relative_to(repository_root).as_posix()
+                    if configuration.filename
+                    else None,
+                    hashlib.sha256(configuration.filename.read_bytes()).hexdigest()
+                    if configuration.filename
+                    else None,
+                    configuration_filenames,
+                    # Changes to committed configuration files invalidate the checkpoint when they are
+                    # enumerated, but uncommitted configuration files also change the ownership of changes.
+                    configuration_index.uncommitted_filenames,
+                    extractor_id,
+                ],
+            )
+
+            checkpoint_store: Optional[JsonStore | _MemoryStore] = (
+                memory_checkpoint_store
+                if memory_checkpoint_store is not None
+                else JsonStore.Open(Path(repo.common_dir), "checkpoints", _CHECKPOINT_VERSION)
+            )
+
+            with Profiler.Phase("checkpoint"):
+                checkpoint = _LoadCheckpoint(
+                    repository_root,
+                    checkpoint_store,
+                    checkpoint_key,
+                    head,
+                    tags_fingerprint,
+                )
+
+            if checkpoint is None or not EnumerateChanges([head, "^{}".format(checkpoint.head)], checkpoint):
+                Profiler.Increment("checkpoint.misses")
+                EnumerateChanges([head], None)
+            else:
+                Profiler.Increment("checkpoint.hits")
+
+            if checkpoint_store is not None and not modifies_working_configuration:
+                checkpoint_store.Save(
+                    checkpoint_key,
+                    asdict(
+                        _Checkpoint(
+                            head,
+                            tags_fingerprint,
+                            initial_version,
+                            base_tag,
+                            base_commit,
+                            # The checkpoint is based on HEAD, so don't include working changes
+                            version_deltas[len(working_version_deltas) :],
+                        ),
+                    ),
+                )
+
+        Profiler.Increment("commits.scanned", changes_processed)
+        Profiler.Increment("commits.applied", len(version_deltas) - num_checkpoint_version_deltas)
+        Profiler.Increment("commits.reused_from_checkpoint", num_checkpoint_version_deltas)
+
+    with (
+        dm.Nested("Calculating semantic version...") as calculate_dm,
+        Profiler.Phase("calculate_version"),
+    ):
+        result = _CalculateSemanticVersion(
+            configuration,
+            initial_version,
+            version_deltas,
+            prerelease_name=prerelease_name,
+            include_branch_name_when_necessary=include_branch_name_when_necessary,
+            include_timestamp_when_necessary=include_timestamp_when_necessary,
+            include_computer_name_when_necessary=include_computer_name_when_necessary,
+            no_prefix=no_prefix,
+            no_metadata=no_metadata,
+            style=style,
+            branch_name=_GetBranchName(status),
+            is_dirty=status.is_dirty,
+            environment=environment,
+        )
+
+        calculate_dm.WriteLine(result.semantic_version_string)
+
+    return replace(
+        result,
+        trace=GetSemanticVersionTrace(
+            initial_version,
+            base_tag,
+            base_commit,
+            changes_processed,
+            len(version_deltas) - num_checkpoint_version_deltas,
+            num_checkpoint_version_deltas,
+            list(zip(version_delta_commits, version_deltas)),
+        ),
+    )
+
+
+# ----------------------------------------------------------------------
+def _IsRecentlyModified(
+    modified_time: int,
+) -> bool:
+    # Modified times have a limited resolution, so an item modified again within that resolution may
+    # retain the same modified time; recently modified items are not cached (this is the same strategy
+    # git uses to detect "racily clean" index entries).
+    return time.time_ns() - modified_time < _RECENTLY_MODIFIED_THRESHOLD_NS
+
+
+# ----------------------------------------------------------------------
+def _LoadCachedConfigurationContent(
+    cache_key: str,
+    store: Optional[JsonStore],
+) -> Optional[dict[str, Any]]:
+    with _configuration_cache_lock:
+        content = _configuration_content_cache.get(cache_key)
+        if content is not None:
+            _configuration_content_cache.move_to_end(cache_key)
+            return content
+
+    if store is None:
+        return None
+
+    content = store.Load(cache_key)
+    if not isinstance(content, dict):
+        return None
+
+    # Content in the store was validated before it was saved
+    _SaveCachedConfigurationContent(cache_key, content, None)
+
+    return content
+
+
+# ----------------------------------------------------------------------
+def _LoadCheckpoint(
+    repository_root: Path,
+    checkpoint_store: Optional[JsonStore | _MemoryStore],
+    checkpoint_key: str,
+    head: str,
+    tags_fingerprint: str,
+) -> Optional[_Checkpoint]:
+    if checkpoint_store is None:
+        return None
+
+    content = checkpoint_store.Load(checkpoint_key)
+    if content is None:
+        return None
+
+    try:
+        checkpoint = _Checkpoint(
+            content["head"],
+            content["tags_fingerprint"],
+            VersionDelta(**content["initial_version"]),
+            content["base_tag"],
+            content["base_commit"],
+            [VersionDelta(**version_delta) for version_delta in content["version_deltas"]],
+        )
+    except (KeyError, TypeError):
+        return None
+
+    if checkpoint.tags_fingerprint != tags_fingerprint:
+        return None
+
+    if checkpoint.head != head:
+        if not GitEx.IsAncestor(repository_root, checkpoint.head, head):
+            return None
+
+        # The commits enumerated in a full walk are only the new commits followed by the checkpoint's
+        # commits when the new commits are linear; merges bring in commits (and tags) that the walk may
+        # reach before those reflected in the checkpoint.
+        if GitEx.ContainsMerges(repository_root, [head, "^{}".format(checkpoint.head)]):
+            return None
+
+    return checkpoint
+
+
+# ----------------------------------------------------------------------
+def _SaveCachedConfigurationContent(
+    cache_key: str,
+    content: dict[str, Any],
+    store: Optional[JsonStore],
+) -> None:
+    with _configuration_cache_lock:
+        _configuration_content_cache[cache_key] = content
+        _configuration_content_cache.move_to_end(cache_key)
+
+        while len(_configuration_content_cache) > _MAX_NUM_CACHED_CONFIGURATIONS:
+            _configuration_content_cache.popitem(last=False)
+
+    if store is not None:
+        store.Save(cache_key, content)
@@ -0,0 +1,164 @@
+# ----------------------------------------------------------------------
+# |
+# |  PathTable.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 21:36:18
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains compact storage for the files modified by many commits.
+
+Most commits in a large history modify files that are also modified by other commits. Each unique path is
+stored once in a table and commits reference paths by integer id. `PurePath` objects are only created
+when a path is accessed, and are then shared by all of the commits that reference the path.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import PurePath
+from typing import Optional, overload
+
+
+# ----------------------------------------------------------------------
+class PathTable:
+    """Interns paths so that the paths associated with many commits share storage."""
+
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+        self._strings: list[str] = []
+        self._paths: list[Optional[PurePath]] = []
+
+    # ----------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    # ----------------------------------------------------------------------
+    def CreateList(
+        self,
+        filenames: Iterable[str],
+    ) -> "PathList":
+        """Returns a list of paths stored in the table."""
+
+        ids = array("I")
+
+        for filename in filenames:
+            path_id = self._ids.get(filename)
+
+            if path_id is None:
+                path_id = len(self._strings)
+
+                self._ids[filename] = path_id
+                self._strings.append(filename)
+                self._paths.append(None)
+
+            ids.append(path_id)
+
+        return PathList(self, ids)
+
+    # ----------------------------------------------------------------------
+    def GetString(
+        self,
+        path_id: int,
+    ) -> str:
+        """Returns the path associated with the id as a string."""
+
+        return self._strings[path_id]
+
+    # ----------------------------------------------------------------------
+    def GetPath(
+        self,
+        path_id: int,
+    ) -> PurePath:
+        """Returns the path associated with the id, creating it if necessary."""
+
+        path = self._paths[path_id]
+
+        if path is None:
+            path = PurePath(self._strings[path_id])
+            self._paths[path_id] = path
+
+        return path
+
+
+# ----------------------------------------------------------------------
+class PathList(Sequence[PurePath]):
+    """Immutable list of paths stored in a `PathTable`; compares equal to any sequence of the same paths."""
+
+    __slots__ = ("_ids", "_table")
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        table: PathTable,
+        ids: array,
+    ):
+        self._table = table
+        self._ids = ids
+
+    # ----------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    # ----------------------------------------------------------------------
+    @overload
+    def __getitem__(self, index: int) -> PurePath: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PathList": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PathList(self._table, self._ids[index])
+
+        return self._table.GetPath(self._ids[index])
+
+    # ----------------------------------------------------------------------
+    def __iter__(self) -> Iterator[PurePath]:
+        for path_id in self._ids:
+            yield self._table.GetPath(path_id)
+
+    # ----------------------------------------------------------------------
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PathList) and other._table is self._table:  # pylint: disable=protected-access
+            return other._ids == self._ids  # pylint: disable=protected-access
+
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    # ----------------------------------------------------------------------
+    __hash__ = None  # type: ignore [assignment]
+
+    # ----------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return "PathList({!r})".format(list(self))
+
+    # ----------------------------------------------------------------------
+    def __reduce__(self):
+        # Don't pickle the entire table
+        return _CreatePathList, ([self._table.GetString(path_id) for path_id in self._ids],)
+
+    # ----------------------------------------------------------------------
+    def EnumStrings(self) -> Iterator[str]:
+        """Enumerates the paths as strings (without creating `PurePath` objects)."""
+
+        for path_id in self._ids:
+            yield self._table.GetString(path_id)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _CreatePathList(
+    filenames: list[str],
+) -> PathList:
+    return PathTable().CreateList(filenames)
@@ -0,0 +1,310 @@
+# ----------------------------------------------------------------------
+# |
+# |  Profiler.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 22:58:26
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains lightweight instrumentation for the phases of generating semantic versions.
+
+Information is only recorded while a `Profile` is active in the current context; otherwise, `Phase` and
+`Increment` return immediately, so instrumentation can remain in hot paths. Phases are nested based on
+the phases active in the current context (for example, "enumerate_changes/status").
+"""
+
+import contextlib
+import contextvars
+import threading
+import time
+
+from dataclasses import dataclass
+from typing import Any, ContextManager, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing_extensions import Self  # pragma: no cover
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Types
+# |
+# ----------------------------------------------------------------------
+@dataclass
+class PhaseInfo:
+    """Information about a phase, accumulated across all of the times that it was entered."""
+
+    num_calls: int = 0
+    wall_time: float = 0.0  # Seconds
+    cpu_time: float = 0.0  # Seconds (for the thread that entered the phase)
+
+
+# ----------------------------------------------------------------------
+class Profile:
+    """Records phase times and counters for operations performed while it is active."""
+
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        self.phases: dict[str, PhaseInfo] = {}
+        self.counters: dict[str, int] = {}
+
+        self.wall_time: float = 0.0
+
+        self._lock = threading.Lock()
+
+        self._token: Optional[contextvars.Token] = None
+        self._start_time: Optional[float] = None
+
+    # ----------------------------------------------------------------------
+    def __enter__(self) -> "Self":
+        assert self._token is None
+
+        self._token = _active_profile.set(self)
+        self._start_time = time.perf_counter()
+
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args, **kwargs) -> None:
+        assert self._token is not None
+        assert self._start_time is not None
+
+        self.wall_time += time.perf_counter() - self._start_time
+
+        _active_profile.reset(self._token)
+
+        self._token = None
+        self._start_time = None
+
+    # ----------------------------------------------------------------------
+    def GetCacheHitRates(self) -> dict[str, float]:
+        """Returns the hit rate of each cache, based on the '<name>.hits' and '<name>.misses' counters."""
+
+        results: dict[str, float] = {}
+
+        for counter_name in self.counters:
+            if not counter_name.endswith(".hits") and not counter_name.endswith(".misses"):
+                continue
+
+            cache_name = counter_name.rsplit(".", 1)[0]
+            if cache_name in results:
+                continue
+
+            hits = self.counters.get("{}.hits".format(cache_name), 0)
+            misses = self.counters.get("{}.misses".format(cache_name), 0)
+
+            results[cache_name] = hits / (hits + misses) if hits + misses else 0.0
+
+        return results
+
+    # ----------------------------------------------------------------------
+    def ToJson(self) -> dict[str, Any]:
+        """Returns the profile in a form that can be serialized as JSON."""
+
+        return {
+            "wall_time": self.wall_time,
+            "phases": {
+                name: {
+                    "num_calls": phase_info.num_calls,
+                    "wall_time": phase_info.wall_time,
+                    "cpu_time": phase_info.cpu_time,
+                }
+                for name, phase_info in self.phases.items()
+            },
+            "counters": dict(self.counters),
+            "cache_hit_rates": self.GetCacheHitRates(),
+        }
+
+    # ----------------------------------------------------------------------
+    def ToTable(self) -> str:
+        """Returns the profile as a table suitable for display."""
+
+        lines: list[str] = []
+
+        name_width = max([len("Phase"), *(len(name) for name in self.phases)])
+
+        lines.append(
+            "{:<{}}  {:>8}  {:>12}  {:>12}  {:>7}".format(
+                "Phase",
+                name_width,
+                "Calls",
+                "Wall (ms)",
+                "CPU (ms)",
+                "Wall %",
+            ),
+        )
+        lines.append("{}  {}  {}  {}  {}".format("-" * name_width, "-" * 8, "-" * 12, "-" * 12, "-" * 7))
+
+        for name, phase_info in self.phases.items():
+            lines.append(
+                "{:<{}}  {:>8}  {:>12.2f}  {:>12.2f}  {:>6.1f}%".format(
+                    name,
+                    name_width,
+                    phase_info.num_calls,
+                    phase_info.wall_time * 1000,
+                    phase_info.cpu_time * 1000,
+                    (phase_info.wall_time / self.wall_time * 100) if self.wall_time else 0.0,
+                ),
+            )
+
+        lines.append("{:<{}}  {:>8}  {:>12.2f}".format("<total>", name_width, "", self.wall_time * 1000))
+
+        if self.counters:
+            counter_width = max(len(name) for name in self.counters)
+
+            lines.append("")
+
+            for name, value in self.counters.items():
+                lines.append("{:<{}}  {:>12}".format(name, counter_width, value))
+
+        cache_hit_rates = self.GetCacheHitRates()
+
+        if cache_hit_rates:
+            cache_width = max(len(name) for name in cache_hit_rates)
+
+            lines.append("")
+
+            for name, hit_rate in cache_hit_rates.items():
+                lines.append("{:<{}}  {:>11.1f}% hits".format(name, cache_width, hit_rate * 100))
+
+        return "\n".join(lines)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _StartPhase(
+        self,
+        name: str,
+    ) -> None:
+        # Phases are added when they are first entered (rather than when they are exited) so that they
+        # are displayed in the order in which they started, with parents before their children.
+        with self._lock:
+            if name not in self.phases:
+                self.phases[name] = PhaseInfo()
+
+    # ----------------------------------------------------------------------
+    def _EndPhase(
+        self,
+        name: str,
+        wall_time: float,
+        cpu_time: float,
+    ) -> None:
+        with self._lock:
+            phase_info = self.phases[name]
+
+            phase_info.num_calls += 1
+            phase_info.wall_time += wall_time
+            phase_info.cpu_time += cpu_time
+
+    # ----------------------------------------------------------------------
+    def _Increment(
+        self,
+        name: str,
+        value: int,
+    ) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def GetActiveProfile() -> Optional[Profile]:
+    """Returns the profile active in the current context (if any)."""
+
+    return _active_profile.get()
+
+
+# ----------------------------------------------------------------------
+def Phase(
+    name: str,
+) -> ContextManager[None]:
+    """Returns a context manager that records the time spent in the phase (when a profile is active)."""
+
+    profile = _active_profile.get()
+    if profile is None:
+        return _null_context
+
+    return _PhaseContext(profile, name)
+
+
+# ----------------------------------------------------------------------
+def Increment(
+    name: str,
+    value: int = 1,
+) -> None:
+    """Increments the counter (when a profile is active)."""
+
+    profile = _active_profile.get()
+    if profile is None:
+        return
+
+    profile._Increment(name, value)  # pylint: disable=protected-access
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+class _PhaseContext:
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        profile: Profile,
+        name: str,
+    ):
+        parent_name = _active_phase_name.get()
+
+        self._profile = profile
+        self._name = name if parent_name is None else "{}/{}".format(parent_name, name)
+
+        self._token: Optional[contextvars.Token] = None
+        self._start_wall_time = 0.0
+        self._start_cpu_time = 0.0
+
+    # ----------------------------------------------------------------------
+    def __enter__(self) -> None:
+        self._token = _active_phase_name.set(self._name)
+
+        self._profile._StartPhase(self._name)  # pylint: disable=protected-access
+
+        self._start_wall_time = time.perf_counter()
+        self._start_cpu_time = time.thread_time()
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args, **kwargs) -> None:
+        wall_time = time.perf_counter() - self._start_wall_time
+        cpu_time = time.thread_time() - self._start_cpu_time
+
+        assert self._token is not None
+        _active_phase_name.reset(self._token)
+
+        self._profile._EndPhase(self._name, wall_time, cpu_time)  # pylint: disable=protected-access
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_active_profile: contextvars.ContextVar[Optional[Profile]] = contextvars.ContextVar(
+    "active_profile",
+    default=None,
+)
+
+_active_phase_name: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "active_phase_name",
+    default=None,
+)
+
+_null_context = contextlib.nullcontext()
@@ -0,0 +1,485 @@
+# ----------------------------------------------------------------------
+# |
+# |  Server.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 19:24:51
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Contains a long-running server that generates semantic versions for requests received over a Unix domain socket.
+
+Every invocation of the command line tool pays for process startup, imports, and configuration loading
+before any history is enumerated. The server pays these costs once and keeps its in-process caches warm
+across requests for any number of repositories. Requests are processed with the client's arguments
+(including whether checkpoints are used), so the results are the same as those generated by the client.
+
+Nothing is cached based on watching the repository, as results must reflect working changes (which don't
+modify HEAD, refs, or the index). Instead, every request takes a new status snapshot and checkpoints are
+validated against HEAD and the repository's tags (see `Lib.GetSemanticVersion`).
+
+The client's environment isn't sent with the request; the server asks the client for the values of the
+environment variables that it reads while processing the request (which are only those used to determine
+the prerelease name).
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+
+from dataclasses import dataclass
+from io import StringIO
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Mapping, Optional, TYPE_CHECKING
+
+from dbrownell_Common.Streams.DoneManager import DoneManager, Flags as DoneManagerFlags  # type: ignore [import-untyped]
+from semantic_version import Version as SemVer  # type: ignore [import-untyped]
+
+from AutoGitSemVer.Lib import GenerateStyle, GetGitRoot, GetSemanticVersion, GetSemanticVersionResult
+
+if TYPE_CHECKING:
+    from typing_extensions import Self  # pragma: no cover
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Data
+# |
+# ----------------------------------------------------------------------
+SOCKET_ENVIRONMENT_VARIABLE_NAME = "AUTO_GIT_SEM_VER_SERVER_SOCKET"
+
+PROTOCOL_VERSION = 2
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Types
+# |
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class GenerateResponse:
+    """Response to a Generate request."""
+
+    result: int
+    output: str
+
+    semantic_version_result: Optional[GetSemanticVersionResult]
+
+
+# ----------------------------------------------------------------------
+class Server:
+    """Generates semantic versions for requests received over a Unix domain socket."""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        socket_filename: Optional[Path] = None,
+    ):
+        if not IsSupported():
+            raise Exception("Unix domain sockets are not supported on this platform.")  # pragma: no cover
+
+        self.socket_filename = socket_filename or GetDefaultSocketFilename()
+
+        self._server: Optional[_UnixStreamServer] = None
+
+        self._repository_locks: dict[Path, threading.Lock] = {}
+        self._repository_locks_lock = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    def __enter__(self) -> "Self":
+        self.Open()
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args, **kwargs) -> None:
+        self.Close()
+
+    # ----------------------------------------------------------------------
+    def Open(self) -> None:
+        """Binds the socket."""
+
+        assert self._server is None
+
+        if self.socket_filename.exists():
+            connection = _Connect(self.socket_filename)
+            if connection is not None:
+                connection.close()
+                raise Exception("A server is already running at '{}'.".format(self.socket_filename))
+
+            # The socket was left behind by a server that did not exit cleanly
+            self.socket_filename.unlink()
+
+        # Only the current user is able to connect to the socket
+        previous_umask = os.umask(0o177)
+
+        try:
+            self._server = _UnixStreamServer(str(self.socket_filename), _RequestHandler, self)
+        finally:
+            os.umask(previous_umask)
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        """Closes the socket."""
+
+        if self._server is None:
+            return
+
+        self._server.server_close()
+        self._server = None
+
+        self.socket_filename.unlink(missing_ok=True)
+
+    # ----------------------------------------------------------------------
+    def ServeForever(self) -> None:
+        """Processes requests until `Shutdown` is called (from a different thread)."""
+
+        assert self._server is not None
+        self._server.serve_forever()
+
+    # ----------------------------------------------------------------------
+    def Shutdown(self) -> None:
+        """Stops a server that is running `ServeForever`."""
+
+        assert self._server is not None
+        self._server.shutdown()
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _ProcessRequest(
+        self,
+        request: Any,
+        environment: Mapping[str, str],
+    ) -> dict[str, Any]:
+        if not isinstance(request, dict) or request.get("version") != PROTOCOL_VERSION:
+            raise Exception("The request is not a valid version {} request.".format(PROTOCOL_VERSION))
+
+        command = request.get("command")
+
+        if command == "Generate":
+            return self._Generate(request["arguments"], environment)
+
+        raise Exception("'{}' is not a valid command.".format(command))
+
+    # ----------------------------------------------------------------------
+    def _Generate(
+        self,
+        arguments: dict[str, Any],
+        environment: Mapping[str, str],
+    ) -> dict[str, Any]:
+        path = Path(arguments["path"])
+
+        repository_root = GetGitRoot(path) or path
+
+        with self._repository_locks_lock:
+            repository_lock = self._repository_locks.setdefault(repository_root, threading.Lock())
+
+        sink = StringIO()
+
+        result = -1
+        semantic_version_result: Optional[GetSemanticVersionResult] = None
+
+        # Requests for the same repository are processed serially, as they share checkpoints
+        with repository_lock:
+            try:
+                with DoneManager.Create(
+                    sink,
+                    "Generating with the server at '{}'".format(self.socket_filename),
+                    flags=DoneManagerFlags.Create(verbose=arguments["verbose"], debug=arguments["debug"]),
+                ) as dm:
+                    semantic_version_result = GetSemanticVersion(
+                        dm,
+                        path,
+                        prerelease_name=arguments["prerelease_name"],
+                        include_branch_name_when_necessary=arguments["include_branch_name_when_necessary"],
+                        no_prefix=arguments["no_prefix"],
+                        no_metadata=arguments["no_metadata"],
+                        style=GenerateStyle(arguments["style"]),
+                        use_checkpoints=arguments["use_checkpoints"],
+                        use_pathspecs=arguments["use_pathspecs"],
+                        environment=environment,
+                    )
+
+                result = dm.result
+
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                # Errors encountered while generating the version have been written to the output; write any
+                # others so that they are returned to the client.
+                if str(ex) not in sink.getvalue():
+                    sink.write("ERROR: {}\n".format(ex))
+
+                sys.stderr.write("ERROR: Generating for '{}' failed: {}\n".format(path, ex))
+
+        return {
+            "result": result,
+            "output": sink.getvalue(),
+            "semantic_version_result": (
+                None
+                if semantic_version_result is None
+                else {
+                    "configuration_filename": (
+                        None
+                        if semantic_version_result.configuration_filename is None
+                        else str(semantic_version_result.configuration_filename)
+                    ),
+                    "semantic_version": str(semantic_version_result.semantic_version),
+                    "semantic_version_string": semantic_version_result.semantic_version_string,
+                }
+            ),
+        }
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def IsSupported() -> bool:
+    """Returns True if the server is supported on this platform."""
+
+    return hasattr(socket, "AF_UNIX")
+
+
+# ----------------------------------------------------------------------
+def GetDefaultSocketFilename() -> Path:
+    """Returns the socket used when one isn't explicitly provided."""
+
+    value = os.getenv(SOCKET_ENVIRONMENT_VARIABLE_NAME)
+    if value:
+        return Path(value)
+
+    return Path(tempfile.gettempdir()) / "autogitsemver-{}.sock".format(_GetUserId())
+
+
+# ----------------------------------------------------------------------
+def Generate(
+    path: Path,
+    *,
+    socket_filename: Optional[Path] = None,
+    prerelease_name: Optional[str] = None,
+    include_branch_name_when_necessary: bool = True,
+    no_prefix: bool = False,
+    no_metadata: bool = False,
+    style: GenerateStyle = GenerateStyle.Standard,
+    use_checkpoints: bool = False,
+    use_pathspecs: bool = False,
+    verbose: bool = False,
+    debug: bool = False,
+) -> Optional[GenerateResponse]:
+    """Generates a semantic version with the server; returns None if the server isn't running."""
+
+    socket_filename = socket_filename or GetDefaultSocketFilename()
+
+    response = _SendRequest(
+        socket_filename,
+        {
+            "version": PROTOCOL_VERSION,
+            "command": "Generate",
+            "arguments": {
+                "path": str(path),
+                "prerelease_name": prerelease_name,
+                "include_branch_name_when_necessary": include_branch_name_when_necessary,
+                "no_prefix": no_prefix,
+                "no_metadata": no_metadata,
+                "style": style.value,
+                "use_checkpoints": use_checkpoints,
+                "use_pathspecs": use_pathspecs,
+                "verbose": verbose,
+                "debug": debug,
+            },
+        },
+    )
+
+    if response is None or "error" in response:
+        return None
+
+    semantic_version_result: Optional[GetSemanticVersionResult] = None
+
+    if response["semantic_version_result"] is not None:
+        configuration_filename = response["semantic_version_result"]["configuration_filename"]
+
+        semantic_version_result = GetSemanticVersionResult(
+            None if configuration_filename is None else Path(configuration_filename),
+            SemVer(response["semantic_version_result"]["semantic_version"]),
+            response["semantic_version_result"]["semantic_version_string"],
+        )
+
+    return GenerateResponse(response["result"], response["output"], semantic_version_result)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+class _UnixStreamServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    # This is equivalent to `socketserver.ThreadingUnixStreamServer`, which isn't defined on platforms that
+    # don't support Unix domain sockets.
+    address_family = getattr(socket, "AF_UNIX", socket.AF_INET)
+    daemon_threads = True
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        socket_filename: str,
+        request_handler_class: type[socketserver.BaseRequestHandler],
+        owner: Server,
+    ):
+        super().__init__(socket_filename, request_handler_class)
+
+        self.owner = owner
+
+
+# ----------------------------------------------------------------------
+class _ClientEnvironment(Mapping[str, str]):
+    """Environment variables that are retrieved from the client as they are read."""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        rfile: BinaryIO,
+        wfile: BinaryIO,
+    ):
+        self._rfile = rfile
+        self._wfile = wfile
+
+        self._values: dict[str, Optional[str]] = {}
+
+    # ----------------------------------------------------------------------
+    def __getitem__(
+        self,
+        key: str,
+    ) -> str:
+        if key not in self._values:
+            self._wfile.write(json.dumps({"environment_variable_name": key}).encode("utf-8") + b"\n")
+            self._wfile.flush()
+
+            response = json.loads(self._rfile.readline())
+
+            value = response.get("value") if isinstance(response, dict) else None
+            if value is not None and not isinstance(value, str):
+                raise Exception("The value for the environment variable '{}' is not valid.".format(key))
+
+            self._values[key] = value
+
+        value = self._values[key]
+        if value is None:
+            raise KeyError(key)
+
+        return value
+
+    # ----------------------------------------------------------------------
+    def __iter__(self) -> Iterator[str]:
+        # Only the variables that have been retrieved are known
+        return (key for key, value in self._values.items() if value is not None)
+
+    # ----------------------------------------------------------------------
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+# ----------------------------------------------------------------------
+class _RequestHandler(socketserver.StreamRequestHandler):
+    # ----------------------------------------------------------------------
+    def handle(self):
+        assert isinstance(self.server, _UnixStreamServer)
+
+        request = self.rfile.readline()
+        if not request:
+            # The client disconnected without sending a request (this happens when checking to see if a
+            # server is running).
+            return
+
+        try:
+            response = self.server.owner._ProcessRequest(  # pylint: disable=protected-access
+                json.loads(request),
+                _ClientEnvironment(self.rfile, self.wfile),
+            )
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            response = {"error": str(ex)}
+
+        try:
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+        except OSError:
+            # The client disconnected before the response was written
+            pass
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _Connect(
+    socket_filename: Path,
+) -> Optional[socket.socket]:
+    if not IsSupported():
+        return None  # pragma: no cover
+
+    try:
+        # Don't connect to sockets created by other users
+        if socket_filename.stat().st_uid != _GetUserId():
+            return None
+
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)  # pylint: disable=no-member
+
+        try:
+            connection.connect(str(socket_filename))
+        except OSError:
+            connection.close()
+            raise
+
+    except OSError:
+        return None
+
+    return connection
+
+
+# ----------------------------------------------------------------------
+def _GetUserId() -> int:
+    return os.getuid() if hasattr(os, "getuid") else 0
+
+
+# ----------------------------------------------------------------------
+def _SendRequest(
+    socket_filename: Path,
+    request: dict[str, Any],
+) -> Optional[dict[str, Any]]:
+    connection = _Connect(socket_filename)
+    if connection is None:
+        return None
+
+    try:
+        with connection, connection.makefile("rwb") as f:
+            f.write(json.dumps(request).encode("utf-8") + b"\n")
+            f.flush()
+
+            response = json.loads(f.readline())
+
+            # Provide the environment variables requested by the server until the response is received
+            while isinstance(response, dict) and "environment_variable_name" in response:
+                f.write(
+                    json.dumps({"value": os.getenv(response["environment_variable_name"])}).encode("utf-8")
+                    + b"\n",
+                )
+                f.flush()
+
+                response = json.loads(f.readline())
+
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(response, dict):
+        return None
+
+    return response
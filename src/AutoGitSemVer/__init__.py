@@ -1,13 +1,45 @@
 # noqa: D104
-from importlib.metadata import version
+from typing import Any, TYPE_CHECKING
 
-from .Lib import GenerateStyle, GetSemanticVersion, GetSemanticVersionResult
+if TYPE_CHECKING:
+    from .Lib import (  # pragma: no cover
+        GatherSemanticVersionsAsync,
+        GenerateStyle,
+        GetSemanticVersion,
+        GetSemanticVersionAsync,
+        GetSemanticVersionResult,
+        GetSemanticVersions,
+        WatchSemanticVersion,
+    )
 
+    __version__: str  # pragma: no cover
 
-__version__ = version("AutoGitSemVer")
 
 __all__ = [
+    "GatherSemanticVersionsAsync",
     "GenerateStyle",
     "GetSemanticVersion",
+    "GetSemanticVersionAsync",
     "GetSemanticVersionResult",
+    "GetSemanticVersions",
+    "WatchSemanticVersion",
 ]
+
+
+# ----------------------------------------------------------------------
+def __getattr__(name: str) -> Any:
+    # Exports are imported when they are first accessed, so that importing a module within the package
+    # (for example, the command line entry point) doesn't import everything.
+    if name == "__version__":
+        from importlib.metadata import version  # pylint: disable=import-outside-toplevel
+
+        value: Any = version("AutoGitSemVer")
+    elif name in __all__:
+        from . import Lib  # pylint: disable=import-outside-toplevel
+
+        value = getattr(Lib, name)
+    else:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+    globals()[name] = value
+    return value
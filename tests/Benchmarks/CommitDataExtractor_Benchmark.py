@@ -0,0 +1,95 @@
+# ----------------------------------------------------------------------
+# |
+# |  CommitDataExtractor_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 21:02:44
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Measures the cost of extracting version deltas from commit descriptions one commit at a time and in batches.
+
+python tests/Benchmarks/CommitDataExtractor_Benchmark.py --num-commits 100000
+"""
+
+import random
+import sys
+import time
+
+from datetime import datetime
+from io import StringIO
+from pathlib import PurePath
+from typing import Annotated
+
+import typer
+
+from dbrownell_Common.Streams.DoneManager import DoneManager  # type: ignore [import-untyped]
+
+from AutoGitSemVer import Lib
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(help=__doc__, pretty_exceptions_enable=False)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Benchmark(
+    num_commits: Annotated[
+        int,
+        typer.Option("--num-commits", help="Number of commits."),
+    ] = 100000,
+    batch_size: Annotated[
+        int,
+        typer.Option("--batch-size", help="Number of commits in each batch."),
+    ] = 256,
+) -> None:
+    keywords = ["", "", "", "", "(+minor)", "(+patch)", "(+feature)", "(+major)"]
+
+    random.seed(0)
+
+    commit_infos = [
+        Lib.CommitInfo(
+            "{:040x}".format(index),
+            "Commit {} {}\n\n{}".format(index, random.choice(keywords), "Details " * random.randint(0, 64)),
+            [],
+            "Author",
+            datetime.now(),
+            [PurePath("File.txt")],
+        )
+        for index in range(num_commits)
+    ]
+
+    with DoneManager.Create(StringIO(), "") as dm:
+        start = time.perf_counter()
+
+        per_commit_results = [Lib.DefaultCommitDataExtractor(dm, commit_info) for commit_info in commit_infos]
+
+        per_commit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+
+    batch_results: list = []
+
+    for index in range(0, num_commits, batch_size):
+        batch_results += Lib.DefaultCommitDataBatchExtractor(commit_infos[index : index + batch_size])
+
+    batch_time = time.perf_counter() - start
+
+    assert batch_results == per_commit_results
+
+    sys.stdout.write("{:>10}  {:>16}  {:>16}\n".format("Commits", "Per commit (ms)", "Batch (ms)"))
+    sys.stdout.write(
+        "{:>10}  {:>16.3f}  {:>16.3f}\n".format(num_commits, per_commit_time * 1000, batch_time * 1000),
+    )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,121 @@
+# ----------------------------------------------------------------------
+# |
+# |  CommitInfo_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 22:04:39
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Measures the memory used by `CommitInfo` objects for a synthetic history.
+
+- Lists: every commit has its own list of `PurePath` objects (the previous representation).
+- Path table: files are interned in a shared `PathTable` and paths are only created when accessed.
+
+python tests/Benchmarks/CommitInfo_Benchmark.py --num-commits 100000
+"""
+
+import random
+import sys
+import tracemalloc
+
+from datetime import datetime
+from pathlib import PurePath
+from typing import Annotated, Callable, Sequence
+
+import typer
+
+from AutoGitSemVer.Lib import CommitInfo
+from AutoGitSemVer.PathTable import PathTable
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(help=__doc__, pretty_exceptions_enable=False)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Benchmark(
+    num_commits: Annotated[
+        int,
+        typer.Option("--num-commits", help="Number of commits."),
+    ] = 100000,
+    num_files: Annotated[
+        int,
+        typer.Option("--num-files", help="Number of unique files in the repository."),
+    ] = 5000,
+    max_files_per_commit: Annotated[
+        int,
+        typer.Option("--max-files-per-commit", help="Maximum number of files modified by a commit."),
+    ] = 20,
+) -> None:
+    random.seed(0)
+
+    filenames = [
+        "src/Component{}/Module{}/File{}.py".format(index % 17, index % 101, index)
+        for index in range(num_files)
+    ]
+
+    commit_filenames = [
+        random.sample(filenames, random.randint(1, max_files_per_commit)) for _ in range(num_commits)
+    ]
+
+    # ----------------------------------------------------------------------
+    def Measure(
+        create_files_func: Callable[[list[str]], Sequence[PurePath]],
+    ) -> tuple[int, list[CommitInfo]]:
+        tracemalloc.start()
+
+        try:
+            commits = [
+                CommitInfo(
+                    "{:040x}".format(index),
+                    "Commit {}".format(index),
+                    [],
+                    "Author",
+                    datetime(2024, 1, 1),
+                    create_files_func(files),
+                )
+                for index, files in enumerate(commit_filenames)
+            ]
+
+            # Access the files as the extractors would
+            for commit in commits:
+                for filename in commit.files:
+                    filename.name  # pylint: disable=pointless-statement
+
+            size, _ = tracemalloc.get_traced_memory()
+
+        finally:
+            tracemalloc.stop()
+
+        return size, commits
+
+    # ----------------------------------------------------------------------
+
+    list_size, list_commits = Measure(lambda filenames: [PurePath(filename) for filename in filenames])
+
+    table = PathTable()
+    table_size, table_commits = Measure(table.CreateList)
+
+    assert table_commits == list_commits
+
+    sys.stdout.write("{:>10}  {:>16}  {:>16}\n".format("Commits", "Lists (MB)", "Path table (MB)"))
+    sys.stdout.write(
+        "{:>10}  {:>16.1f}  {:>16.1f}\n".format(
+            num_commits,
+            list_size / (1024 * 1024),
+            table_size / (1024 * 1024),
+        ),
+    )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
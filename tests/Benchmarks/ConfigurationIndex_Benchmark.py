@@ -0,0 +1,131 @@
+# ----------------------------------------------------------------------
+# |
+# |  ConfigurationIndex_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 16:18:44
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Compares the cost of resolving configuration ownership by searching the file system with the cost of using a ConfigurationIndex.
+
+A synthetic, wide tree is created in which every Nth top-level directory contains a configuration file;
+ownership is then resolved for a file in every leaf directory (this is equivalent to processing a
+commit that modifies every one of those files).
+
+    python tests/Benchmarks/ConfigurationIndex_Benchmark.py --num-directories 1000 --depth 6
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+
+from pathlib import Path, PurePath
+from typing import Annotated
+
+import typer
+
+from AutoGitSemVer.ConfigurationIndex import ConfigurationIndex
+from AutoGitSemVer.Lib import DEFAULT_CONFIGURATION_FILENAMES, GetConfigurationFilename
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(help=__doc__, pretty_exceptions_enable=False)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Benchmark(
+    num_directories: Annotated[
+        int,
+        typer.Option("--num-directories", help="Number of top-level directories."),
+    ] = 1000,
+    depth: Annotated[
+        int,
+        typer.Option("--depth", help="Depth of the directories beneath each top-level directory."),
+    ] = 4,
+    configuration_frequency: Annotated[
+        int,
+        typer.Option(
+            "--configuration-frequency", help="Every Nth top-level directory has a configuration file."
+        ),
+    ] = 10,
+    num_iterations: Annotated[
+        int,
+        typer.Option("--num-iterations", help="Number of times that ownership is resolved for each file."),
+    ] = 3,
+) -> None:
+    with tempfile.TemporaryDirectory() as temp_directory:
+        repo_dir = Path(temp_directory)
+
+        subprocess.run(["git", "init", "--quiet"], cwd=repo_dir, check=True)
+
+        filenames: list[PurePath] = []
+
+        for directory_index in range(num_directories):
+            top_directory = PurePath("dir{:05d}".format(directory_index))
+
+            leaf_directory = top_directory.joinpath(*("sub{}".format(index) for index in range(depth)))
+            (repo_dir / leaf_directory).mkdir(parents=True)
+
+            if directory_index % configuration_frequency == 0:
+                (repo_dir / top_directory / DEFAULT_CONFIGURATION_FILENAMES[-1]).write_text("{}\n")
+
+            filenames.append(leaf_directory / "File.txt")
+
+        # File system search
+        start = time.perf_counter()
+
+        for _ in range(num_iterations):
+            fs_results = [
+                GetConfigurationFilename((repo_dir / filename).parent, DEFAULT_CONFIGURATION_FILENAMES)
+                for filename in filenames
+            ]
+
+        fs_time = time.perf_counter() - start
+
+        # Index
+        start = time.perf_counter()
+        index = ConfigurationIndex.FromWorkingTree(repo_dir, DEFAULT_CONFIGURATION_FILENAMES)
+        index_creation_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+
+        for _ in range(num_iterations):
+            index_results = [index.GetConfigurationFilename(filename) for filename in filenames]
+
+        index_time = time.perf_counter() - start
+
+        assert index_results == fs_results
+
+        num_lookups = len(filenames) * num_iterations
+
+        sys.stdout.write(
+            "{:>10}  {:>16}  {:>16}  {:>16}\n".format(
+                "Lookups",
+                "File system (s)",
+                "Index (s)",
+                "Index build (s)",
+            ),
+        )
+
+        sys.stdout.write(
+            "{:>10}  {:>16.3f}  {:>16.3f}  {:>16.3f}\n".format(
+                num_lookups,
+                fs_time,
+                index_time,
+                index_creation_time,
+            ),
+        )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,108 @@
+# ----------------------------------------------------------------------
+# |
+# |  EnumCommits_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 10:19:52
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Measures how the cost of EnumCommits scales with the depth of a repository's history.
+
+The per-commit cost should remain constant as the history grows (linear scaling) and the time to the
+first commit should not depend on the depth of the history at all.
+
+    python tests/Benchmarks/EnumCommits_Benchmark.py --depth 1000 --depth 2000 --depth 4000
+"""
+
+import itertools
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from AutoGitSemVer.Lib import EnumCommits
+
+sys.path.insert(0, str(Path(__file__).parent))
+from SyntheticRepository import CreateRepository  # noqa: E402
+
+del sys.path[0]
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(help=__doc__, pretty_exceptions_enable=False)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Benchmark(
+    depths: Annotated[
+        list[int],
+        typer.Option("--depth", help="History depths to measure."),
+    ] = [500, 1000, 2000, 4000],  # noqa: B006
+    first_n: Annotated[
+        int,
+        typer.Option("--first-n", help="Number of commits consumed when measuring early termination."),
+    ] = 10,
+) -> None:
+    sys.stdout.write(
+        "{:>10}  {:>12}  {:>14}  {:>16}  {:>16}  {:>16}\n".format(
+            "Depth",
+            "Total (s)",
+            "us / commit",
+            "First {} (ms)".format(first_n),
+            "Cold cache (s)",
+            "Warm cache (s)",
+        ),
+    )
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        for depth in depths:
+            repo_dir = CreateRepository(Path(temp_directory) / str(depth), depth)
+
+            # ----------------------------------------------------------------------
+            def Measure(**kwargs) -> float:
+                start = time.perf_counter()
+                num_commits = sum(1 for _ in EnumCommits(repo_dir, **kwargs))  # noqa: B023
+                result = time.perf_counter() - start
+
+                assert num_commits == depth, (num_commits, depth)  # noqa: B023
+                return result
+
+            # ----------------------------------------------------------------------
+
+            total = Measure(use_cache=False)
+
+            start = time.perf_counter()
+            for _ in itertools.islice(EnumCommits(repo_dir, use_cache=False), first_n):
+                pass
+            first = time.perf_counter() - start
+
+            cold = Measure()
+            warm = Measure()
+
+            sys.stdout.write(
+                "{:>10}  {:>12.3f}  {:>14.1f}  {:>16.2f}  {:>16.3f}  {:>16.3f}\n".format(
+                    depth,
+                    total,
+                    total / depth * 1_000_000,
+                    first * 1000,
+                    cold,
+                    warm,
+                ),
+            )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
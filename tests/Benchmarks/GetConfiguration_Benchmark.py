@@ -0,0 +1,106 @@
+# ----------------------------------------------------------------------
+# |
+# |  GetConfiguration_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 18:12:05
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Measures the cost of repeated calls to GetConfiguration with different levels of caching.
+
+- Uncached: the schema is loaded, the validator is created, and the configuration is parsed for
+  every call.
+- Shared validator: the configuration is parsed for every call.
+- Cached: the configuration is only parsed when it changes.
+
+python tests/Benchmarks/GetConfiguration_Benchmark.py --num-iterations 1000
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from AutoGitSemVer import Lib
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(help=__doc__, pretty_exceptions_enable=False)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Benchmark(
+    num_iterations: Annotated[
+        int,
+        typer.Option("--num-iterations", help="Number of times that the configuration is loaded."),
+    ] = 1000,
+) -> None:
+    with tempfile.TemporaryDirectory() as temp_directory:
+        root = Path(temp_directory)
+
+        (root / "AutoGitSemVer.yaml").write_text(
+            "{ initial_version: 1.2.3, main_branch_names: [ main ], version_prefix: v }\n",
+        )
+
+        # Configuration files that were recently modified are not cached
+        modified_time = time.time_ns() - 60_000_000_000
+        os.utime(root / "AutoGitSemVer.yaml", ns=(modified_time, modified_time))
+
+        # ----------------------------------------------------------------------
+        def Measure(
+            use_cache: bool,
+            reset_validator: bool,
+        ) -> tuple[float, Lib.Configuration]:
+            start = time.perf_counter()
+
+            for _ in range(num_iterations):
+                if reset_validator:
+                    Lib._configuration_validator = None  # pylint: disable=protected-access
+
+                configuration = Lib.GetConfiguration(root, use_cache=use_cache)
+
+            return time.perf_counter() - start, configuration
+
+        # ----------------------------------------------------------------------
+
+        uncached_time, uncached_configuration = Measure(False, True)
+        validator_time, validator_configuration = Measure(False, False)
+        cached_time, cached_configuration = Measure(True, False)
+
+        assert uncached_configuration == validator_configuration == cached_configuration
+
+        sys.stdout.write(
+            "{:>10}  {:>16}  {:>20}  {:>16}\n".format(
+                "Calls",
+                "Uncached (ms)",
+                "Shared validator (ms)",
+                "Cached (ms)",
+            ),
+        )
+
+        sys.stdout.write(
+            "{:>10}  {:>16.3f}  {:>20.3f}  {:>16.3f}\n".format(
+                num_iterations,
+                uncached_time * 1000 / num_iterations,
+                validator_time * 1000 / num_iterations,
+                cached_time * 1000 / num_iterations,
+            ),
+        )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,353 @@
+# ----------------------------------------------------------------------
+# |
+# |  GetSemanticVersion_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 23:41:18
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Measures the end-to-end cost of generating semantic versions for a large, synthetic repository.
+
+The repository is created with `git fast-import` based on the provided options (history depth, tree width,
+tags, nested configuration roots, and merges); the following are measured:
+
+- EnumCommits: enumerating the entire history (without the commit cache).
+- GetConfiguration: loading the root configuration (without the configuration caches).
+- GetSemanticVersion (uncached / cached): generating the semantic version for the root of the repository.
+- GetSemanticVersion (nested root): generating the semantic version for the first nested configuration root.
+- Generate: running `autogitsemver Generate --no-server --quiet` in a new process.
+
+Results can be written as JSON with `--output` and compared to the results of a previous run (for example,
+one created with a different revision of this package) with `--baseline`; the benchmark fails when the
+median time of any measurement regresses by more than `--threshold`.
+
+    python tests/Benchmarks/GetSemanticVersion_Benchmark.py --num-commits 10000 --output base.json
+    python tests/Benchmarks/GetSemanticVersion_Benchmark.py --num-commits 10000 --baseline base.json
+
+    python tests/Benchmarks/GetSemanticVersion_Benchmark.py --num-commits 500000 --num-directories 5000 --files-per-commit 5
+    python tests/Benchmarks/GetSemanticVersion_Benchmark.py --num-commits 100000 --tag-interval 10 --merge-interval 5 --num-configuration-roots 50 --directory-depth 4
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from io import StringIO
+from pathlib import Path
+from typing import Annotated, Any, Callable, Optional
+
+import typer
+
+from dbrownell_Common.Streams.DoneManager import DoneManager  # type: ignore [import-untyped]
+
+from AutoGitSemVer import Lib, Profiler
+
+sys.path.insert(0, str(Path(__file__).parent))
+from SyntheticRepository import CreateRepository  # noqa: E402
+
+del sys.path[0]
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(help=__doc__, pretty_exceptions_enable=False)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Benchmark(
+    num_commits: Annotated[
+        int,
+        typer.Option("--num-commits", min=1, help="Number of commits in the main branch's history."),
+    ] = 10000,
+    num_directories: Annotated[
+        int,
+        typer.Option("--num-directories", min=1, help="Number of directories in the repository."),
+    ] = 1000,
+    files_per_commit: Annotated[
+        int,
+        typer.Option("--files-per-commit", min=1, help="Number of files added by each commit."),
+    ] = 1,
+    directory_depth: Annotated[
+        int,
+        typer.Option("--directory-depth", min=1, help="Number of path components in each directory."),
+    ] = 1,
+    num_configuration_roots: Annotated[
+        int,
+        typer.Option(
+            "--num-configuration-roots",
+            min=0,
+            help="Number of nested configuration roots (in addition to the root of the repository).",
+        ),
+    ] = 0,
+    tag_interval: Annotated[
+        int,
+        typer.Option("--tag-interval", min=0, help="Tag every Nth commit with a version (0 to disable)."),
+    ] = 0,
+    merge_interval: Annotated[
+        int,
+        typer.Option("--merge-interval", min=0, help="Make every Nth commit a merge commit (0 to disable)."),
+    ] = 0,
+    num_iterations: Annotated[
+        int,
+        typer.Option("--num-iterations", min=1, help="Number of times that each measurement is made."),
+    ] = 3,
+    output: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--output", dir_okay=False, resolve_path=True, help="Write the results to this JSON file."
+        ),
+    ] = None,
+    baseline: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--baseline",
+            exists=True,
+            dir_okay=False,
+            resolve_path=True,
+            help="Compare the results to those in this JSON file (created with '--output').",
+        ),
+    ] = None,
+    threshold: Annotated[
+        float,
+        typer.Option(
+            "--threshold",
+            min=0.0,
+            help="Maximum relative increase in median time (compared to '--baseline') before a measurement is considered a regression.",
+        ),
+    ] = 0.1,
+) -> None:
+    parameters: dict[str, int] = {
+        "num_commits": num_commits,
+        "num_directories": num_directories,
+        "files_per_commit": files_per_commit,
+        "directory_depth": directory_depth,
+        "num_configuration_roots": num_configuration_roots,
+        "tag_interval": tag_interval,
+        "merge_interval": merge_interval,
+    }
+
+    baseline_content: Optional[dict[str, Any]] = None
+
+    if baseline is not None:
+        baseline_content = json.loads(baseline.read_text())
+        assert baseline_content is not None
+
+        if baseline_content["parameters"] != parameters:
+            raise typer.BadParameter(
+                "The baseline was created with different parameters ({}).".format(
+                    baseline_content["parameters"]
+                ),
+            )
+
+    measurements: dict[str, list[float]] = {}
+    profile: Optional[Profiler.Profile] = None
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        start = time.perf_counter()
+
+        repo_dir = CreateRepository(
+            Path(temp_directory) / "repo",
+            num_commits,
+            num_directories=num_directories,
+            files_per_commit=files_per_commit,
+            directory_depth=directory_depth,
+            num_configuration_roots=num_configuration_roots,
+            tag_interval=tag_interval,
+            merge_interval=merge_interval,
+        )
+
+        sys.stdout.write("Created the repository in {:.2f}s.\n\n".format(time.perf_counter() - start))
+
+        nested_root = next(
+            (
+                filename.parent
+                for filename in sorted(repo_dir.glob("**/AutoGitSemVer.yaml"))
+                if filename.parent != repo_dir
+            ),
+            None,
+        )
+
+        # ----------------------------------------------------------------------
+        def Measure(
+            name: str,
+            func: Callable[[], Any],
+        ) -> None:
+            # The first call isn't measured, as it includes one-time costs (such as imports)
+            func()
+
+            times: list[float] = []
+
+            for _ in range(num_iterations):
+                start = time.perf_counter()
+                func()
+                times.append(time.perf_counter() - start)
+
+            measurements[name] = times
+
+        # ----------------------------------------------------------------------
+        def GetSemanticVersion(
+            path: Path,
+            use_cache: bool,
+        ) -> Lib.GetSemanticVersionResult:
+            with DoneManager.Create(StringIO(), "") as dm:
+                return Lib.GetSemanticVersion(
+                    dm,
+                    path,
+                    include_branch_name_when_necessary=False,
+                    no_metadata=True,
+                    use_cache=use_cache,
+                )
+
+        # ----------------------------------------------------------------------
+
+        Measure("EnumCommits", lambda: sum(1 for _ in Lib.EnumCommits(repo_dir, use_cache=False)))
+        Measure("GetConfiguration", lambda: Lib.GetConfiguration(repo_dir, use_cache=False))
+        Measure("GetSemanticVersion (uncached)", lambda: GetSemanticVersion(repo_dir, False))
+
+        # Populate the caches before measuring
+        GetSemanticVersion(repo_dir, True)
+        Measure("GetSemanticVersion (cached)", lambda: GetSemanticVersion(repo_dir, True))
+
+        if nested_root is not None:
+            Measure("GetSemanticVersion (nested root)", lambda: GetSemanticVersion(nested_root, True))
+
+        Measure(
+            "Generate",
+            lambda: subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "AutoGitSemVer.EntryPoint",
+                    "Generate",
+                    str(repo_dir),
+                    "--no-server",
+                    "--quiet",
+                ],
+                capture_output=True,
+                check=True,
+            ),
+        )
+
+        # Capture a profile so that regressions can be attributed to a phase
+        with Profiler.Profile() as profile:
+            GetSemanticVersion(repo_dir, True)
+
+    results: dict[str, Any] = {
+        "revision": _GetRevision(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "git_version": subprocess.run(
+            ["git", "--version"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip(),
+        "parameters": parameters,
+        "measurements": {
+            name: {
+                "median": statistics.median(times),
+                "min": min(times),
+                "max": max(times),
+                "times": times,
+            }
+            for name, times in measurements.items()
+        },
+        "profile": profile.ToJson(),
+    }
+
+    if output is not None:
+        output.write_text(json.dumps(results, indent=2) + "\n")
+
+    # Display the results
+    name_width = max(len(name) for name in measurements)
+
+    sys.stdout.write(
+        "{:<{}}  {:>12}  {:>12}  {:>14}  {:>10}\n".format(
+            "Measurement",
+            name_width,
+            "Median (ms)",
+            "Min (ms)",
+            "Baseline (ms)",
+            "Change",
+        ),
+    )
+
+    regressions: list[str] = []
+
+    for name, measurement in results["measurements"].items():
+        baseline_median: Optional[float] = None
+
+        if baseline_content is not None and name in baseline_content["measurements"]:
+            baseline_median = baseline_content["measurements"][name]["median"]
+
+        if baseline_median is None:
+            baseline_str = change_str = ""
+        else:
+            change = (measurement["median"] - baseline_median) / baseline_median
+
+            baseline_str = "{:.1f}".format(baseline_median * 1000)
+            change_str = "{:+.1f}%".format(change * 100)
+
+            if change > threshold:
+                regressions.append(name)
+                change_str += " !"
+
+        sys.stdout.write(
+            "{:<{}}  {:>12.1f}  {:>12.1f}  {:>14}  {:>10}\n".format(
+                name,
+                name_width,
+                measurement["median"] * 1000,
+                measurement["min"] * 1000,
+                baseline_str,
+                change_str,
+            ),
+        )
+
+    sys.stdout.write("\n{}\n".format(profile.ToTable()))
+
+    if regressions:
+        sys.stdout.write(
+            "\nRegressions (more than {:.0f}% slower than the baseline): {}\n".format(
+                threshold * 100,
+                ", ".join(regressions),
+            ),
+        )
+
+        raise typer.Exit(1)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _GetRevision() -> Optional[str]:
+    """Returns the revision of this package's repository (if available) so that results can be attributed."""
+
+    result = subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=Path(__file__).parent,
+        capture_output=True,
+        text=True,
+    )
+
+    if result.returncode != 0:
+        return None
+
+    return result.stdout.strip()
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,149 @@
+# ----------------------------------------------------------------------
+# |
+# |  ProgressReporting_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-18 00:12:47
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Measures the cost of reporting progress while enumerating changes.
+
+- Per-commit nested output: a `VerboseNested` block is created for every commit, even when verbose output
+  isn't displayed (the previous implementation).
+- Batched progress: information about each commit is only created when verbose output is displayed, and
+  progress is periodically written as status.
+
+Both are measured in isolation and within GetSemanticVersion (with commits provided by a mocked EnumCommits).
+
+python tests/Benchmarks/ProgressReporting_Benchmark.py --num-commits 100000
+"""
+
+import sys
+import tempfile
+import time
+
+from datetime import datetime
+from io import StringIO
+from pathlib import Path, PurePath
+from typing import Annotated
+from unittest.mock import patch
+
+import typer
+
+from dbrownell_Common.Streams.DoneManager import DoneManager, Flags as DoneManagerFlags  # type: ignore [import-untyped]
+
+from AutoGitSemVer import Lib
+
+sys.path.insert(0, str(Path(__file__).parent))
+from SyntheticRepository import CreateRepository  # noqa: E402
+
+del sys.path[0]
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(help=__doc__, pretty_exceptions_enable=False)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Benchmark(
+    num_commits: Annotated[
+        int,
+        typer.Option("--num-commits", min=1, help="Number of commits."),
+    ] = 100000,
+) -> None:
+    commits = [
+        Lib.CommitInfo(
+            "{:040x}".format(index),
+            "Commit {}".format(index),
+            [],
+            "Author",
+            datetime(2024, 1, 1),
+            [PurePath("File.txt")],
+        )
+        for index in range(num_commits)
+    ]
+
+    # ----------------------------------------------------------------------
+    def MeasurePerCommitOutput() -> float:
+        with DoneManager.Create(StringIO(), "") as dm:
+            start = time.perf_counter()
+
+            for commit in commits:
+                with dm.VerboseNested(
+                    "Processing '{}' ({})".format(commit.id, commit.author_date),
+                    lambda: None,
+                ):
+                    pass
+
+            return time.perf_counter() - start
+
+    # ----------------------------------------------------------------------
+    def MeasureBatchedProgress() -> float:
+        with DoneManager.Create(StringIO(), "") as dm:
+            start = time.perf_counter()
+
+            progress = Lib._ProgressReporter(dm)  # pylint: disable=protected-access
+
+            for index, commit in enumerate(commits):
+                if dm.is_verbose:
+                    with dm.VerboseNested(
+                        "Processing '{}' ({})".format(commit.id, commit.author_date),
+                        lambda: None,
+                    ):
+                        pass
+
+                progress.Update(index + 1, index)
+
+            return time.perf_counter() - start
+
+    # ----------------------------------------------------------------------
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        repo_dir = CreateRepository(Path(temp_directory) / "repo", 1)
+
+        # ----------------------------------------------------------------------
+        def MeasureGetSemanticVersion(
+            verbose: bool,
+        ) -> float:
+            with (
+                patch("AutoGitSemVer.Lib.EnumCommits", return_value=commits),
+                DoneManager.Create(StringIO(), "", flags=DoneManagerFlags.Create(verbose=verbose)) as dm,
+            ):
+                start = time.perf_counter()
+
+                Lib.GetSemanticVersion(dm, repo_dir, use_cache=False)
+
+                return time.perf_counter() - start
+
+        # ----------------------------------------------------------------------
+
+        measurements = [
+            ("Per-commit nested output", MeasurePerCommitOutput()),
+            ("Batched progress", MeasureBatchedProgress()),
+            ("GetSemanticVersion", MeasureGetSemanticVersion(False)),
+            ("GetSemanticVersion (verbose)", MeasureGetSemanticVersion(True)),
+        ]
+
+    sys.stdout.write("{:<30}  {:>12}  {:>14}\n".format("Measurement", "Total (ms)", "us / commit"))
+
+    for name, total in measurements:
+        sys.stdout.write(
+            "{:<30}  {:>12.1f}  {:>14.2f}\n".format(
+                name,
+                total * 1000,
+                total / num_commits * 1_000_000,
+            ),
+        )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,120 @@
+# ----------------------------------------------------------------------
+# |
+# |  Startup_Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 22:31:52
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Measures the startup time of the command line tool.
+
+- Import: the cumulative time to import the command line entry point (as reported by `python -X importtime`).
+- --version: the wall time of `autogitsemver --version`.
+
+The modules with the largest cumulative import times are displayed to help identify regressions.
+
+python tests/Benchmarks/Startup_Benchmark.py --num-iterations 10
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+from typing import Annotated
+
+import typer
+
+
+# ----------------------------------------------------------------------
+app = typer.Typer(help=__doc__, pretty_exceptions_enable=False)
+
+
+# ----------------------------------------------------------------------
+@app.command()
+def Benchmark(
+    num_iterations: Annotated[
+        int,
+        typer.Option("--num-iterations", help="Number of times that the command line tool is started."),
+    ] = 10,
+    num_modules: Annotated[
+        int,
+        typer.Option("--num-modules", help="Number of modules with the largest import times to display."),
+    ] = 15,
+) -> None:
+    import_times: list[int] = []
+    version_times: list[float] = []
+
+    module_times: dict[str, int] = {}
+
+    for _ in range(num_iterations):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import AutoGitSemVer.EntryPoint"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+        module_times = _ParseImportTimes(result.stderr)
+        import_times.append(module_times["AutoGitSemVer.EntryPoint"])
+
+        start = time.perf_counter()
+
+        subprocess.run(
+            [sys.executable, "-m", "AutoGitSemVer.EntryPoint", "--version"],
+            capture_output=True,
+            check=True,
+        )
+
+        version_times.append(time.perf_counter() - start)
+
+    sys.stdout.write("{:>16}  {:>16}\n".format("Import (ms)", "--version (ms)"))
+    sys.stdout.write(
+        "{:>16.1f}  {:>16.1f}\n\n".format(
+            statistics.median(import_times) / 1000,
+            statistics.median(version_times) * 1000,
+        ),
+    )
+
+    sys.stdout.write("{:<60}  {:>16}\n".format("Module", "Cumulative (ms)"))
+
+    for module_name, cumulative_time in sorted(module_times.items(), key=lambda item: -item[1])[:num_modules]:
+        sys.stdout.write("{:<60}  {:>16.1f}\n".format(module_name, cumulative_time / 1000))
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _ParseImportTimes(
+    output: str,
+) -> dict[str, int]:
+    """Returns the cumulative import time (in microseconds) of each module."""
+
+    results: dict[str, int] = {}
+
+    # Lines are in the form: "import time: <self us> | <cumulative us> | <indented module name>"
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+
+        results[parts[2].strip()] = int(parts[1])
+
+    return results
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    app()
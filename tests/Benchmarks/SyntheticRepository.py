@@ -0,0 +1,201 @@
+# ----------------------------------------------------------------------
+# |
+# |  SyntheticRepository.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 10:02:31
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Creates large, synthetic git repositories that are used by the benchmarks in this directory."""
+
+import subprocess
+
+from pathlib import Path
+
+
+# ----------------------------------------------------------------------
+def CreateRepository(
+    path: Path,
+    num_commits: int,
+    *,
+    num_directories: int = 100,
+    files_per_commit: int = 1,
+    directory_depth: int = 1,
+    num_configuration_roots: int = 0,
+    tag_interval: int = 0,
+    merge_interval: int = 0,
+) -> Path:
+    """Creates a repository via `git fast-import` and returns its path.
+
+    - `num_directories` and `files_per_commit` control the width of the tree; each commit adds new files.
+    - `directory_depth` is the number of path components in each directory (for example, 3 creates
+      directories like "dir0001/dir0001/dir0001").
+    - `num_configuration_roots` AutoGitSemVer configuration files are added to directories (evenly
+      distributed) in the first commit, in addition to one at the root of the repository; tags for
+      these roots are prefixed with the directory name.
+    - A "v<N>.0.0" tag is created on every `tag_interval`th commit (when `tag_interval` is not 0).
+    - Every `merge_interval`th commit merges a topic commit that forks from the previous merge (when
+      `merge_interval` is not 0); topic commits are created in addition to `num_commits`.
+    """
+
+    path.mkdir(parents=True, exist_ok=True)
+
+    _Git(path, "init", "--quiet", "--initial-branch=main")
+    _Git(path, "config", "user.name", "Benchmark User")
+    _Git(path, "config", "user.email", "benchmark@example.com")
+
+    directories = [
+        "/".join(["dir{:04d}".format(directory_index)] * directory_depth)
+        for directory_index in range(num_directories)
+    ]
+
+    configuration_directories = [
+        directories[root_index * num_directories // num_configuration_roots]
+        for root_index in range(min(num_configuration_roots, num_directories))
+    ]
+
+    commands: list[bytes] = []
+    topic_mark = num_commits
+
+    # ----------------------------------------------------------------------
+    def AddCommit(
+        ref: str,
+        mark: int,
+        commit_index: int,
+        message: str,
+        parents: list[int],
+        files: list[tuple[str, bytes]],
+    ) -> None:
+        message_bytes = message.encode("utf-8")
+        timestamp = 1_700_000_000 + commit_index
+
+        commands.extend(
+            [
+                "commit {}\n".format(ref).encode("utf-8"),
+                "mark :{}\n".format(mark).encode("utf-8"),
+                "author Benchmark User <benchmark@example.com> {} +0000\n".format(timestamp).encode("utf-8"),
+                "committer Benchmark User <benchmark@example.com> {} +0000\n".format(timestamp).encode(
+                    "utf-8"
+                ),
+                "data {}\n".format(len(message_bytes)).encode("utf-8"),
+                message_bytes,
+            ],
+        )
+
+        if parents:
+            commands.append("from :{}\n".format(parents[0]).encode("utf-8"))
+
+            for parent in parents[1:]:
+                commands.append("merge :{}\n".format(parent).encode("utf-8"))
+
+        for filename, content in files:
+            commands.extend(
+                [
+                    "M 100644 inline {}\n".format(filename).encode("utf-8"),
+                    "data {}\n".format(len(content)).encode("utf-8"),
+                    content,
+                ],
+            )
+
+        commands.append(b"\n")
+
+    # ----------------------------------------------------------------------
+
+    previous_merge_mark = 1
+
+    for commit_index in range(num_commits):
+        mark = commit_index + 1
+
+        files: list[tuple[str, bytes]] = []
+
+        if commit_index == 0 and num_configuration_roots:
+            files.append(("AutoGitSemVer.yaml", b"{ initial_version: 0.1.0 }\n"))
+
+            for directory in configuration_directories:
+                files.append(
+                    (
+                        "{}/AutoGitSemVer.yaml".format(directory),
+                        '{{ initial_version: 0.1.0, version_prefix: "{}-" }}\n'.format(
+                            directory.replace("/", "_"),
+                        ).encode("utf-8"),
+                    ),
+                )
+
+        for file_index in range(files_per_commit):
+            files.append(
+                (
+                    "{}/file{:08d}_{}.txt".format(
+                        directories[(commit_index * files_per_commit + file_index) % num_directories],
+                        commit_index,
+                        file_index,
+                    ),
+                    "{}\n".format(commit_index).encode("utf-8"),
+                ),
+            )
+
+        parents: list[int] = []
+
+        if commit_index:
+            parents.append(mark - 1)
+
+            if merge_interval and commit_index % merge_interval == 0:
+                topic_mark += 1
+
+                AddCommit(
+                    "refs/heads/topic",
+                    topic_mark,
+                    commit_index,
+                    "Topic commit {}\n".format(commit_index),
+                    [previous_merge_mark],
+                    [
+                        (
+                            "{}/topic{:08d}.txt".format(
+                                directories[commit_index % num_directories], commit_index
+                            ),
+                            "{}\n".format(commit_index).encode("utf-8"),
+                        ),
+                    ],
+                )
+
+                parents.append(topic_mark)
+                previous_merge_mark = mark
+
+        AddCommit(
+            "refs/heads/main",
+            mark,
+            commit_index,
+            # Include a variety of version deltas
+            "Commit {}{}\n".format(commit_index, " (+minor)" if commit_index % 100 == 99 else ""),
+            parents,
+            files,
+        )
+
+        if tag_interval and commit_index % tag_interval == tag_interval - 1:
+            commands.append(
+                "reset refs/tags/v{}.0.0\nfrom :{}\n\n".format(commit_index // tag_interval + 1, mark).encode(
+                    "utf-8",
+                ),
+            )
+
+    subprocess.run(
+        ["git", "fast-import", "--quiet"],
+        cwd=path,
+        input=b"".join(commands),
+        check=True,
+    )
+
+    _Git(path, "reset", "--hard", "--quiet", "main")
+
+    return path
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Git(path: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=path, check=True, stdout=subprocess.DEVNULL)
@@ -0,0 +1,215 @@
+# ----------------------------------------------------------------------
+# |
+# |  CommitCache_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 11:48:13
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for AutoGitSemVer/CommitCache.py"""
+
+import sqlite3
+import zlib
+
+from contextlib import closing, contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import patch
+
+from AutoGitSemVer.CommitCache import *
+
+
+# ----------------------------------------------------------------------
+def test_RoundTrip(tmp_path):
+    records = [_CreateRecord(index) for index in range(3)]
+
+    with _Open(tmp_path) as cache:
+        assert cache.Get(records[0].hexsha) is None
+        cache.Add(records)
+
+    with _Open(tmp_path) as cache:
+        for record in records:
+            assert cache.Get(record.hexsha) == record
+
+        assert cache.Get("not a hexsha") is None
+
+        assert cache.num_hits == 3
+        assert cache.num_misses == 1
+
+
+# ----------------------------------------------------------------------
+def test_UnusualContent(tmp_path):
+    record = LogRecord(
+        "f" * 40,
+        "Authör",
+        datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=-5))),
+        "",
+        ["unicodé.txt", "with space.txt", "invalid\udcff.txt"],
+    )
+
+    with _Open(tmp_path) as cache:
+        cache.Add([record])
+
+    with _Open(tmp_path) as cache:
+        assert cache.Get(record.hexsha) == record
+
+
+# ----------------------------------------------------------------------
+def test_DifferentVersion(tmp_path):
+    record = _CreateRecord(0)
+
+    with _Open(tmp_path) as cache:
+        cache.Add([record])
+
+    with patch.object(CommitCache, "VERSION", CommitCache.VERSION + 1):
+        with _Open(tmp_path) as cache:
+            assert cache.Get(record.hexsha) is None
+
+
+# ----------------------------------------------------------------------
+def test_CorruptFile(tmp_path):
+    filename = tmp_path / CommitCache.DIRECTORY_NAME / CommitCache.FILENAME
+
+    filename.parent.mkdir(parents=True)
+
+    with filename.open("wb") as f:
+        f.write(b"This is not a database" * 100)
+
+    record = _CreateRecord(0)
+
+    with _Open(tmp_path) as cache:
+        assert cache.Get(record.hexsha) is None
+        cache.Add([record])
+
+    with _Open(tmp_path) as cache:
+        assert cache.Get(record.hexsha) == record
+
+
+# ----------------------------------------------------------------------
+def test_CorruptEntry(tmp_path):
+    records = [_CreateRecord(index) for index in range(2)]
+
+    with _Open(tmp_path) as cache:
+        cache.Add(records)
+
+    with _Connect(tmp_path) as connection:
+        connection.execute(
+            "UPDATE commits SET checksum = checksum + 1 WHERE hexsha = ?", (records[0].hexsha,)
+        )
+
+    with _Open(tmp_path) as cache:
+        assert cache.Get(records[0].hexsha) is None
+        assert cache.Get(records[1].hexsha) == records[1]
+
+    with _Connect(tmp_path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM commits").fetchone()[0] == 1
+
+
+# ----------------------------------------------------------------------
+def test_UndecodableEntry(tmp_path):
+    record = _CreateRecord(0)
+
+    with _Open(tmp_path) as cache:
+        cache.Add([record])
+
+    with _Connect(tmp_path) as connection:
+        connection.execute("UPDATE commits SET data = ?, checksum = ?", (b"\0", zlib.crc32(b"\0")))
+
+    with _Open(tmp_path) as cache:
+        # The cache is disabled after the error is encountered
+        assert cache.Get(record.hexsha) is None
+        assert cache.Get(record.hexsha) is None
+
+        cache.Add([record])
+        assert cache.Get(record.hexsha) is None
+
+
+# ----------------------------------------------------------------------
+def test_Eviction(tmp_path):
+    records = [_CreateRecord(index) for index in range(10)]
+
+    # ----------------------------------------------------------------------
+    def GetCachedIndexes() -> list[int]:
+        # Query the database directly so that the entries aren't marked as used
+        with _Connect(tmp_path) as connection:
+            return sorted(int(row[0], 16) for row in connection.execute("SELECT hexsha FROM commits"))
+
+    # ----------------------------------------------------------------------
+
+    with patch("AutoGitSemVer.CommitCache.time.time", return_value=1000):
+        with _Open(tmp_path) as cache:
+            cache.Add(records[:5])
+
+    with patch("AutoGitSemVer.CommitCache.time.time", return_value=2000):
+        with _Open(tmp_path) as cache:
+            cache.Add(records[5:])
+
+    assert GetCachedIndexes() == list(range(10))
+
+    # Use 2 of the oldest records
+    with patch("AutoGitSemVer.CommitCache.time.time", return_value=3000):
+        with _Open(tmp_path) as cache:
+            assert cache.Get(records[0].hexsha) == records[0]
+            assert cache.Get(records[1].hexsha) == records[1]
+
+    # Evict
+    with patch("AutoGitSemVer.CommitCache.time.time", return_value=4000):
+        with _Open(tmp_path, max_num_commits=7) as cache:
+            pass
+
+    assert GetCachedIndexes() == [0, 1, 5, 6, 7, 8, 9]
+
+    with patch("AutoGitSemVer.CommitCache.time.time", return_value=5000):
+        with _Open(tmp_path, max_num_commits=2) as cache:
+            pass
+
+    assert GetCachedIndexes() == [0, 1]
+
+
+# ----------------------------------------------------------------------
+def test_Unavailable(tmp_path):
+    (tmp_path / CommitCache.DIRECTORY_NAME).touch()
+
+    assert CommitCache.Open(tmp_path) is None
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Open(
+    git_dir: Path,
+    **kwargs,
+) -> CommitCache:
+    cache = CommitCache.Open(git_dir, **kwargs)
+    assert cache is not None
+
+    return cache
+
+
+# ----------------------------------------------------------------------
+@contextmanager
+def _Connect(
+    git_dir: Path,
+) -> Iterator[sqlite3.Connection]:
+    with closing(sqlite3.connect(git_dir / CommitCache.DIRECTORY_NAME / CommitCache.FILENAME)) as connection:
+        with connection:
+            yield connection
+
+
+# ----------------------------------------------------------------------
+def _CreateRecord(
+    index: int,
+) -> LogRecord:
+    return LogRecord(
+        "{:040x}".format(index),
+        "Author {}".format(index),
+        datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(days=index),
+        "Commit {}\n\nDescription\n".format(index),
+        ["file{}.txt".format(index), "dir/file{}.txt".format(index)],
+    )
@@ -0,0 +1,265 @@
+# ----------------------------------------------------------------------
+# |
+# |  ConfigurationIndex_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 15:41:52
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for AutoGitSemVer/ConfigurationIndex.py"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePath
+from unittest.mock import patch
+
+from dbrownell_Common import SubprocessEx  # type: ignore [import-untyped]
+
+from AutoGitSemVer import GitEx
+from AutoGitSemVer.ConfigurationIndex import *
+from AutoGitSemVer.JsonStore import JsonStore
+from AutoGitSemVer.Lib import DEFAULT_CONFIGURATION_FILENAMES, GetConfigurationFilename
+
+
+# ----------------------------------------------------------------------
+def test_Standard():
+    root = Path("/repo")
+
+    index = ConfigurationIndex(
+        root,
+        DEFAULT_CONFIGURATION_FILENAMES,
+        [
+            "A/AutoGitSemVer.yaml",
+            "A/B/C/AutoGitSemVer.json",
+            "D/AutoGitSemVer.yml",
+            "D/AutoGitSemVer.yaml",  # Takes precedence over the .yml file
+            "E/NotAConfiguration.yaml",
+        ],
+    )
+
+    assert index.configuration_filenames == [
+        root / "A" / "AutoGitSemVer.yaml",
+        root / "A" / "B" / "C" / "AutoGitSemVer.json",
+        root / "D" / "AutoGitSemVer.yaml",
+    ]
+
+    assert index.GetConfigurationFilename(PurePath("File.txt")) is None
+    assert index.GetConfigurationRoot(PurePath("File.txt")) == root
+
+    assert index.GetConfigurationFilename(PurePath("A/File.txt")) == root / "A" / "AutoGitSemVer.yaml"
+    assert index.GetConfigurationRoot(PurePath("A/B/File.txt")) == root / "A"
+    assert index.GetConfigurationRoot(PurePath("A/B/C/D/File.txt")) == root / "A" / "B" / "C"
+    assert index.GetConfigurationRoot(PurePath("A/B/File2.txt")) == root / "A"
+    assert index.GetConfigurationRoot(PurePath("D/File.txt")) == root / "D"
+    assert index.GetConfigurationRoot(PurePath("E/File.txt")) == root
+
+    # Posix strings
+    assert index.GetConfigurationRootFromString("File.txt") == root
+    assert index.GetConfigurationRootFromString("A/B/File.txt") == root / "A"
+    assert index.GetConfigurationRootFromString("A/B/C/D/File.txt") == root / "A" / "B" / "C"
+    assert index.GetConfigurationRootFromString("E/File.txt") == root
+
+
+# ----------------------------------------------------------------------
+def test_RootConfiguration():
+    root = Path("/repo")
+
+    index = ConfigurationIndex(root, DEFAULT_CONFIGURATION_FILENAMES, ["AutoGitSemVer.json"])
+
+    assert index.GetConfigurationFilename(PurePath("File.txt")) == root / "AutoGitSemVer.json"
+    assert index.GetConfigurationRoot(PurePath("A/B/File.txt")) == root
+
+
+# ----------------------------------------------------------------------
+def test_FromWorkingTree(tmp_path_factory):
+    repo_dir = tmp_path_factory.mktemp("repo")
+
+    assert SubprocessEx.Run("git init", cwd=repo_dir).returncode == 0
+
+    for directory in ["Tracked", "Untracked", "Ignored", "Deleted"]:
+        (repo_dir / directory).mkdir()
+        (repo_dir / directory / "AutoGitSemVer.yaml").write_text("{}\n")
+
+    (repo_dir / ".gitignore").write_text("Ignored/\n")
+
+    assert SubprocessEx.Run("git add Tracked Deleted .gitignore", cwd=repo_dir).returncode == 0
+    (repo_dir / "Deleted" / "AutoGitSemVer.yaml").unlink()
+
+    index = ConfigurationIndex.FromWorkingTree(repo_dir, DEFAULT_CONFIGURATION_FILENAMES)
+
+    assert index.configuration_filenames == [
+        repo_dir / "Tracked" / "AutoGitSemVer.yaml",
+        repo_dir / "Untracked" / "AutoGitSemVer.yaml",
+    ]
+
+    for filename in ["Tracked/File.txt", "Untracked/A/File.txt", "File.txt"]:
+        assert index.GetConfigurationFilename(PurePath(filename)) == GetConfigurationFilename(
+            (repo_dir / filename).parent,
+        )
+
+    # Ignored configuration files can be explicitly included
+    index = ConfigurationIndex.FromWorkingTree(
+        repo_dir,
+        DEFAULT_CONFIGURATION_FILENAMES,
+        additional_filenames=[repo_dir / "Ignored" / "AutoGitSemVer.yaml"],
+    )
+
+    assert index.GetConfigurationRoot(PurePath("Ignored/File.txt")) == repo_dir / "Ignored"
+
+
+# ----------------------------------------------------------------------
+class TestFromTree:
+    # ----------------------------------------------------------------------
+    def test_Standard(self, tmp_path_factory):
+        repo_dir = self._CreateRepo(tmp_path_factory)
+
+        index = ConfigurationIndex.FromTree(repo_dir, DEFAULT_CONFIGURATION_FILENAMES)
+
+        # Files that aren't on disk (as in a sparse checkout) are included, untracked files are not
+        assert index.configuration_filenames == [
+            repo_dir / "Committed" / "AutoGitSemVer.yaml",
+            repo_dir / "NotOnDisk" / "AutoGitSemVer.yaml",
+        ]
+
+        index = ConfigurationIndex.FromTree(
+            repo_dir,
+            DEFAULT_CONFIGURATION_FILENAMES,
+            additional_filenames=[repo_dir / "Untracked" / "AutoGitSemVer.yaml"],
+        )
+
+        assert index.GetConfigurationRoot(PurePath("NotOnDisk/A/File.txt")) == repo_dir / "NotOnDisk"
+        assert index.GetConfigurationRoot(PurePath("Untracked/File.txt")) == repo_dir / "Untracked"
+        assert index.GetConfigurationRoot(PurePath("File.txt")) == repo_dir
+
+        # Working tree
+        index = ConfigurationIndex.FromTree(
+            repo_dir,
+            DEFAULT_CONFIGURATION_FILENAMES,
+            include_working_tree=True,
+        )
+
+        assert index.configuration_filenames == [
+            repo_dir / "Committed" / "AutoGitSemVer.yaml",
+            repo_dir / "NotOnDisk" / "AutoGitSemVer.yaml",
+            repo_dir / "Untracked" / "AutoGitSemVer.yaml",
+        ]
+        assert index.uncommitted_filenames == ["Untracked/AutoGitSemVer.yaml"]
+
+        # Previous trees
+        index = ConfigurationIndex.FromTree(repo_dir, DEFAULT_CONFIGURATION_FILENAMES, "HEAD~1")
+        assert index.configuration_filenames == [repo_dir / "Committed" / "AutoGitSemVer.yaml"]
+
+    # ----------------------------------------------------------------------
+    def test_NoCommits(self, tmp_path_factory):
+        repo_dir = tmp_path_factory.mktemp("repo")
+
+        assert SubprocessEx.Run("git init", cwd=repo_dir).returncode == 0
+
+        index = ConfigurationIndex.FromTree(repo_dir, DEFAULT_CONFIGURATION_FILENAMES)
+        assert index.configuration_filenames == []
+
+    # ----------------------------------------------------------------------
+    def test_Cache(self, tmp_path_factory):
+        repo_dir = self._CreateRepo(tmp_path_factory)
+        store = JsonStore.Open(tmp_path_factory.mktemp("store"), "indexes", 1)
+
+        expected = ConfigurationIndex.FromTree(
+            repo_dir, DEFAULT_CONFIGURATION_FILENAMES
+        ).configuration_filenames
+
+        # ----------------------------------------------------------------------
+        def Execute(**kwargs) -> int:
+            with patch.object(
+                GitEx,
+                "EnumNullDelimitedOutput",
+                side_effect=GitEx.EnumNullDelimitedOutput,
+            ) as enum_output:
+                index = ConfigurationIndex.FromTree(repo_dir, DEFAULT_CONFIGURATION_FILENAMES, **kwargs)
+
+            assert index.configuration_filenames == expected
+            return enum_output.call_count
+
+        # ----------------------------------------------------------------------
+
+        # In-process cache
+        assert Execute() == 0
+        assert Execute(store=store) == 0
+
+        # Persisted cache
+        with patch("AutoGitSemVer.ConfigurationIndex._tree_filenames_cache", {}):
+            assert Execute(store=store) == 1
+
+        with patch("AutoGitSemVer.ConfigurationIndex._tree_filenames_cache", {}):
+            assert Execute(store=store) == 0
+
+        # Different configuration filenames
+        with patch("AutoGitSemVer.ConfigurationIndex._tree_filenames_cache", {}):
+            index = ConfigurationIndex.FromTree(repo_dir, ["AutoGitSemVer.json"], store=store)
+            assert index.configuration_filenames == []
+
+    # ----------------------------------------------------------------------
+    def test_Concurrent(self, tmp_path_factory):
+        repo_dir = self._CreateRepo(tmp_path_factory)
+
+        expected = ConfigurationIndex.FromTree(
+            repo_dir, DEFAULT_CONFIGURATION_FILENAMES
+        ).configuration_filenames
+
+        # ----------------------------------------------------------------------
+        def Execute(
+            index: int,
+        ) -> list[Path]:
+            # Different configuration filenames produce different cache keys
+            return ConfigurationIndex.FromTree(
+                repo_dir,
+                ["AutoGitSemVer.yaml", "{}.yaml".format(index % 4)],
+            ).configuration_filenames
+
+        # ----------------------------------------------------------------------
+
+        # The cache is shared by threads (for example, by the server) and items are evicted frequently
+        with (
+            patch("AutoGitSemVer.ConfigurationIndex._tree_filenames_cache", {}),
+            patch("AutoGitSemVer.ConfigurationIndex._MAX_NUM_CACHED_TREES", 1),
+            ThreadPoolExecutor(8) as executor,
+        ):
+            results = list(executor.map(Execute, range(64)))
+
+        assert results == [expected] * 64
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateRepo(tmp_path_factory) -> Path:
+        repo_dir = tmp_path_factory.mktemp("repo")
+
+        assert SubprocessEx.Run("git init", cwd=repo_dir).returncode == 0
+        assert SubprocessEx.Run('git config user.name "Test User"', cwd=repo_dir).returncode == 0
+        assert SubprocessEx.Run('git config user.email "a@b.com"', cwd=repo_dir).returncode == 0
+
+        for directory in ["Committed", "NotOnDisk", "Untracked"]:
+            (repo_dir / directory).mkdir()
+            (repo_dir / directory / "AutoGitSemVer.yaml").write_text("{}\n")
+            (repo_dir / directory / "File.txt").write_text("File\n")
+
+        assert SubprocessEx.Run("git add Committed", cwd=repo_dir).returncode == 0
+        assert SubprocessEx.Run('git commit -m "Commit 1"', cwd=repo_dir).returncode == 0
+        assert SubprocessEx.Run("git add NotOnDisk", cwd=repo_dir).returncode == 0
+        assert SubprocessEx.Run('git commit -m "Commit 2"', cwd=repo_dir).returncode == 0
+
+        # Simulate a sparse checkout
+        assert (
+            SubprocessEx.Run(
+                "git update-index --skip-worktree NotOnDisk/AutoGitSemVer.yaml",
+                cwd=repo_dir,
+            ).returncode
+            == 0
+        )
+        (repo_dir / "NotOnDisk" / "AutoGitSemVer.yaml").unlink()
+
+        return repo_dir
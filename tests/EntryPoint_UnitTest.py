@@ -13,29 +13,51 @@
 # ----------------------------------------------------------------------
 # """Unit tests for EntryPoint.py."""
 
+import json
+import subprocess
+import sys
+
 from pathlib import Path
 from typing import Any, Mapping
 from unittest.mock import MagicMock as Mock, patch
 
 from typer.testing import CliRunner
 
-from AutoGitSemVer import GenerateStyle, GetSemanticVersionResult
+from semantic_version import Version as SemVer  # type: ignore [import-untyped]
+
+from AutoGitSemVer import GenerateStyle, GetSemanticVersionResult, Server
 from AutoGitSemVer.EntryPoint import app
+from AutoGitSemVer.Lib import GetSemanticVersionTrace, VersionDelta
+
+
+# ----------------------------------------------------------------------
+def test_Help():
+    result = CliRunner().invoke(app, ["--help"])
+    assert result.exit_code == 0
+
+    for command_name in ["Generate", "GenerateAll", "UpdateCommitGraph", "Serve"]:
+        assert command_name in result.output
+
+    # Invoking without arguments displays the same help
+    result = CliRunner().invoke(app, [])
+    assert "Usage:" in result.output and "Serve" in result.output
 
 
 # ----------------------------------------------------------------------
 def test_Default():
-    output, args, kwargs = _Execute()
+    output, args, kwargs = _Execute("Generate")
 
     assert len(args) == 2
     assert args[1] == Path.cwd()
 
-    assert len(kwargs) == 5
+    assert len(kwargs) == 7
     assert kwargs["prerelease_name"] is None
     assert kwargs["include_branch_name_when_necessary"] is True
     assert kwargs["no_prefix"] is False
     assert kwargs["no_metadata"] is False
     assert kwargs["style"] == GenerateStyle.Standard
+    assert kwargs["use_checkpoints"] is False
+    assert kwargs["use_pathspecs"] is False
 
 
 # ----------------------------------------------------------------------
@@ -60,12 +82,14 @@ def test_NonBoolArgs():
     assert len(args) == 2
     assert args[1] == Path.cwd()
 
-    assert len(kwargs) == 5
+    assert len(kwargs) == 7
     assert kwargs["prerelease_name"] == "prerelease_name"
     assert kwargs["include_branch_name_when_necessary"] is True
     assert kwargs["no_prefix"] is False
     assert kwargs["no_metadata"] is False
     assert kwargs["style"] == GenerateStyle.AllPrerelease
+    assert kwargs["use_checkpoints"] is False
+    assert kwargs["use_pathspecs"] is False
 
 
 # ----------------------------------------------------------------------
@@ -74,12 +98,14 @@ def test_BoolIncludeBranchNameWhenNecessary():
         "--no-branch-name",
     )
 
-    assert len(kwargs) == 5
+    assert len(kwargs) == 7
     assert kwargs["prerelease_name"] is None
     assert kwargs["include_branch_name_when_necessary"] is False
     assert kwargs["no_prefix"] is False
     assert kwargs["no_metadata"] is False
     assert kwargs["style"] == GenerateStyle.Standard
+    assert kwargs["use_checkpoints"] is False
+    assert kwargs["use_pathspecs"] is False
 
 
 # ----------------------------------------------------------------------
@@ -88,12 +114,14 @@ def test_BoolNoPrefix():
         "--no-prefix",
     )
 
-    assert len(kwargs) == 5
+    assert len(kwargs) == 7
     assert kwargs["prerelease_name"] is None
     assert kwargs["include_branch_name_when_necessary"] is True
     assert kwargs["no_prefix"] is True
     assert kwargs["no_metadata"] is False
     assert kwargs["style"] == GenerateStyle.Standard
+    assert kwargs["use_checkpoints"] is False
+    assert kwargs["use_pathspecs"] is False
 
 
 # ----------------------------------------------------------------------
@@ -102,17 +130,51 @@ def test_BoolNoMetadata():
         "--no-metadata",
     )
 
-    assert len(kwargs) == 5
+    assert len(kwargs) == 7
     assert kwargs["prerelease_name"] is None
     assert kwargs["include_branch_name_when_necessary"] is True
     assert kwargs["no_prefix"] is False
     assert kwargs["no_metadata"] is True
     assert kwargs["style"] == GenerateStyle.Standard
+    assert kwargs["use_checkpoints"] is False
+    assert kwargs["use_pathspecs"] is False
+
+
+# ----------------------------------------------------------------------
+def test_BoolUseCheckpoints():
+    output, args, kwargs = _Execute(
+        "--use-checkpoints",
+    )
+
+    assert len(kwargs) == 7
+    assert kwargs["prerelease_name"] is None
+    assert kwargs["include_branch_name_when_necessary"] is True
+    assert kwargs["no_prefix"] is False
+    assert kwargs["no_metadata"] is False
+    assert kwargs["style"] == GenerateStyle.Standard
+    assert kwargs["use_checkpoints"] is True
+    assert kwargs["use_pathspecs"] is False
+
+
+# ----------------------------------------------------------------------
+def test_BoolUsePathspecs():
+    output, args, kwargs = _Execute(
+        "--use-pathspecs",
+    )
+
+    assert len(kwargs) == 7
+    assert kwargs["prerelease_name"] is None
+    assert kwargs["include_branch_name_when_necessary"] is True
+    assert kwargs["no_prefix"] is False
+    assert kwargs["no_metadata"] is False
+    assert kwargs["style"] == GenerateStyle.Standard
+    assert kwargs["use_checkpoints"] is False
+    assert kwargs["use_pathspecs"] is True
 
 
 # ----------------------------------------------------------------------
 def test_Quiet():
-    output, args, kwargs = _Execute()
+    output, args, kwargs = _Execute("Generate")
     assert output != "1.2.3"
 
     output, args, kwargs = _Execute("--quiet")
@@ -129,15 +191,350 @@ def test_Version():
 
 
 # ----------------------------------------------------------------------
+def test_StartupTime():
+    # These modules are expensive to import and must only be imported by the code paths that need them
+    module_names = ["asyncio", "git", "inflect", "jsonschema", "rtyaml"]
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys, AutoGitSemVer, AutoGitSemVer.EntryPoint; print(json.dumps(sorted(name for name in {} if name in sys.modules)))".format(
+                module_names,
+            ),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert json.loads(result.stdout) == []
+
+
+# ----------------------------------------------------------------------
+def test_Server():
+    response = Server.GenerateResponse(
+        0,
+        "Generating with the server...\n  Output\nDONE!\n",
+        GetSemanticVersionResult(None, Mock(__str__=lambda self: "1.2.3"), "1.2.3"),
+    )
+
+    with (
+        patch("AutoGitSemVer.EntryPoint.Server.Generate", return_value=response) as server_mock,
+        patch("AutoGitSemVer.EntryPoint.GetSemanticVersion") as local_mock,
+    ):
+        result = CliRunner().invoke(app, ["--no-branch-name", "--use-pathspecs"])
+        assert result.exit_code == 0
+        assert "Generating with the server...\n  Output\nDONE!\n" in result.output
+
+        result = CliRunner().invoke(app, ["--quiet"])
+        assert result.exit_code == 0
+        assert result.output == "1.2.3"
+
+        assert not local_mock.call_args_list
+        assert len(server_mock.call_args_list) == 2
+
+        assert server_mock.call_args_list[0].args == (Path.cwd(),)
+
+        kwargs = server_mock.call_args_list[0].kwargs
+
+        assert len(kwargs) == 9
+        assert kwargs["prerelease_name"] is None
+        assert kwargs["include_branch_name_when_necessary"] is False
+        assert kwargs["no_prefix"] is False
+        assert kwargs["no_metadata"] is False
+        assert kwargs["style"] == GenerateStyle.Standard
+        assert kwargs["use_checkpoints"] is False
+        assert kwargs["use_pathspecs"] is True
+        assert kwargs["verbose"] is False
+        assert kwargs["debug"] is False
+
+        # Errors
+        server_mock.return_value = Server.GenerateResponse(-1, "ERROR: Something went wrong\n", None)
+
+        result = CliRunner().invoke(app, ["--quiet"])
+        assert result.exit_code != 0
+        assert result.output == "ERROR: Something went wrong\n"
+
+        # No server
+        result = CliRunner().invoke(app, ["--no-server"])
+        assert result.exit_code == 0
+
+        assert len(server_mock.call_args_list) == 3
+        assert len(local_mock.call_args_list) == 1
+
+
+# ----------------------------------------------------------------------
+def test_Profile(tmp_path):
+    json_filename = tmp_path / "profile.json"
+
+    # Use a temporary repository, as information is cached in the repository's git directory
+    repo_dir = tmp_path / "repo"
+    repo_dir.mkdir()
+
+    for args in [
+        ["init", "--quiet"],
+        ["commit", "--quiet", "--allow-empty", "-m", "Commit 1"],
+        ["commit", "--quiet", "--allow-empty", "-m", "Commit 2"],
+    ]:
+        subprocess.run(
+            ["git", "-c", "user.name=Test", "-c", "user.email=a@b.com", *args],
+            cwd=repo_dir,
+            check=True,
+        )
+
+    # The semantic version is generated in this process when profiling
+    with patch("AutoGitSemVer.EntryPoint.Server.Generate") as server_mock:
+        result = CliRunner().invoke(
+            app,
+            [
+                str(repo_dir),
+                "--profile",
+                "--profile-json",
+                str(json_filename),
+                "--no-branch-name",
+                "--no-metadata",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+
+        assert not server_mock.call_args_list
+
+    assert "Phase" in result.output
+    assert "enumerate_changes/retrieve_commits" in result.output
+    assert "git.processes" in result.output
+
+    content = json.loads(json_filename.read_text())
+
+    assert set(content) == {"wall_time", "phases", "counters", "cache_hit_rates"}
+    assert {"load_configuration", "enumerate_changes", "calculate_version"} <= set(content["phases"])
+    assert content["counters"]["git.processes"] > 0
+    assert content["counters"]["git.bytes_read"] > 0
+    assert content["counters"]["commits.scanned"] >= content["counters"]["commits.applied"]
+
+
+# ----------------------------------------------------------------------
+def test_OutputJson():
+    result = GetSemanticVersionResult(
+        Path("AutoGitSemVer.yaml"),
+        SemVer("1.3.1-beta+metadata"),
+        "v1.3.1-beta+metadata",
+        trace=GetSemanticVersionTrace(
+            VersionDelta(1, 2, 3, None, None),
+            "v1.2.3",
+            "abc123",
+            3,
+            2,
+            0,
+            [
+                ("def456", VersionDelta(0, 0, 1, None, None)),
+                ("ghi789", VersionDelta(0, 1, 0, None, None)),
+            ],
+        ),
+    )
+
+    with (
+        patch("AutoGitSemVer.EntryPoint.GetSemanticVersion", return_value=result) as local_mock,
+        patch("AutoGitSemVer.EntryPoint.Server.Generate") as server_mock,
+    ):
+        output = CliRunner().invoke(app, ["--output", "json"])
+        assert output.exit_code == 0, output.output
+
+        # The trace is only available when the semantic version is generated in this process
+        assert not server_mock.call_args_list
+        assert len(local_mock.call_args_list) == 1
+
+    content = json.loads(output.output)
+
+    assert set(content["timing"]) == {"wall_time", "phases", "counters", "cache_hit_rates"}
+    del content["timing"]
+
+    assert content == {
+        "configuration_filename": "AutoGitSemVer.yaml",
+        "semantic_version": "1.3.1-beta+metadata",
+        "semantic_version_string": "v1.3.1-beta+metadata",
+        "components": {
+            "major": 1,
+            "minor": 3,
+            "patch": 1,
+            "prerelease": ["beta"],
+            "build": ["metadata"],
+        },
+        "base_version": "1.2.3",
+        "base_tag": "v1.2.3",
+        "base_commit": "abc123",
+        "num_commits_scanned": 3,
+        "num_commits_applied": 2,
+        "num_commits_reused_from_checkpoint": 0,
+        "version_deltas": [
+            {"commit": "def456", "delta": "0.0.1"},
+            {"commit": "ghi789", "delta": "0.1.0"},
+        ],
+    }
+
+    # Errors
+    # ----------------------------------------------------------------------
+    def GenerateWithErrors(dm, *args, **kwargs):
+        dm.WriteError("Something went wrong")
+
+    # ----------------------------------------------------------------------
+
+    with patch("AutoGitSemVer.EntryPoint.GetSemanticVersion", side_effect=GenerateWithErrors):
+        output = CliRunner().invoke(app, ["--output", "json"])
+        assert output.exit_code != 0
+        assert "Something went wrong" in output.output
+
+
+# ----------------------------------------------------------------------
+def test_Watch():
+    # ----------------------------------------------------------------------
+    def Watch(*args, **kwargs):
+        yield GetSemanticVersionResult(None, Mock(), "1.2.3")
+        yield GetSemanticVersionResult(None, Mock(), "1.2.4")
+
+        raise KeyboardInterrupt()
+
+    # ----------------------------------------------------------------------
+
+    with patch("AutoGitSemVer.EntryPoint.WatchSemanticVersion", side_effect=Watch) as mock:
+        result = CliRunner().invoke(app, ["--watch", "--watch-interval", "0.5", "--quiet"])
+        assert result.exit_code == 0
+        assert result.output == "1.2.3\n1.2.4\n"
+
+        assert mock.call_args_list[0].args[1] == Path.cwd()
+
+        kwargs = mock.call_args_list[0].kwargs
+
+        assert len(kwargs) == 7
+        assert kwargs["interval"] == 0.5
+        assert kwargs["prerelease_name"] is None
+        assert kwargs["include_branch_name_when_necessary"] is True
+        assert kwargs["no_prefix"] is False
+        assert kwargs["no_metadata"] is False
+        assert kwargs["style"] == GenerateStyle.Standard
+        assert kwargs["use_pathspecs"] is False
+
+        # Errors are displayed in quiet mode
+        # ----------------------------------------------------------------------
+        def WatchError(dm, *args, **kwargs):
+            with dm.Nested("Generating 1.2.3..."):
+                pass
+
+            yield GetSemanticVersionResult(None, Mock(), "1.2.3")
+
+            with dm.Nested("Generating 1.2.4..."):
+                raise Exception("Something went wrong")
+
+        # ----------------------------------------------------------------------
+
+        mock.side_effect = WatchError
+
+        result = CliRunner().invoke(app, ["--watch", "--quiet"])
+        assert result.exit_code != 0
+        assert "Something went wrong" in result.output
+
+        # Output for versions that were generated successfully isn't retained
+        assert "Generating 1.2.3..." not in result.output
+        assert "Generating 1.2.4..." in result.output
+
+        # Errors reported while watching are displayed in quiet mode
+        # ----------------------------------------------------------------------
+        def WatchReportedError(dm, *args, **kwargs):
+            yield GetSemanticVersionResult(None, Mock(), "1.2.3")
+
+            dm.WriteError("Something went wrong\n")
+
+            yield GetSemanticVersionResult(None, Mock(), "1.2.4")
+
+            raise KeyboardInterrupt()
+
+        # ----------------------------------------------------------------------
+
+        mock.side_effect = WatchReportedError
+
+        result = CliRunner().invoke(app, ["--watch", "--quiet"])
+        assert result.exit_code != 0
+        assert result.output.startswith("1.2.3\n1.2.4\n")
+        assert "Something went wrong" in result.output
+
+
+# ----------------------------------------------------------------------
+def test_Serve():
+    with patch("AutoGitSemVer.EntryPoint.Server.Server") as server_mock:
+        server_mock.return_value.__enter__.return_value.socket_filename = Path("test.sock")
+        server_mock.return_value.__enter__.return_value.ServeForever.side_effect = KeyboardInterrupt()
+
+        result = CliRunner().invoke(app, ["Serve", "--socket", "test.sock"])
+        assert result.exit_code == 0
+        assert "Listening at 'test.sock'" in result.output
+
+        assert server_mock.call_args_list[0].args == (Path.cwd() / "test.sock",)
+
+
+# ----------------------------------------------------------------------
+def test_GenerateAll():
+    results = [
+        GetSemanticVersionResult(
+            Path("A") / "AutoGitSemVer.yaml", Mock(__str__=lambda self: "1.2.3"), "1.2.3"
+        ),
+        GetSemanticVersionResult(None, Mock(__str__=lambda self: "4.5.6"), "v4.5.6"),
+    ]
+
+    with patch("AutoGitSemVer.EntryPoint.GetSemanticVersions", return_value=results) as mock:
+        result = CliRunner().invoke(app, ["GenerateAll", "--no-branch-name"])
+        assert result.exit_code == 0
+
+        assert len(mock.call_args_list) == 1
+        assert mock.call_args_list[0].args[1] == Path.cwd()
+
+        kwargs = mock.call_args_list[0].kwargs
+
+        assert len(kwargs) == 5
+        assert kwargs["prerelease_name"] is None
+        assert kwargs["include_branch_name_when_necessary"] is False
+        assert kwargs["no_prefix"] is False
+        assert kwargs["no_metadata"] is False
+        assert kwargs["style"] == GenerateStyle.Standard
+
+        result = CliRunner().invoke(app, ["GenerateAll", "--output", "json"])
+        assert result.exit_code == 0
+
+        assert json.loads(result.output) == [
+            {
+                "configuration_filename": str(Path("A") / "AutoGitSemVer.yaml"),
+                "semantic_version": "1.2.3",
+                "semantic_version_string": "1.2.3",
+            },
+            {
+                "configuration_filename": None,
+                "semantic_version": "4.5.6",
+                "semantic_version_string": "v4.5.6",
+            },
+        ]
+
+
 # ----------------------------------------------------------------------
+def test_UpdateCommitGraph():
+    with patch("AutoGitSemVer.EntryPoint.GitEx.WriteCommitGraph") as mock:
+        result = CliRunner().invoke(app, ["UpdateCommitGraph"])
+        assert result.exit_code == 0
+
+        assert len(mock.call_args_list) == 1
+        assert mock.call_args_list[0].args == (Path.cwd(),)
+
+
 # ----------------------------------------------------------------------
 def _Execute(
     *args,
 ) -> tuple[str, tuple[Any, ...], Mapping[str, Any]]:
-    with patch(
-        "AutoGitSemVer.EntryPoint.GetSemanticVersion",
-        return_value=GetSemanticVersionResult(None, Mock(), "1.2.3"),
-    ) as mock:
+    with (
+        patch(
+            "AutoGitSemVer.EntryPoint.GetSemanticVersion",
+            return_value=GetSemanticVersionResult(None, Mock(), "1.2.3"),
+        ) as mock,
+        # Don't use a server that happens to be running
+        patch("AutoGitSemVer.EntryPoint.Server.Generate", return_value=None),
+    ):
         result = CliRunner().invoke(app, list(args))
         assert result.exit_code == 0
 
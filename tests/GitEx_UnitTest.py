@@ -0,0 +1,312 @@
+# ----------------------------------------------------------------------
+# |
+# |  GitEx_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 09:41:07
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for AutoGitSemVer/GitEx.py"""
+
+import re
+import subprocess
+
+from pathlib import Path
+
+import pytest
+
+from AutoGitSemVer.GitEx import *
+
+
+# ----------------------------------------------------------------------
+class TestEnumNullDelimitedOutput:
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        tokens = list(EnumNullDelimitedOutput(_REPO_ROOT, ["ls-files", "-z", "src/AutoGitSemVer"]))
+
+        assert b"src/AutoGitSemVer/EntryPoint.py" in tokens
+        assert b"src/AutoGitSemVer/Lib.py" in tokens
+        assert b"" not in tokens
+
+    # ----------------------------------------------------------------------
+    def test_SmallChunks(self):
+        expected = list(EnumNullDelimitedOutput(_REPO_ROOT, ["ls-files", "-z"]))
+
+        assert list(EnumNullDelimitedOutput(_REPO_ROOT, ["ls-files", "-z"], chunk_size=3)) == expected
+
+    # ----------------------------------------------------------------------
+    def test_EarlyTermination(self):
+        tokens = EnumNullDelimitedOutput(_REPO_ROOT, ["ls-files", "-z"], chunk_size=1)
+
+        assert next(tokens)
+
+        # This should terminate the process without raising an exception
+        tokens.close()
+
+    # ----------------------------------------------------------------------
+    def test_Error(self):
+        with pytest.raises(Exception, match=r"'git rev-parse --verify this-is-not-a-valid-ref' failed: "):
+            list(EnumNullDelimitedOutput(_REPO_ROOT, ["rev-parse", "--verify", "this-is-not-a-valid-ref"]))
+
+
+# ----------------------------------------------------------------------
+class TestObjectReader:
+    # ----------------------------------------------------------------------
+    def test_GetInfo(self):
+        with ObjectReader(_REPO_ROOT) as reader:
+            head = reader.GetInfo("HEAD")
+
+            assert head is not None
+            assert head[0] == ResolveObject(_REPO_ROOT, "HEAD")
+            assert head[1] == "commit"
+            assert head[2] > 0
+
+            tree = reader.GetInfo("HEAD^{tree}")
+
+            assert tree is not None
+            assert tree[0] == ResolveObject(_REPO_ROOT, "HEAD^{tree}")
+            assert tree[1] == "tree"
+
+            assert reader.GetInfo("this-is-not-a-valid-ref") is None
+
+    # ----------------------------------------------------------------------
+    def test_Read(self):
+        with ObjectReader(_REPO_ROOT) as reader:
+            result = reader.Read("HEAD:README.md")
+
+            assert result is not None
+            assert result[1] == "blob"
+            assert (
+                result[2]
+                == subprocess.run(
+                    ["git", "show", "HEAD:README.md"],
+                    cwd=_REPO_ROOT,
+                    capture_output=True,
+                    check=True,
+                ).stdout
+            )
+
+            # The stream is positioned correctly for subsequent reads
+            for _ in range(3):
+                result = reader.Read("HEAD")
+
+                assert result is not None
+                assert result[1] == "commit"
+                assert result[2].startswith(b"tree ")
+
+            assert reader.Read("this-is-not-a-valid-ref") is None
+
+    # ----------------------------------------------------------------------
+    def test_GetParents(self):
+        with ObjectReader(_REPO_ROOT) as reader:
+            assert reader.GetParents("HEAD") == [ResolveObject(_REPO_ROOT, "HEAD~1")]
+
+            with pytest.raises(Exception, match=re.escape("'HEAD^{tree}' is not a valid commit.")):
+                reader.GetParents("HEAD^{tree}")
+
+    # ----------------------------------------------------------------------
+    def test_ProcessReuse(self):
+        num_processes = GetNumSpawnedProcesses()
+
+        reader = ObjectReader(_REPO_ROOT)
+
+        # Processes are created on demand
+        assert GetNumSpawnedProcesses() == num_processes
+
+        for _ in range(10):
+            reader.GetInfo("HEAD")
+            reader.Read("HEAD")
+
+        assert GetNumSpawnedProcesses() == num_processes + 2
+
+        reader.Close()
+        reader.Close()
+
+        # Processes are created again after closing
+        reader.GetInfo("HEAD")
+        assert GetNumSpawnedProcesses() == num_processes + 3
+
+        reader.Close()
+
+
+# ----------------------------------------------------------------------
+def test_CancellationScope():
+    with CancellationScope() as scope:
+        assert not scope.is_cancelled
+
+        with ObjectReader(_REPO_ROOT) as reader:
+            assert reader.GetInfo("HEAD") is not None
+
+            scope.Cancel()
+            assert scope.is_cancelled
+
+            # The running process was killed
+            with pytest.raises(Exception):
+                reader.GetInfo("HEAD")
+
+        # New processes can't be spawned
+        with pytest.raises(Exception, match=re.escape("The operation was cancelled.")):
+            ResolveObject(_REPO_ROOT, "HEAD")
+
+    # The scope no longer applies
+    assert ResolveObject(_REPO_ROOT, "HEAD") is not None
+
+
+# ----------------------------------------------------------------------
+def test_ContainsMerges(tmp_path):
+    # ----------------------------------------------------------------------
+    def Git(*args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=Test", "-c", "user.email=a@b.com", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    # ----------------------------------------------------------------------
+
+    Git("init", "--quiet", "--initial-branch=main")
+    Git("commit", "--quiet", "--allow-empty", "-m", "Commit 1")
+    Git("checkout", "--quiet", "-b", "feature")
+    Git("commit", "--quiet", "--allow-empty", "-m", "Feature")
+    Git("checkout", "--quiet", "main")
+    Git("commit", "--quiet", "--allow-empty", "-m", "Commit 2")
+
+    first = ResolveObject(tmp_path, "HEAD~1")
+    assert first is not None
+
+    assert ContainsMerges(tmp_path, ["HEAD", "^{}".format(first)]) is False
+
+    Git("merge", "--quiet", "--no-ff", "-m", "Merge", "feature")
+    Git("commit", "--quiet", "--allow-empty", "-m", "Commit 3")
+
+    assert ContainsMerges(tmp_path, ["HEAD", "^{}".format(first)]) is True
+    assert ContainsMerges(tmp_path, ["HEAD", "^HEAD~1"]) is False
+
+    with pytest.raises(Exception, match=r"'git rev-list' failed: "):
+        ContainsMerges(tmp_path, ["this-is-not-a-valid-ref"])
+
+
+# ----------------------------------------------------------------------
+def test_GetStatus(tmp_path):
+    # ----------------------------------------------------------------------
+    def Git(*args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=Test", "-c", "user.email=a@b.com", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    # ----------------------------------------------------------------------
+
+    Git("init", "--quiet", "--initial-branch=main")
+
+    assert GetStatus(tmp_path) == Status(None, "main", False, [])
+
+    (tmp_path / "A.txt").write_text("A")
+    (tmp_path / "B.txt").write_text("B")
+    (tmp_path / "C.txt").write_text("C")
+
+    Git("add", ".")
+    assert GetStatus(tmp_path) == Status(None, "main", True, ["A.txt", "B.txt", "C.txt"])
+
+    Git("commit", "--quiet", "-m", "Commit")
+
+    head = ResolveObject(tmp_path, "HEAD")
+
+    # Untracked files are not considered
+    (tmp_path / "Untracked.txt").write_text("Untracked")
+    assert GetStatus(tmp_path) == Status(head, "main", False, [])
+
+    # Unstaged changes
+    (tmp_path / "A.txt").write_text("Modified")
+    assert GetStatus(tmp_path) == Status(head, "main", True, [])
+
+    # Staged changes (renames are reported as a deletion and an addition)
+    Git("add", "A.txt")
+    Git("mv", "B.txt", "Renamed B.txt")
+    Git("rm", "--quiet", "C.txt")
+
+    assert GetStatus(tmp_path) == Status(head, "main", True, ["A.txt", "B.txt", "C.txt", "Renamed B.txt"])
+
+    # Detached head
+    Git("reset", "--quiet", "--hard")
+    Git("checkout", "--quiet", "--detach")
+
+    assert GetStatus(tmp_path) == Status(head, None, False, [])
+
+    # Conflicts
+    Git("checkout", "--quiet", "-b", "feature")
+    (tmp_path / "A.txt").write_text("Feature")
+    Git("commit", "--quiet", "-am", "Feature")
+
+    Git("checkout", "--quiet", "main")
+    (tmp_path / "A.txt").write_text("Main")
+    Git("commit", "--quiet", "-am", "Main")
+
+    assert (
+        subprocess.run(
+            ["git", "-c", "user.name=Test", "-c", "user.email=a@b.com", "merge", "feature"],
+            cwd=tmp_path,
+            capture_output=True,
+        ).returncode
+        != 0
+    )
+
+    status = GetStatus(tmp_path)
+
+    assert status.is_dirty
+    assert status.staged_filenames == ["A.txt"]
+
+
+# ----------------------------------------------------------------------
+def test_ResolveObject():
+    tree = ResolveObject(_REPO_ROOT, "HEAD^{tree}")
+
+    assert tree is not None
+    assert len(tree) == 40
+    assert tree != ResolveObject(_REPO_ROOT, "HEAD")
+
+    assert ResolveObject(_REPO_ROOT, "this-is-not-a-valid-ref") is None
+
+
+# ----------------------------------------------------------------------
+def test_WriteCommitGraph(tmp_path):
+    repo_dir = tmp_path / "repo"
+    repo_dir.mkdir()
+
+    subprocess.run(["git", "init", "--quiet"], cwd=repo_dir, check=True)
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=Test",
+            "-c",
+            "user.email=a@b.com",
+            "commit",
+            "--quiet",
+            "--allow-empty",
+            "-m",
+            "Commit",
+        ],
+        cwd=repo_dir,
+        check=True,
+    )
+
+    WriteCommitGraph(repo_dir)
+    assert (repo_dir / ".git" / "objects" / "info" / "commit-graph").is_file()
+
+    with pytest.raises(Exception, match=r"'git commit-graph write' failed: "):
+        WriteCommitGraph(tmp_path)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+_REPO_ROOT = Path(__file__).parent.parent
@@ -0,0 +1,170 @@
+# ----------------------------------------------------------------------
+# |
+# |  JsonStore_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 14:05:52
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for AutoGitSemVer/JsonStore.py"""
+
+import json
+import os
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from AutoGitSemVer.JsonStore import *
+
+
+# ----------------------------------------------------------------------
+def test_RoundTrip(tmp_path):
+    store = _Open(tmp_path)
+
+    assert store.Load("key") is None
+
+    store.Save("key", {"one": 1, "two": [2, "two"]})
+    store.Save("another key", "value")
+
+    store = _Open(tmp_path)
+
+    assert store.Load("key") == {"one": 1, "two": [2, "two"]}
+    assert store.Load("another key") == "value"
+
+    # Overwrite
+    store.Save("key", None)
+    assert store.Load("key") is None
+
+
+# ----------------------------------------------------------------------
+def test_DifferentVersion(tmp_path):
+    _Open(tmp_path).Save("key", "value")
+
+    assert _Open(tmp_path, version=2).Load("key") is None
+    assert _Open(tmp_path).Load("key") == "value"
+
+
+# ----------------------------------------------------------------------
+def test_Corruption(tmp_path):
+    store = _Open(tmp_path)
+
+    store.Save("key", "value")
+
+    (filename,) = list(store.directory.glob("*.json"))
+
+    with filename.open(encoding="utf-8") as f:
+        content = json.load(f)
+
+    # Invalid checksum
+    with filename.open("w", encoding="utf-8") as f:
+        json.dump(dict(content, content="different value"), f)
+
+    assert store.Load("key") is None
+
+    # Different key
+    with filename.open("w", encoding="utf-8") as f:
+        json.dump(dict(content, key="different key"), f)
+
+    assert store.Load("key") is None
+
+    # Invalid content
+    with filename.open("w", encoding="utf-8") as f:
+        f.write("[1, 2, 3]")
+
+    assert store.Load("key") is None
+
+    # Invalid JSON
+    with filename.open("w", encoding="utf-8") as f:
+        f.write("This is not JSON")
+
+    assert store.Load("key") is None
+
+    # Original content
+    with filename.open("w", encoding="utf-8") as f:
+        json.dump(content, f)
+
+    assert store.Load("key") == "value"
+
+
+# ----------------------------------------------------------------------
+def test_Eviction(tmp_path):
+    store = _Open(tmp_path, max_num_items=3)
+
+    for index, key in enumerate(["one", "two", "three"]):
+        store.Save(key, index)
+
+    # Make the modified times deterministic
+    for index, filename in enumerate(
+        sorted(store.directory.glob("*.json"), key=lambda f: f.stat().st_mtime_ns)
+    ):
+        os.utime(filename, ns=(index * 1_000_000_000, index * 1_000_000_000))
+
+    # Loading an item prevents it from being evicted
+    assert store.Load("one") == 0
+
+    store.Save("four", 3)
+
+    assert store.Load("one") == 0
+    assert store.Load("two") is None
+    assert store.Load("three") == 2
+    assert store.Load("four") == 3
+
+    assert len(list(store.directory.glob("*"))) == 3
+
+
+# ----------------------------------------------------------------------
+def test_Unavailable(tmp_path):
+    (tmp_path / JsonStore.DIRECTORY_NAME).touch()
+
+    assert JsonStore.Open(tmp_path, "name", 1) is None
+
+
+# ----------------------------------------------------------------------
+def test_ReadOnly(tmp_path):
+    store = _Open(tmp_path)
+
+    store.directory.rmdir()
+
+    # Errors are suppressed
+    store.Save("key", "value")
+    assert store.Load("key") is None
+
+
+# ----------------------------------------------------------------------
+def test_SaveErrors(tmp_path):
+    store = _Open(tmp_path)
+
+    # Errors while replacing the file
+    with patch("AutoGitSemVer.JsonStore.os.replace", side_effect=OSError("Replace failed")):
+        store.Save("key", "value")
+
+    assert store.Load("key") is None
+    assert list(store.directory.glob("*")) == []
+
+    # Errors while writing the content
+    with pytest.raises(TypeError):
+        store.Save("key", object())
+
+    assert list(store.directory.glob("*")) == []
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Open(
+    git_dir: Path,
+    *,
+    version: int = 1,
+    **kwargs,
+) -> JsonStore:
+    store = JsonStore.Open(git_dir, "name", version, **kwargs)
+    assert store is not None
+
+    return store
@@ -13,17 +13,37 @@
 # ----------------------------------------------------------------------
 """Unit test for AutoGitSemVer/Lib.py"""
 
+import asyncio
+import contextlib
+import functools
+import json
+import multiprocessing
+import os
 import re
+import subprocess
+import sys
 import textwrap
+import threading
+import time
 
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from io import StringIO
-from unittest.mock import patch
+from typing import Any, Iterable, Iterator
+from unittest.mock import MagicMock as Mock, patch, PropertyMock
 from uuid import uuid4
 
+import git
 import pytest
+import rtyaml  # type: ignore [import-untyped]
 
 from dbrownell_Common import SubprocessEx  # type: ignore [import-untyped]
+from dbrownell_Common.Streams.DoneManager import Flags as DoneManagerFlags  # type: ignore [import-untyped]
+from jsonschema import validators  # type: ignore [import-untyped]
 
+from AutoGitSemVer import GitEx, Lib
+from AutoGitSemVer.CommitCache import CommitCache
+from AutoGitSemVer.JsonStore import JsonStore
 from AutoGitSemVer.Lib import *  # type: ignore [import-untyped]
 
 
@@ -98,6 +118,375 @@ def test_EnumCommits(tmp_path_factory):
     ]
 
 
+# ----------------------------------------------------------------------
+def test_DetachedHead(tmp_path_factory):
+    repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+    TestCheckpoints._Commit(repo_dir, "Commit 1")
+    TestCheckpoints._Commit(repo_dir, "Commit 2")
+
+    assert SubprocessEx.Run("git checkout --quiet --detach", cwd=repo_dir).returncode == 0
+
+    (repo_dir / "Working.txt").write_text("Working")
+    assert SubprocessEx.Run("git add Working.txt", cwd=repo_dir).returncode == 0
+
+    commits = list(EnumCommits(repo_dir))
+
+    assert len(commits) == 3
+    assert commits[0].id == CommitInfo.WORKING_CHANGES_COMMIT_ID
+    assert commits[0].files == [PurePath("Working.txt")]
+
+    with DoneManager.Create(StringIO(), "") as dm:
+        result = GetSemanticVersion(
+            dm,
+            repo_dir,
+            include_timestamp_when_necessary=False,
+            include_computer_name_when_necessary=False,
+        )
+
+    assert result.semantic_version_string == "0.1.2-<detached head>+working_changes"
+
+
+# ----------------------------------------------------------------------
+def test_EnumCommitsTags(tmp_path_factory):
+    repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+    TestCheckpoints._Commit(repo_dir, "Commit 1", tag="v1.0.0")
+    TestCheckpoints._Commit(repo_dir, "Commit 2")
+
+    assert SubprocessEx.Run('git tag -a v2.0.0 -m "Annotated"', cwd=repo_dir).returncode == 0
+    assert SubprocessEx.Run("git tag not-a-version", cwd=repo_dir).returncode == 0
+    assert SubprocessEx.Run("git tag v3.0.0-tree HEAD^{tree}", cwd=repo_dir).returncode == 0
+
+    assert SubprocessEx.Run("git checkout --quiet -b feature", cwd=repo_dir).returncode == 0
+    TestCheckpoints._Commit(repo_dir, "Commit 3", filename="Feature.txt")
+    assert SubprocessEx.Run("git checkout --quiet -", cwd=repo_dir).returncode == 0
+    TestCheckpoints._Commit(repo_dir, "Commit 4")
+
+    assert SubprocessEx.Run('git merge --no-ff -m "Merge" feature', cwd=repo_dir).returncode == 0
+    assert SubprocessEx.Run('git tag -a v4.0.0 -m "Merge"', cwd=repo_dir).returncode == 0
+
+    # ----------------------------------------------------------------------
+    def GetTags(
+        commits: Iterable[CommitInfo],
+    ) -> dict[str, list[str]]:
+        return {commit.description.strip(): commit.tags for commit in commits}
+
+    # ----------------------------------------------------------------------
+
+    # Tags associated with commits as calculated by GitPython
+    expected: dict[str, list[str]] = {}
+
+    for tag in git.Repo(repo_dir).tags:
+        try:
+            commit = tag.commit
+        except ValueError:
+            continue
+
+        if len(commit.parents) <= 1:
+            expected.setdefault(commit.hexsha, []).append(tag.name)
+            continue
+
+        for parent in commit.parents:
+            if len(parent.parents) == 1:
+                expected.setdefault(parent.hexsha, []).append(tag.name)
+                break
+
+    commits = list(EnumCommits(repo_dir))
+
+    assert {commit.id: commit.tags for commit in commits if commit.tags} == expected
+    assert GetTags(commits) == {
+        "Commit 1": ["v1.0.0"],
+        "Commit 2": ["not-a-version", "v2.0.0"],
+        "Commit 3": [],
+        "Commit 4": ["v4.0.0"],
+    }
+
+    # Tag patterns
+    assert GetTags(EnumCommits(repo_dir, tag_patterns=["v[0-9]*"])) == {
+        "Commit 1": ["v1.0.0"],
+        "Commit 2": ["v2.0.0"],
+        "Commit 3": [],
+        "Commit 4": ["v4.0.0"],
+    }
+
+    assert GetTags(EnumCommits(repo_dir, tag_patterns=["v1*", "v2*"])) == {
+        "Commit 1": ["v1.0.0"],
+        "Commit 2": ["v2.0.0"],
+        "Commit 3": [],
+        "Commit 4": [],
+    }
+
+    # Only the tag information is read from git
+    with patch.object(git.Repo, "tags", new_callable=PropertyMock) as tags:
+        list(EnumCommits(repo_dir))
+
+    assert not tags.called
+
+
+# ----------------------------------------------------------------------
+def test_EnumCommitsLongHistory(tmp_path_factory):
+    repo_dir = tmp_path_factory.mktemp("repo")
+
+    assert SubprocessEx.Run("git init", cwd=repo_dir).returncode == 0
+    assert SubprocessEx.Run('git config user.name "Test User"', cwd=repo_dir).returncode == 0
+    assert SubprocessEx.Run('git config user.email "a@b.com"', cwd=repo_dir).returncode == 0
+
+    # Create more commits than the previous implementation's batch size
+    num_commits = 120
+
+    for index in range(num_commits):
+        with (repo_dir / "File{}.txt".format(index)).open("w") as f:
+            pass
+
+        assert SubprocessEx.Run("git add .", cwd=repo_dir).returncode == 0
+        assert SubprocessEx.Run('git commit -m "Commit {}"'.format(index), cwd=repo_dir).returncode == 0
+
+    commits = list(EnumCommits(repo_dir))
+
+    assert len(commits) == num_commits
+    assert len(set(commit.id for commit in commits)) == num_commits
+
+    for index, commit in enumerate(reversed(commits)):
+        assert commit.description == "Commit {}\n".format(index)
+        assert commit.author == "Test User"
+        assert commit.author_date.tzinfo is not None
+        assert commit.files == [PurePath("File{}.txt".format(index))]
+
+    # Enumeration stops at the terminal tag without reading the remainder of the history
+    assert SubprocessEx.Run("git tag v1.0.0 HEAD~9", cwd=repo_dir).returncode == 0
+
+    enum_log_records = GitEx.EnumLogRecords
+    num_records_read = 0
+
+    # ----------------------------------------------------------------------
+    def EnumLogRecords(*args, **kwargs):
+        nonlocal num_records_read
+
+        for record in enum_log_records(*args, **kwargs):
+            num_records_read += 1
+            yield record
+
+    # ----------------------------------------------------------------------
+
+    with patch.object(GitEx, "EnumLogRecords", side_effect=EnumLogRecords):
+        commits = list(
+            EnumCommits(repo_dir, use_cache=False, is_terminal_commit_func=lambda commit: True),
+        )
+
+    assert len(commits) == 10
+    assert commits[-1].tags == ["v1.0.0"]
+
+    assert 10 <= num_records_read < num_commits
+
+
+# ----------------------------------------------------------------------
+def test_EnumCommitsFiles(tmp_path_factory):
+    repo_dir = tmp_path_factory.mktemp("repo")
+
+    assert SubprocessEx.Run("git init", cwd=repo_dir).returncode == 0
+    assert SubprocessEx.Run('git config user.name "Test User"', cwd=repo_dir).returncode == 0
+    assert SubprocessEx.Run('git config user.email "a@b.com"', cwd=repo_dir).returncode == 0
+
+    # Root commit
+    (repo_dir / "dir").mkdir()
+
+    for filename in ["one.txt", "two.txt", "dir/three.txt", "with space.txt", "unicod\u00e9.txt"]:
+        with (repo_dir / filename).open("w") as f:
+            f.write(filename)
+
+    assert SubprocessEx.Run("git add .", cwd=repo_dir).returncode == 0
+    assert SubprocessEx.Run('git commit -m "Root"', cwd=repo_dir).returncode == 0
+
+    # Rename
+    assert SubprocessEx.Run("git mv one.txt renamed.txt", cwd=repo_dir).returncode == 0
+    assert SubprocessEx.Run('git commit -m "Rename"', cwd=repo_dir).returncode == 0
+
+    # Modify and delete
+    with (repo_dir / "dir" / "three.txt").open("a") as f:
+        f.write("modified")
+
+    assert SubprocessEx.Run("git rm --quiet two.txt", cwd=repo_dir).returncode == 0
+    assert SubprocessEx.Run('git commit -a -m "Modify and delete"', cwd=repo_dir).returncode == 0
+
+    # Empty
+    assert SubprocessEx.Run('git commit --allow-empty -m "Empty"', cwd=repo_dir).returncode == 0
+
+    commits = list(EnumCommits(repo_dir))
+
+    assert [commit.description for commit in commits] == [
+        "Empty\n",
+        "Modify and delete\n",
+        "Rename\n",
+        "Root\n",
+    ]
+
+    assert commits[0].files == []
+    assert commits[1].files == [PurePath("dir/three.txt"), PurePath("two.txt")]
+    assert commits[2].files == [PurePath("one.txt"), PurePath("renamed.txt")]
+    assert commits[3].files == [
+        PurePath("dir/three.txt"),
+        PurePath("one.txt"),
+        PurePath("two.txt"),
+        PurePath("unicod\u00e9.txt"),
+        PurePath("with space.txt"),
+    ]
+
+    # The files should be the same as those produced by GitPython's (much slower) per-commit diffs.
+    # Note that GitPython quotes non-ascii filenames, so those are not included in the comparison.
+    repo = git.Repo(repo_dir)
+
+    for commit in commits:
+        assert set(file for file in commit.files if str(file).isascii()) == set(
+            PurePath(path) for path in repo.commit(commit.id).stats.files if not path.startswith('"')
+        )
+
+
+# ----------------------------------------------------------------------
+def test_EnumCommitsCache(tmp_path_factory):
+    repo_dir = tmp_path_factory.mktemp("repo")
+
+    assert SubprocessEx.Run("git init", cwd=repo_dir).returncode == 0
+    assert SubprocessEx.Run('git config user.name "Test User"', cwd=repo_dir).returncode == 0
+    assert SubprocessEx.Run('git config user.email "a@b.com"', cwd=repo_dir).returncode == 0
+
+    # ----------------------------------------------------------------------
+    def CreateCommits(start: int, end: int) -> None:
+        for index in range(start, end):
+            with (repo_dir / "File{}.txt".format(index)).open("w") as f:
+                pass
+
+            assert SubprocessEx.Run("git add .", cwd=repo_dir).returncode == 0
+            assert SubprocessEx.Run('git commit -m "Commit {}"'.format(index), cwd=repo_dir).returncode == 0
+
+    # ----------------------------------------------------------------------
+    def Enumerate(**kwargs) -> tuple[list[CommitInfo], int]:
+        with patch(
+            "AutoGitSemVer.Lib.GitEx.EnumLogRecords",
+            side_effect=GitEx.EnumLogRecords,
+        ) as enum_log_records:
+            return list(EnumCommits(repo_dir, **kwargs)), enum_log_records.call_count
+
+    # ----------------------------------------------------------------------
+
+    CreateCommits(0, 100)
+
+    expected, num_calls = Enumerate(use_cache=False)
+    assert len(expected) == 100
+    assert num_calls == 1
+    assert not (repo_dir / ".git" / CommitCache.DIRECTORY_NAME).exists()
+
+    # Cold cache; misses are retrieved in batches
+    commits, num_calls = Enumerate()
+    assert commits == expected
+    assert 1 < num_calls < 10
+
+    # Warm cache
+    commits, num_calls = Enumerate()
+    assert commits == expected
+    assert num_calls == 0
+
+    # New commits
+    CreateCommits(100, 103)
+
+    expected, _ = Enumerate(use_cache=False)
+    assert len(expected) == 103
+
+    commits, num_calls = Enumerate()
+    assert commits == expected
+    assert num_calls == 1
+
+    commits, num_calls = Enumerate()
+    assert commits == expected
+    assert num_calls == 0
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_EnumCommitsTerminal(tmp_path_factory, use_cache):
+    repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+    for index in range(50):
+        TestCheckpoints._Commit(
+            repo_dir,
+            "Commit {}".format(index),
+            tag={10: "v1.0.0", 40: "v2.0.0", 45: "not-a-version"}.get(index),
+        )
+
+    # ----------------------------------------------------------------------
+    def Enumerate(
+        is_terminal_commit_func: Optional[Callable[[CommitInfo], bool]],
+    ) -> tuple[list[CommitInfo], int]:
+        with patch(
+            "AutoGitSemVer.Lib.GitEx.EnumLogRecords",
+            side_effect=GitEx.EnumLogRecords,
+        ) as enum_log_records:
+            commits = list(
+                EnumCommits(repo_dir, use_cache=use_cache, is_terminal_commit_func=is_terminal_commit_func),
+            )
+
+        # Only the commits that were retrieved are written to the input of the 'git log' processes
+        return commits, sum(call.kwargs["input"].count(b"\n") for call in enum_log_records.call_args_list)
+
+    # ----------------------------------------------------------------------
+    def IsVersionTagged(
+        commit: CommitInfo,
+    ) -> bool:
+        return any(tag.startswith("v") for tag in commit.tags)
+
+    # ----------------------------------------------------------------------
+
+    expected = list(EnumCommits(repo_dir, use_cache=False))
+    assert len(expected) == 50
+
+    # Information is only retrieved for the commits up to the nearest version tag
+    commits, num_retrieved = Enumerate(IsVersionTagged)
+    assert commits == expected[:10]
+    assert commits[-1].tags == ["v2.0.0"]
+    assert num_retrieved == 10
+
+    # The terminal commit is the first commit for which the function returns True
+    commits, _ = Enumerate(lambda commit: "v1.0.0" in commit.tags)
+    assert commits == expected[:40]
+
+    # Hashes are buffered in windows of bounded size
+    with patch("AutoGitSemVer.Lib._MAX_CACHE_MISS_BATCH_SIZE", 3):
+        commits, _ = Enumerate(IsVersionTagged)
+        assert commits == expected[:10]
+
+        commits, _ = Enumerate(lambda commit: False)
+        assert commits == expected
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_EnumCommitsTerminalNumSpawnedProcesses(tmp_path_factory, use_cache):
+    # ----------------------------------------------------------------------
+    def Execute(
+        num_commits: int,
+    ) -> int:
+        repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+        for index in range(num_commits):
+            # Tags (for example, for other components) that aren't terminal
+            TestCheckpoints._Commit(repo_dir, "Commit {}".format(index), tag="Other-v{}.0.0".format(index))
+
+        num_processes = GitEx.GetNumSpawnedProcesses()
+
+        commits = list(
+            EnumCommits(repo_dir, use_cache=use_cache, is_terminal_commit_func=lambda commit: False),
+        )
+
+        assert len(commits) == num_commits
+        return GitEx.GetNumSpawnedProcesses() - num_processes
+
+    # ----------------------------------------------------------------------
+
+    # The tagged commits are retrieved together, so the number of processes doesn't depend on the number
+    # of tags
+    assert Execute(3) == Execute(30)
+
+
 # ----------------------------------------------------------------------
 def test_GetGitRoot():
     this_dir = Path(__file__).parent
@@ -248,6 +637,174 @@ class TestGetConfiguration:
         ):
             GetConfiguration(root)
 
+    # ----------------------------------------------------------------------
+    def test_DefaultsNotShared(self):
+        configuration1 = GetConfiguration(Path(__file__).parent)
+        configuration2 = GetConfiguration(Path(__file__).parent)
+
+        assert configuration1.main_branch_names is not configuration2.main_branch_names
+
+        configuration1.main_branch_names.append("modified")
+
+        assert GetConfiguration(Path(__file__).parent).main_branch_names == ["main", "master", "default"]
+
+    # ----------------------------------------------------------------------
+    def test_ValidatorCreatedOnce(self):
+        with (
+            patch("AutoGitSemVer.Lib._configuration_validator", None),
+            patch("jsonschema.validators.extend", wraps=validators.extend) as extend_mock,
+        ):
+            with ThreadPoolExecutor(8) as executor:
+                configurations = list(
+                    executor.map(lambda _: GetConfiguration(Path(__file__).parent), range(32))
+                )
+
+            assert len(extend_mock.call_args_list) == 1
+            assert all(configuration == configurations[0] for configuration in configurations)
+
+
+# ----------------------------------------------------------------------
+class TestConfigurationCache:
+    # ----------------------------------------------------------------------
+    def test_Configuration(self, tmp_path):
+        configuration_filename = tmp_path / "AutoGitSemVer.yaml"
+
+        self._Write(configuration_filename, "{ initial_version: 1.2.3 }\n")
+
+        with (
+            patch("AutoGitSemVer.Lib._configuration_content_cache", OrderedDict()),
+            patch("rtyaml.load", wraps=rtyaml.load) as load_mock,
+        ):
+            configuration = GetConfiguration(tmp_path)
+            assert configuration.initial_version == SemVer("1.2.3")
+            assert len(load_mock.call_args_list) == 1
+
+            # Cached
+            assert GetConfiguration(tmp_path) == configuration
+            assert len(load_mock.call_args_list) == 1
+
+            # Not cached
+            assert GetConfiguration(tmp_path, use_cache=False) == configuration
+            assert len(load_mock.call_args_list) == 2
+
+            # Modified
+            self._Write(configuration_filename, "{ initial_version: 4.5.6 }\n")
+
+            assert GetConfiguration(tmp_path).initial_version == SemVer("4.5.6")
+            assert len(load_mock.call_args_list) == 3
+
+            # Recently modified files are not cached, as subsequent modifications may not change the
+            # modified time.
+            configuration_filename.write_text("{ initial_version: 7.8.9 }\n")
+
+            assert GetConfiguration(tmp_path).initial_version == SemVer("7.8.9")
+            assert GetConfiguration(tmp_path).initial_version == SemVer("7.8.9")
+            assert len(load_mock.call_args_list) == 5
+
+    # ----------------------------------------------------------------------
+    def test_Store(self, tmp_path):
+        configuration_dir = tmp_path / "configuration"
+        configuration_dir.mkdir()
+
+        self._Write(configuration_dir / "AutoGitSemVer.yaml", "{ initial_version: 1.2.3 }\n")
+
+        store = JsonStore.Open(tmp_path / "git", "configurations", 1)
+        assert store is not None
+
+        with patch("rtyaml.load", wraps=rtyaml.load) as load_mock:
+            with patch("AutoGitSemVer.Lib._configuration_content_cache", OrderedDict()):
+                configuration = GetConfiguration(configuration_dir, store=store)
+                assert len(load_mock.call_args_list) == 1
+
+            # The configuration is loaded from the store in a new process
+            with patch("AutoGitSemVer.Lib._configuration_content_cache", OrderedDict()):
+                assert GetConfiguration(configuration_dir, store=store) == configuration
+                assert len(load_mock.call_args_list) == 1
+
+    # ----------------------------------------------------------------------
+    def test_MaxNumItems(self, tmp_path):
+        for index in range(5):
+            (tmp_path / str(index)).mkdir()
+            self._Write(tmp_path / str(index) / "AutoGitSemVer.yaml", "{}\n")
+            self._SetOldModifiedTime(tmp_path / str(index))
+
+        with (
+            patch("AutoGitSemVer.Lib._configuration_content_cache", OrderedDict()) as content_cache,
+            patch("AutoGitSemVer.Lib._configuration_filename_cache", OrderedDict()) as filename_cache,
+            patch("AutoGitSemVer.Lib._MAX_NUM_CACHED_CONFIGURATIONS", 3),
+        ):
+            for index in range(5):
+                GetConfiguration(tmp_path / str(index))
+
+            assert len(content_cache) == 3
+            assert len(filename_cache) == 3
+
+            # The least recently used items are evicted
+            assert [json.loads(key)[0] for key in content_cache] == [
+                str(tmp_path / str(index) / "AutoGitSemVer.yaml") for index in range(2, 5)
+            ]
+
+    # ----------------------------------------------------------------------
+    def test_Filename(self, tmp_path):
+        child_dir = tmp_path / "one" / "two"
+        child_dir.mkdir(parents=True)
+
+        (tmp_path / ".git").mkdir()
+        self._Write(tmp_path / "AutoGitSemVer.yaml", "{}\n")
+
+        self._SetOldModifiedTime(child_dir, child_dir.parent, tmp_path)
+
+        with (
+            patch("AutoGitSemVer.Lib._configuration_filename_cache", OrderedDict()),
+            patch.object(Path, "is_file", autospec=True, side_effect=Path.is_file) as is_file_mock,
+        ):
+            assert GetConfigurationFilename(child_dir) == tmp_path / "AutoGitSemVer.yaml"
+
+            num_is_file_calls = len(is_file_mock.call_args_list)
+            assert num_is_file_calls
+
+            # Cached
+            assert GetConfigurationFilename(child_dir) == tmp_path / "AutoGitSemVer.yaml"
+            assert len(is_file_mock.call_args_list) == num_is_file_calls
+
+            # Not cached
+            assert GetConfigurationFilename(child_dir, use_cache=False) == tmp_path / "AutoGitSemVer.yaml"
+            assert len(is_file_mock.call_args_list) == num_is_file_calls * 2
+
+            # Added
+            self._Write(child_dir.parent / "AutoGitSemVer.json", "{}\n")
+            self._SetOldModifiedTime(child_dir.parent, offset=-5)
+
+            assert GetConfigurationFilename(child_dir) == child_dir.parent / "AutoGitSemVer.json"
+
+            # Removed
+            (child_dir.parent / "AutoGitSemVer.json").unlink()
+            self._SetOldModifiedTime(child_dir.parent, offset=-10)
+
+            assert GetConfigurationFilename(child_dir) == tmp_path / "AutoGitSemVer.yaml"
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def _Write(
+        cls,
+        filename: Path,
+        content: str,
+    ) -> None:
+        filename.write_text(content)
+        cls._SetOldModifiedTime(filename, offset=len(content))
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _SetOldModifiedTime(
+        *paths: Path,
+        offset: int = 0,
+    ) -> None:
+        # Items that were recently modified are not cached
+        modified_time = time.time_ns() - 60_000_000_000 + offset
+
+        for path in paths:
+            os.utime(path, ns=(modified_time, modified_time))
+
 
 # ----------------------------------------------------------------------
 class TestSemanticVersion:
@@ -394,6 +951,32 @@ class TestSemanticVersion:
         assert semver.semantic_version.minor == 1
         assert semver.semantic_version.patch == 2
 
+    # ----------------------------------------------------------------------
+    def test_IgnoredChangesManyFiles(self):
+        with patch(
+            "AutoGitSemVer.Lib.GetConfigurationFilename",
+            side_effect=GetConfigurationFilename,
+        ) as get_configuration_filename:
+            result, semver = _GetSemanticVersionImpl(
+                [
+                    _CreateCommitInfo(
+                        "Ignored",
+                        files=[PurePath("Ignored{}/File.txt".format(index)) for index in range(1000)],
+                    ),
+                    _CreateCommitInfo(
+                        "Included",
+                        files=[PurePath("Ignored.txt"), PurePath("src/AutoGitSemVer/Included.txt")],
+                    ),
+                ],
+                working_dir=Path(__file__).parent.parent / "src",
+            )
+
+        assert result == 0
+        assert semver.semantic_version_string.startswith("0.1.0")
+
+        # Ownership of the files is not determined by searching the file system
+        assert get_configuration_filename.call_count == 1
+
     # ----------------------------------------------------------------------
     def test_Styles(self):
         # Standard
@@ -509,36 +1092,1364 @@ class TestSemanticVersion:
         )
         assert semver.semantic_version_string == "0.1.0"
 
+    # ----------------------------------------------------------------------
+    def test_Trace(self):
+        commits = [
+            _CreateCommitInfo("(+minor)"),
+            _CreateCommitInfo("Ignored", [PurePath("Other.txt")]),
+            _CreateCommitInfo(""),
+            _CreateCommitInfo("Tag", tags=["Ignore Me", "1.2.3"]),
+            _CreateCommitInfo("Not enumerated"),
+        ]
 
-# ----------------------------------------------------------------------
-# ----------------------------------------------------------------------
-# ----------------------------------------------------------------------
-def _CreateCommitInfo(
-    description: str,
-    files: Optional[list[PurePath]] = None,
-    tags: Optional[list[str]] = None,
-    *,
-    is_working_change: bool = False,
-) -> CommitInfo:
-    id = CommitInfo.WORKING_CHANGES_COMMIT_ID if is_working_change else str(uuid4())
+        with patch("AutoGitSemVer.Lib.ConfigurationIndex") as configuration_index:
+            configuration_index.FromTree.return_value.GetConfigurationRootFromString.side_effect = (
+                lambda filename: None if filename == "Other.txt" else GetGitRoot(Path.cwd())
+            )
 
-    if files is None:
-        files = [PurePath("File.txt")]
+            result, semver = _GetSemanticVersionImpl(commits)
 
-    return CommitInfo(id, description, tags or [], "Author", datetime.now(), files)
+        assert result == 0
+        assert semver.trace == GetSemanticVersionTrace(
+            VersionDelta(1, 2, 3, None, None),
+            "1.2.3",
+            commits[3].id,
+            4,
+            2,
+            0,
+            [
+                (commits[0].id, VersionDelta(0, 1, 0, None, None)),
+                (commits[2].id, VersionDelta(0, 0, 1, None, None)),
+            ],
+        )
+
+        # The trace isn't compared
+        assert semver == GetSemanticVersionResult(
+            semver.configuration_filename,
+            semver.semantic_version,
+            semver.semantic_version_string,
+        )
+
+        result, semver = _GetSemanticVersionImpl([])
+
+        assert result == 0
+        assert semver.trace == GetSemanticVersionTrace(
+            VersionDelta(0, 0, 0, None, None), None, None, 0, 0, 0, []
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Verbose(self):
+        commits = [
+            _CreateCommitInfo("(+minor)"),
+            _CreateCommitInfo(""),
+        ]
+
+        for flags, expected_num_lines in [
+            (DoneManagerFlags.Create(), 0),
+            (DoneManagerFlags.Create(verbose=True), 2),
+        ]:
+            sink = StringIO()
+
+            with (
+                patch("AutoGitSemVer.Lib.EnumCommits", return_value=commits),
+                DoneManager.Create(sink, "", flags=flags) as dm,
+            ):
+                GetSemanticVersion(dm, Path.cwd(), use_cache=False)
+
+            assert dm.result == 0
+            assert sink.getvalue().count("Processing '") == expected_num_lines
 
 
 # ----------------------------------------------------------------------
-def _GetSemanticVersionImpl(
-    commits: list[CommitInfo],
-    *,
-    working_dir: Path = Path.cwd(),
-    **kwargs,
-) -> tuple[int, GetSemanticVersionResult]:
-    with patch("AutoGitSemVer.Lib.EnumCommits", return_value=commits):
-        sink = StringIO()
+class TestCheckpoints:
+    # ----------------------------------------------------------------------
+    def test_Incremental(self, tmp_path_factory):
+        repo_dir = self._CreateRepo(tmp_path_factory)
 
-        with DoneManager.Create(sink, "_GetSemanticVersionImpl...") as dm:
-            result = GetSemanticVersion(dm, working_dir, **kwargs)
+        self._Commit(repo_dir, "Commit 1")
+        self._Commit(repo_dir, "Commit 2 (+minor)")
 
-        return dm.result, result
+        self._Validate(repo_dir, "0.1.0", expected_revisions=None)
+
+        # No changes
+        self._Validate(repo_dir, "0.1.0", expected_revisions=[self._GetHead(repo_dir)] * 2)
+
+        # New changes
+        previous_head = self._GetHead(repo_dir)
+
+        self._Commit(repo_dir, "Commit 3")
+        self._Commit(repo_dir, "Commit 4 (+major)")
+        self._Commit(repo_dir, "Commit 5")
+
+        self._Validate(repo_dir, "1.0.1", expected_revisions=[self._GetHead(repo_dir), previous_head])
+
+        # Working changes are not saved in the checkpoint
+        with (repo_dir / "Working.txt").open("w") as f:
+            pass
+
+        assert SubprocessEx.Run("git add Working.txt", cwd=repo_dir).returncode == 0
+
+        self._Validate(repo_dir, "1.0.2", expected_revisions=[self._GetHead(repo_dir)] * 2, is_dirty=True)
+
+        assert SubprocessEx.Run("git reset --quiet", cwd=repo_dir).returncode == 0
+        (repo_dir / "Working.txt").unlink()
+
+        self._Validate(repo_dir, "1.0.1", expected_revisions=[self._GetHead(repo_dir)] * 2)
+
+    # ----------------------------------------------------------------------
+    def test_NewTag(self, tmp_path_factory):
+        repo_dir = self._CreateRepo(tmp_path_factory)
+
+        self._Commit(repo_dir, "Commit 1")
+        self._Commit(repo_dir, "Commit 2")
+
+        self._Validate(repo_dir, "0.1.1", expected_revisions=None)
+
+        assert SubprocessEx.Run("git tag v2.0.0 HEAD~1", cwd=repo_dir).returncode == 0
+
+        self._Validate(repo_dir, "2.0.1", expected_revisions=None)
+        self._Validate(repo_dir, "2.0.1", expected_revisions=[self._GetHead(repo_dir)] * 2)
+
+        # New tags in the enumerated commits take precedence over the checkpoint
+        assert SubprocessEx.Run("git tag v3.0.0 HEAD", cwd=repo_dir).returncode == 0
+        self._Validate(repo_dir, "3.0.0", expected_revisions=None)
+
+        self._Commit(repo_dir, "Commit 3")
+        self._Commit(repo_dir, "Commit 4", tag="v4.0.0")
+        self._Commit(repo_dir, "Commit 5")
+
+        self._Validate(repo_dir, "4.0.1", expected_revisions=None)
+
+    # ----------------------------------------------------------------------
+    def test_Trace(self, tmp_path_factory):
+        repo_dir = self._CreateRepo(tmp_path_factory)
+
+        self._Commit(repo_dir, "Commit 1", tag="v1.0.0")
+        tag_head = self._GetHead(repo_dir)
+
+        self._Commit(repo_dir, "Commit 2 (+minor)")
+        checkpoint_head = self._GetHead(repo_dir)
+
+        self._Commit(repo_dir, "Commit 3")
+        head = self._GetHead(repo_dir)
+
+        # ----------------------------------------------------------------------
+        def Execute() -> GetSemanticVersionTrace:
+            with DoneManager.Create(StringIO(), "") as dm:
+                result = GetSemanticVersion(dm, repo_dir, use_checkpoints=True)
+
+            assert dm.result == 0
+            assert str(result.semantic_version).startswith("1.1.1")
+
+            assert result.trace is not None
+            return result.trace
+
+        # ----------------------------------------------------------------------
+
+        assert Execute() == GetSemanticVersionTrace(
+            VersionDelta(1, 0, 0, None, None),
+            "v1.0.0",
+            tag_head,
+            3,
+            2,
+            0,
+            [
+                (head, VersionDelta(0, 0, 1, None, None)),
+                (checkpoint_head, VersionDelta(0, 1, 0, None, None)),
+            ],
+        )
+
+        # The base tag and deltas are reused from the checkpoint
+        assert Execute() == GetSemanticVersionTrace(
+            VersionDelta(1, 0, 0, None, None),
+            "v1.0.0",
+            tag_head,
+            0,
+            0,
+            2,
+            [
+                (None, VersionDelta(0, 0, 1, None, None)),
+                (None, VersionDelta(0, 1, 0, None, None)),
+            ],
+        )
+
+    # ----------------------------------------------------------------------
+    def test_ExtractorIds(self, tmp_path_factory):
+        repo_dir = self._CreateRepo(tmp_path_factory)
+
+        self._Commit(repo_dir, "Commit 1")
+        self._Commit(repo_dir, "Commit 2")
+
+        # ----------------------------------------------------------------------
+        def Execute(
+            func: Callable[[DoneManager, CommitInfo], Optional[VersionDelta]],
+            **kwargs,
+        ) -> tuple[str, int, bool]:
+            sink = StringIO()
+
+            with DoneManager.Create(sink, "") as dm:
+                result = GetSemanticVersion(
+                    dm,
+                    repo_dir,
+                    include_branch_name_when_necessary=False,
+                    no_metadata=True,
+                    commit_delta_extraction_func=func,
+                    use_checkpoints=True,
+                    **kwargs,
+                )
+
+            assert dm.result == 0
+            assert result.trace is not None
+
+            return (
+                str(result.semantic_version),
+                result.trace.num_commits_reused_from_checkpoint,
+                "Checkpoints will not be used" in sink.getvalue(),
+            )
+
+        # ----------------------------------------------------------------------
+        def ExtractDelta(
+            major: int,
+            dm: DoneManager,  # pylint: disable=unused-argument
+            commit_info: CommitInfo,  # pylint: disable=unused-argument
+        ) -> Optional[VersionDelta]:
+            return VersionDelta(major, 0, 1, None, None)
+
+        # ----------------------------------------------------------------------
+        class Extractor:
+            def __call__(
+                self,
+                dm: DoneManager,  # pylint: disable=unused-argument
+                commit_info: CommitInfo,  # pylint: disable=unused-argument
+            ) -> Optional[VersionDelta]:
+                return VersionDelta(0, 1, 0, None, None)
+
+        # ----------------------------------------------------------------------
+
+        major_func = lambda dm, commit_info: VersionDelta(1, 0, 0, None, None)
+        patch_func = lambda dm, commit_info: VersionDelta(0, 0, 1, None, None)
+
+        # Lambdas can't be identified, so they don't share a checkpoint
+        assert Execute(major_func) == ("2.0.0", 0, True)
+        assert Execute(patch_func) == ("0.1.1", 0, True)
+        assert Execute(major_func) == ("2.0.0", 0, True)
+
+        # Partials, callable instances, and closures can't be identified
+        assert Execute(functools.partial(ExtractDelta, 3)) == ("6.0.1", 0, True)
+        assert Execute(Extractor()) == ("0.2.0", 0, True)
+        assert Execute(lambda dm, commit_info: ExtractDelta(0, dm, commit_info)) == ("0.1.1", 0, True)
+
+        # Explicit ids
+        assert Execute(major_func, extractor_id="major") == ("2.0.0", 0, False)
+        assert Execute(major_func, extractor_id="major") == ("2.0.0", 2, False)
+        assert Execute(patch_func, extractor_id="patch") == ("0.1.1", 0, False)
+        assert Execute(patch_func, extractor_id="patch") == ("0.1.1", 2, False)
+        assert Execute(functools.partial(ExtractDelta, 3), extractor_id="partial") == ("6.0.1", 0, False)
+        assert Execute(functools.partial(ExtractDelta, 3), extractor_id="partial") == ("6.0.1", 2, False)
+
+        # Module-level functions are identified by name
+        assert Execute(DefaultCommitDataExtractor) == ("0.1.1", 0, False)
+        assert Execute(DefaultCommitDataExtractor) == ("0.1.1", 2, False)
+
+    # ----------------------------------------------------------------------
+    def test_NotDescendant(self, tmp_path_factory):
+        repo_dir = self._CreateRepo(tmp_path_factory)
+
+        self._Commit(repo_dir, "Commit 1")
+        self._Commit(repo_dir, "Commit 2 (+minor)")
+
+        self._Validate(repo_dir, "0.1.0", expected_revisions=None)
+
+        assert SubprocessEx.Run("git reset --hard --quiet HEAD~1", cwd=repo_dir).returncode == 0
+        self._Commit(repo_dir, "Commit 3")
+
+        self._Validate(repo_dir, "0.1.1", expected_revisions=None)
+
+    # ----------------------------------------------------------------------
+    def test_Merges(self, tmp_path_factory):
+        repo_dir = self._CreateRepo(tmp_path_factory)
+
+        assert SubprocessEx.Run("git checkout --quiet -b main", cwd=repo_dir).returncode == 0
+
+        self._Commit(repo_dir, "Commit 1")
+        assert SubprocessEx.Run("git branch feature", cwd=repo_dir).returncode == 0
+
+        self._Commit(repo_dir, "Commit 2", tag="v1.0.0")
+        self._Commit(repo_dir, "Commit 3 (+minor)")
+
+        self._Validate(repo_dir, "1.1.0", expected_revisions=None)
+
+        # Merge main into a branch that was created before the tag and fast-forward main
+        assert SubprocessEx.Run("git checkout --quiet feature", cwd=repo_dir).returncode == 0
+        self._Commit(repo_dir, "Feature (+major)", filename="Feature.txt")
+
+        assert SubprocessEx.Run('git merge --quiet --no-ff -m "Merge" main', cwd=repo_dir).returncode == 0
+
+        assert SubprocessEx.Run("git checkout --quiet main", cwd=repo_dir).returncode == 0
+        assert SubprocessEx.Run("git merge --quiet --ff-only feature", cwd=repo_dir).returncode == 0
+
+        # The commits added since the checkpoint include a merge, so the checkpoint isn't used
+        self._Validate(repo_dir, "1.1.0", expected_revisions=None)
+
+        # Linear commits added after the merge can use the checkpoint again
+        previous_head = self._GetHead(repo_dir)
+
+        self._Commit(repo_dir, "Commit 4")
+
+        self._Validate(repo_dir, "1.1.1", expected_revisions=[self._GetHead(repo_dir), previous_head])
+
+    # ----------------------------------------------------------------------
+    def test_ConfigurationChanges(self, tmp_path_factory):
+        repo_dir = self._CreateRepo(tmp_path_factory)
+
+        (repo_dir / "src").mkdir()
+
+        self._Commit(repo_dir, "Commit 1", filename="src/File.txt")
+        self._Commit(repo_dir, "Commit 2", filename="src/File.txt")
+        self._Commit(repo_dir, "Commit 3", filename="File.txt")
+
+        self._Validate(repo_dir, "0.1.2", expected_revisions=None)
+
+        # Committed configuration changes
+        previous_head = self._GetHead(repo_dir)
+
+        with (repo_dir / "src" / "AutoGitSemVer.yaml").open("w") as f:
+            f.write("include_timestamp_when_necessary: false\n")
+
+        self._Commit(repo_dir, "Commit 4", filename="File.txt")
+
+        self._Validate(
+            repo_dir,
+            "0.1.1",
+            expected_revisions=[self._GetHead(repo_dir), previous_head],
+            is_full_enumeration=True,
+        )
+
+        # Working configuration changes
+        with (repo_dir / "src" / "AutoGitSemVer.yaml").open("a") as f:
+            f.write("include_computer_name_when_necessary: false\n")
+
+        assert SubprocessEx.Run("git add .", cwd=repo_dir).returncode == 0
+
+        self._Validate(
+            repo_dir,
+            "0.1.1",
+            expected_revisions=[self._GetHead(repo_dir)] * 2,
+            is_full_enumeration=True,
+            is_dirty=True,
+        )
+
+        assert SubprocessEx.Run("git reset --hard --quiet", cwd=repo_dir).returncode == 0
+
+        self._Validate(repo_dir, "0.1.1", expected_revisions=[self._GetHead(repo_dir)] * 2)
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateRepo(tmp_path_factory) -> Path:
+        repo_dir = tmp_path_factory.mktemp("repo")
+
+        assert SubprocessEx.Run("git init", cwd=repo_dir).returncode == 0
+        assert SubprocessEx.Run('git config user.name "Test User"', cwd=repo_dir).returncode == 0
+        assert SubprocessEx.Run('git config user.email "a@b.com"', cwd=repo_dir).returncode == 0
+
+        return repo_dir
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Commit(
+        repo_dir: Path,
+        message: str,
+        *,
+        filename: str = "File.txt",
+        tag: Optional[str] = None,
+    ) -> None:
+        with (repo_dir / filename).open("a") as f:
+            f.write(message)
+
+        assert SubprocessEx.Run("git add .", cwd=repo_dir).returncode == 0
+        assert SubprocessEx.Run('git commit -m "{}"'.format(message), cwd=repo_dir).returncode == 0
+
+        if tag is not None:
+            assert SubprocessEx.Run("git tag {}".format(tag), cwd=repo_dir).returncode == 0
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetHead(
+        repo_dir: Path,
+    ) -> str:
+        return git.Repo(repo_dir).head.commit.hexsha
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Validate(
+        repo_dir: Path,
+        expected_version: str,
+        *,
+        expected_revisions: Optional[list[str]],
+        is_full_enumeration: bool = False,
+        is_dirty: bool = False,
+    ) -> None:
+        # ----------------------------------------------------------------------
+        def Execute(**kwargs) -> tuple[SemVer, list[Optional[list[str]]]]:
+            with patch("AutoGitSemVer.Lib.EnumCommits", side_effect=EnumCommits) as enum_commits:
+                with DoneManager.Create(StringIO(), "") as dm:
+                    result = GetSemanticVersion(
+                        dm,
+                        repo_dir,
+                        include_branch_name_when_necessary=False,
+                        include_timestamp_when_necessary=False,
+                        include_computer_name_when_necessary=False,
+                        **kwargs,
+                    )
+
+                assert dm.result == 0
+
+            return (
+                result.semantic_version,
+                [call.kwargs.get("revisions") for call in enum_commits.call_args_list],
+            )
+
+        # ----------------------------------------------------------------------
+
+        expected, _ = Execute()
+        assert str(expected) == expected_version + ("+working_changes" if is_dirty else "")
+
+        result, revisions = Execute(use_checkpoints=True)
+        assert result == expected
+
+        if expected_revisions is None:
+            # Full enumeration
+            assert revisions == [[TestCheckpoints._GetHead(repo_dir)]]
+        else:
+            assert revisions[0] == [expected_revisions[0], "^{}".format(expected_revisions[1])]
+
+            if is_full_enumeration:
+                assert revisions[1:] == [[TestCheckpoints._GetHead(repo_dir)]]
+            else:
+                assert len(revisions) == 1
+
+
+# ----------------------------------------------------------------------
+def test_NoCache(tmp_path_factory):
+    repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+    TestCheckpoints._Commit(repo_dir, "Commit 1")
+    TestCheckpoints._Commit(repo_dir, "Commit 2")
+
+    with DoneManager.Create(StringIO(), "") as dm:
+        GetSemanticVersion(dm, repo_dir, use_cache=False)
+
+    assert dm.result == 0
+
+    # Nothing is written to the repository's git directory
+    assert not (repo_dir / ".git" / "autogitsemver").exists()
+
+
+# ----------------------------------------------------------------------
+def test_NestedConfigurationNotOnDisk(tmp_path_factory):
+    repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+    (repo_dir / "Nested").mkdir()
+    (repo_dir / "Nested" / "AutoGitSemVer.yaml").write_text("{}\n")
+
+    TestCheckpoints._Commit(repo_dir, "Commit 1")
+    TestCheckpoints._Commit(repo_dir, "Commit 2 (+major)", filename="Nested/File.txt")
+    TestCheckpoints._Commit(repo_dir, "Commit 3", filename="Nested/File.txt")
+
+    # ----------------------------------------------------------------------
+    def Execute() -> str:
+        with DoneManager.Create(StringIO(), "") as dm:
+            result = GetSemanticVersion(
+                dm,
+                repo_dir,
+                include_branch_name_when_necessary=False,
+                include_timestamp_when_necessary=False,
+                include_computer_name_when_necessary=False,
+            )
+
+        return result.semantic_version_string
+
+    # ----------------------------------------------------------------------
+
+    assert Execute() == "0.1.0"
+
+    # Simulate a sparse checkout where the nested configuration is not on disk; changes to files in the
+    # nested configuration's directory should still be ignored.
+    assert (
+        SubprocessEx.Run(
+            "git update-index --skip-worktree Nested/AutoGitSemVer.yaml Nested/File.txt",
+            cwd=repo_dir,
+        ).returncode
+        == 0
+    )
+
+    (repo_dir / "Nested" / "AutoGitSemVer.yaml").unlink()
+    (repo_dir / "Nested" / "File.txt").unlink()
+
+    assert Execute() == "0.1.0"
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "version_prefix, tag, expected",
+    [
+        (None, "v1.2.3", "1.2.4"),
+        (None, "1.2.3", "1.2.4"),
+        ("release-", "release-v1.2.3", "release-1.2.4"),
+        ("release-", "release-1.2.3", "release-1.2.4"),
+        ("release-v", "release-v1.2.3", "release-v1.2.4"),
+        ("release-", "v1.2.3", "release-0.1.1"),
+        ("release.", "releaseX1.2.3", "release.0.1.1"),
+    ],
+)
+def test_TagPatterns(tmp_path_factory, version_prefix, tag, expected):
+    repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+    if version_prefix is not None:
+        (repo_dir / "AutoGitSemVer.json").write_text(json.dumps({"version_prefix": version_prefix}))
+
+    TestCheckpoints._Commit(repo_dir, "Commit 1", tag=tag)
+    TestCheckpoints._Commit(repo_dir, "Commit 2")
+
+    with DoneManager.Create(StringIO(), "") as dm:
+        result = GetSemanticVersion(
+            dm,
+            repo_dir,
+            include_branch_name_when_necessary=False,
+            include_timestamp_when_necessary=False,
+            include_computer_name_when_necessary=False,
+        )
+
+    assert result.semantic_version_string == expected
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("use_checkpoints", [False, True])
+def test_NumSpawnedProcesses(tmp_path_factory, use_checkpoints):
+    # ----------------------------------------------------------------------
+    def Execute(
+        num_commits: int,
+    ) -> int:
+        repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+        for index in range(num_commits):
+            # Tags that match the tag patterns (but not the version regex) require objects to be read
+            TestCheckpoints._Commit(repo_dir, "Commit {}".format(index), tag="v{}-build".format(index))
+
+        # ----------------------------------------------------------------------
+        def Impl() -> int:
+            num_processes = GitEx.GetNumSpawnedProcesses()
+
+            with DoneManager.Create(StringIO(), "") as dm:
+                GetSemanticVersion(dm, repo_dir, use_checkpoints=use_checkpoints)
+
+            assert dm.result == 0
+            return GitEx.GetNumSpawnedProcesses() - num_processes
+
+        # ----------------------------------------------------------------------
+
+        # Populate the caches
+        Impl()
+
+        return Impl()
+
+    # ----------------------------------------------------------------------
+
+    # The number of processes doesn't depend on the number of commits or tags
+    assert Execute(3) == Execute(30)
+
+
+# ----------------------------------------------------------------------
+def test_AdditionalDependencies(tmp_path_factory):
+    repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+    (repo_dir / "A").mkdir()
+    (repo_dir / "Shared" / "Nested").mkdir(parents=True)
+
+    (repo_dir / "A" / "AutoGitSemVer.yaml").write_text(
+        'additional_dependencies: ["../Shared", "../Single.txt"]\n'
+    )
+    (repo_dir / "Shared" / "File.txt").write_text("Shared")
+    (repo_dir / "Single.txt").write_text("Single")
+
+    TestCheckpoints._Commit(repo_dir, "Commit 1")
+    TestCheckpoints._Commit(repo_dir, "Commit 2 (+minor)", filename="Shared/Nested/Deleted.txt")
+
+    # Files that have been deleted from dependency directories are matched
+    assert SubprocessEx.Run("git rm --quiet Shared/Nested/Deleted.txt", cwd=repo_dir).returncode == 0
+    assert SubprocessEx.Run('git commit -m "Commit 3"', cwd=repo_dir).returncode == 0
+
+    # Files that share a prefix with a dependency are not matched
+    TestCheckpoints._Commit(repo_dir, "Commit 4 (+major)", filename="SharedOther.txt")
+    TestCheckpoints._Commit(repo_dir, "Commit 5 (+major)", filename="Single.txt.bak")
+
+    TestCheckpoints._Commit(repo_dir, "Commit 6", filename="Single.txt")
+
+    # Files are matched with the strings stored in the path table, without creating `PurePath` objects
+    with (
+        patch("os.walk") as walk_mock,
+        patch("AutoGitSemVer.PathTable.PathTable.GetPath", side_effect=AssertionError) as get_path_mock,
+    ):
+        with DoneManager.Create(StringIO(), "") as dm:
+            result = GetSemanticVersion(
+                dm,
+                repo_dir / "A",
+                include_branch_name_when_necessary=False,
+                include_timestamp_when_necessary=False,
+                include_computer_name_when_necessary=False,
+            )
+
+            assert result.semantic_version_string == "0.1.2"
+
+            results = GetSemanticVersions(
+                dm,
+                repo_dir,
+                include_branch_name_when_necessary=False,
+                include_timestamp_when_necessary=False,
+                include_computer_name_when_necessary=False,
+            )
+
+            assert [result.semantic_version_string for result in results] == ["0.1.2"]
+
+        assert dm.result == 0
+
+    # The cost of matching doesn't depend on the number of files within dependency directories
+    assert not walk_mock.call_args_list
+    assert not get_path_mock.call_args_list
+
+
+# ----------------------------------------------------------------------
+def test_Pathspecs(tmp_path_factory):
+    repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+    (repo_dir / "A" / "B").mkdir(parents=True)
+    (repo_dir / "Other").mkdir()
+    (repo_dir / "Shared").mkdir()
+
+    (repo_dir / "A" / "AutoGitSemVer.yaml").write_text('additional_dependencies: ["../Shared"]\n')
+    (repo_dir / "A" / "B" / "AutoGitSemVer.yaml").write_text("{}\n")
+
+    TestCheckpoints._Commit(repo_dir, "Commit 1")
+    TestCheckpoints._Commit(repo_dir, "Commit 2 (+major)", filename="Other/File.txt")
+    TestCheckpoints._Commit(repo_dir, "Commit 3 (+minor)", filename="A/File.txt")
+    TestCheckpoints._Commit(repo_dir, "Commit 4 (+major)", filename="A/B/File.txt")
+    TestCheckpoints._Commit(repo_dir, "Commit 5", filename="Shared/File.txt")
+
+    assert SubprocessEx.Run("git checkout --quiet -b feature HEAD~2", cwd=repo_dir).returncode == 0
+    TestCheckpoints._Commit(repo_dir, "Commit 6 (+minor)", filename="A/Feature.txt")
+    TestCheckpoints._Commit(repo_dir, "Commit 7 (+major)", filename="Other/Feature.txt")
+    assert SubprocessEx.Run("git checkout --quiet -", cwd=repo_dir).returncode == 0
+    assert SubprocessEx.Run('git merge --no-ff -m "Merge" feature', cwd=repo_dir).returncode == 0
+
+    TestCheckpoints._Commit(repo_dir, "Commit 8", filename="A/File.txt")
+
+    # ----------------------------------------------------------------------
+    def Execute(
+        path: Path,
+        **kwargs,
+    ) -> tuple[str, list[Optional[list[str]]]]:
+        with patch("AutoGitSemVer.Lib.EnumCommits", side_effect=EnumCommits) as enum_commits:
+            with DoneManager.Create(StringIO(), "") as dm:
+                result = GetSemanticVersion(
+                    dm,
+                    path,
+                    include_branch_name_when_necessary=False,
+                    include_timestamp_when_necessary=False,
+                    include_computer_name_when_necessary=False,
+                    **kwargs,
+                )
+
+            assert dm.result == 0
+
+        return (
+            result.semantic_version_string,
+            [call.kwargs.get("pathspecs") for call in enum_commits.call_args_list],
+        )
+
+    # ----------------------------------------------------------------------
+
+    assert Execute(repo_dir / "A") == ("0.2.1", [None])
+    assert Execute(repo_dir / "A", use_pathspecs=True) == ("0.2.1", [[":(literal)A", ":(literal)Shared"]])
+    assert Execute(repo_dir / "A" / "B", use_pathspecs=True) == ("1.0.0", [[":(literal)A/B"]])
+
+    # The pathspecs aren't necessary for the root of the repository
+    assert Execute(repo_dir, use_pathspecs=True) == Execute(repo_dir)
+    assert Execute(repo_dir, use_pathspecs=True)[1] == [None]
+
+    # Bloom filters
+    GitEx.WriteCommitGraph(repo_dir)
+
+    assert Execute(repo_dir / "A", use_pathspecs=True)[0] == "0.2.1"
+    assert Execute(repo_dir / "A", use_pathspecs=True, use_checkpoints=True)[0] == "0.2.1"
+    assert Execute(repo_dir / "A", use_pathspecs=True, use_checkpoints=True)[0] == "0.2.1"
+
+    # Records retrieved with pathspecs include all of the files modified by the commits
+    with patch.object(CommitCache, "Open", return_value=None):
+        expected = list(EnumCommits(repo_dir))
+
+    for use_cache in [False, True]:
+        commits = list(EnumCommits(repo_dir, use_cache=use_cache, pathspecs=[":(literal)Shared"]))
+
+        assert [commit.id for commit in commits] == [
+            commit.id for commit in expected if "Commit 5" in commit.description
+        ]
+        assert commits[0].files == [PurePath("Shared/File.txt")]
+
+    commits = list(EnumCommits(repo_dir, pathspecs=[":(literal)A/B"]))
+
+    assert [commit.files for commit in commits] == [
+        [PurePath("A/B/File.txt")],
+        [PurePath("A/AutoGitSemVer.yaml"), PurePath("A/B/AutoGitSemVer.yaml"), PurePath("File.txt")],
+    ]
+
+
+# ----------------------------------------------------------------------
+def test_WatchSemanticVersion(tmp_path_factory):
+    repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+    TestCheckpoints._Commit(repo_dir, "Commit 1")
+    TestCheckpoints._Commit(repo_dir, "Commit 2")
+
+    sink = StringIO()
+
+    with DoneManager.Create(sink, "") as dm:
+        watcher = WatchSemanticVersion(
+            dm,
+            repo_dir,
+            interval=0,
+            include_branch_name_when_necessary=False,
+            include_timestamp_when_necessary=False,
+            include_computer_name_when_necessary=False,
+            # Functions that can't be identified across invocations are used incrementally, as the
+            # information is kept in memory
+            commit_delta_extraction_func=lambda dm, commit_info: DefaultCommitDataExtractor(dm, commit_info),
+        )
+
+        with patch("AutoGitSemVer.Lib.EnumCommits", side_effect=EnumCommits) as enum_commits:
+            assert next(watcher).semantic_version_string == "0.1.1"
+
+            # New commits
+            TestCheckpoints._Commit(repo_dir, "Commit 3 (+minor)")
+            assert next(watcher).semantic_version_string == "0.1.0"
+
+            # Only the new commits are enumerated
+            assert [call.kwargs.get("revisions") for call in enum_commits.call_args_list][-1] == [
+                TestCheckpoints._GetHead(repo_dir),
+                "^{}".format(git.Repo(repo_dir).commit("HEAD~1").hexsha),
+            ]
+
+        # Dirty
+        (repo_dir / "File.txt").write_text("Modified")
+        assert next(watcher).semantic_version_string == "0.1.0+working_changes"
+
+        # Clean
+        assert SubprocessEx.Run("git checkout -- File.txt", cwd=repo_dir).returncode == 0
+        assert next(watcher).semantic_version_string == "0.1.0"
+
+        # New tags
+        assert SubprocessEx.Run("git tag v1.0.0", cwd=repo_dir).returncode == 0
+        assert next(watcher).semantic_version_string == "1.0.0"
+
+        # Changes that don't change the version aren't yielded
+        assert SubprocessEx.Run("git branch other", cwd=repo_dir).returncode == 0
+
+        with _PatchWatchSleep([None, KeyboardInterrupt()]):
+            with pytest.raises(KeyboardInterrupt):
+                next(watcher)
+
+        watcher.close()
+
+        watcher = WatchSemanticVersion(
+            dm,
+            repo_dir,
+            interval=0,
+            include_branch_name_when_necessary=False,
+            no_metadata=True,
+        )
+
+        assert next(watcher).semantic_version_string == "1.0.0"
+
+        # Errors are reported and polling continues
+        (repo_dir / "AutoGitSemVer.yaml").write_text("invalid_key: true\n")
+        assert SubprocessEx.Run("git add AutoGitSemVer.yaml", cwd=repo_dir).returncode == 0
+
+        # ----------------------------------------------------------------------
+        def FixConfiguration(*args, **kwargs):  # pylint: disable=unused-argument
+            # Fix the configuration once the error has been reported
+            if "invalid_key" in sink.getvalue() and (repo_dir / "AutoGitSemVer.yaml").exists():
+                assert (
+                    SubprocessEx.Run("git rm --quiet --force AutoGitSemVer.yaml", cwd=repo_dir).returncode
+                    == 0
+                )
+
+                TestCheckpoints._Commit(repo_dir, "Commit 4")
+
+        # ----------------------------------------------------------------------
+
+        with _PatchWatchSleep(FixConfiguration) as sleep:
+            assert next(watcher).semantic_version_string == "1.0.1"
+
+        assert len(sleep.call_args_list) == 2
+        assert dm.result != 0
+
+        # No changes
+        num_processes = GitEx.GetNumSpawnedProcesses()
+
+        with (
+            _PatchWatchSleep([None, None, KeyboardInterrupt()]) as sleep,
+            patch("AutoGitSemVer.Lib._GetSemanticVersionImpl") as get_semantic_version,
+        ):
+            with pytest.raises(KeyboardInterrupt):
+                next(watcher)
+
+            assert len(sleep.call_args_list) == 3
+
+            # Each poll spawns a single status process and the version isn't calculated
+            assert GitEx.GetNumSpawnedProcesses() - num_processes == 2
+            assert get_semantic_version.call_args_list == []
+
+        watcher.close()
+
+    assert "Checkpoints will not be used" not in sink.getvalue()
+
+
+# ----------------------------------------------------------------------
+class TestAsync:
+    # ----------------------------------------------------------------------
+    def test_SameResults(self, tmp_path_factory):
+        repo_dirs = [
+            TestCheckpoints._CreateRepo(tmp_path_factory),
+            TestCheckpoints._CreateRepo(tmp_path_factory),
+        ]
+
+        TestCheckpoints._Commit(repo_dirs[0], "Commit 1")
+        TestCheckpoints._Commit(repo_dirs[0], "Commit 2 (+minor)")
+
+        TestCheckpoints._Commit(repo_dirs[1], "Commit 1")
+        (repo_dirs[1] / "AutoGitSemVer.yaml").write_text('version_prefix: "v"\n')
+
+        paths = [repo_dirs[0], repo_dirs[1], repo_dirs[0]]
+
+        with DoneManager.Create(StringIO(), "") as dm:
+            expected = [GetSemanticVersion(dm, path, **self._KWARGS) for path in paths]
+
+            assert [
+                asyncio.run(GetSemanticVersionAsync(dm, path, **self._KWARGS)) for path in paths
+            ] == expected
+
+        assert [result.semantic_version_string for result in expected] == ["0.1.0", "v0.1.0", "0.1.0"]
+
+        sink = StringIO()
+
+        with DoneManager.Create(sink, "") as dm:
+            assert (
+                asyncio.run(GatherSemanticVersionsAsync(dm, paths, max_concurrency=2, **self._KWARGS))
+                == expected
+            )
+
+        assert dm.result == 0
+
+        output = sink.getvalue()
+
+        for path in paths:
+            assert "'{}'...".format(path) in output
+
+    # ----------------------------------------------------------------------
+    def test_MaxConcurrency(self, tmp_path):
+        num_active = 0
+        max_num_active = 0
+
+        # ----------------------------------------------------------------------
+        async def GetSemanticVersionAsyncMock(dm, path, **kwargs):
+            nonlocal num_active
+            nonlocal max_num_active
+
+            num_active += 1
+            max_num_active = max(max_num_active, num_active)
+
+            await asyncio.sleep(0.01)
+
+            num_active -= 1
+            return path
+
+        # ----------------------------------------------------------------------
+
+        paths = [tmp_path / str(index) for index in range(10)]
+
+        with (
+            patch("AutoGitSemVer.Lib.GetSemanticVersionAsync", side_effect=GetSemanticVersionAsyncMock),
+            DoneManager.Create(StringIO(), "") as dm,
+        ):
+            assert asyncio.run(GatherSemanticVersionsAsync(dm, paths, max_concurrency=3)) == paths
+
+        assert max_num_active == 3
+
+        with pytest.raises(Exception, match=re.escape("'max_concurrency' must be greater than 0.")):
+            asyncio.run(GatherSemanticVersionsAsync(dm, paths, max_concurrency=0))
+
+    # ----------------------------------------------------------------------
+    def test_Error(self, tmp_path_factory):
+        repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+        TestCheckpoints._Commit(repo_dir, "Commit 1")
+
+        invalid_dir = Path(tmp_path_factory.mktemp("invalid"))
+
+        sink = StringIO()
+
+        with pytest.raises(Exception, match="does not appear to be a git repository"):
+            with DoneManager.Create(sink, "") as dm:
+                asyncio.run(GatherSemanticVersionsAsync(dm, [repo_dir, invalid_dir], **self._KWARGS))
+
+        assert "'{}'...".format(invalid_dir) in sink.getvalue()
+
+    # ----------------------------------------------------------------------
+    def test_Cancellation(self, tmp_path):
+        started = threading.Event()
+        processes: list[subprocess.Popen] = []
+        errors: list[Exception] = []
+
+        # ----------------------------------------------------------------------
+        def GetSemanticVersionMock(*args, **kwargs):
+            # This process doesn't exit until its input is closed or it is killed
+            process = GitEx._Popen(
+                tmp_path, ["cat-file", "--batch"], stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+            processes.append(process)
+
+            started.set()
+            process.wait()
+
+            try:
+                GitEx._Popen(tmp_path, ["--version"])
+            except Exception as ex:
+                errors.append(ex)
+
+            process.stdin.close()
+            process.stdout.close()
+
+        # ----------------------------------------------------------------------
+        async def Execute():
+            task = asyncio.ensure_future(GetSemanticVersionAsync(dm, tmp_path))
+
+            await asyncio.to_thread(started.wait)
+            task.cancel()
+
+            await task
+
+        # ----------------------------------------------------------------------
+
+        with (
+            patch("AutoGitSemVer.Lib.GetSemanticVersion", side_effect=GetSemanticVersionMock),
+            DoneManager.Create(StringIO(), "") as dm,
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                asyncio.run(Execute())
+
+        assert len(processes) == 1
+        assert processes[0].returncode != 0
+
+        assert len(errors) == 1
+        assert str(errors[0]) == "The operation was cancelled."
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Data
+    # |
+    # ----------------------------------------------------------------------
+    _KWARGS: dict[str, Any] = {
+        "include_branch_name_when_necessary": False,
+        "include_timestamp_when_necessary": False,
+        "include_computer_name_when_necessary": False,
+    }
+
+
+# ----------------------------------------------------------------------
+def test_ProgressReporter():
+    # ----------------------------------------------------------------------
+    def Execute(
+        is_interactive: bool,
+        interval: float,
+    ) -> list[str]:
+        dm = Mock()
+        dm.capabilities.is_interactive = is_interactive
+
+        with patch("AutoGitSemVer.Lib._PROGRESS_INTERVAL", interval):
+            progress = Lib._ProgressReporter(dm)  # pylint: disable=protected-access
+
+            for index in range(1000):
+                progress.Update(index + 1, index // 2)
+
+        return [call.args[0] for call in dm.WriteStatus.call_args_list]
+
+    # ----------------------------------------------------------------------
+
+    # The time is only checked periodically
+    assert Execute(True, 0.0) == [
+        "256 changes processed, 127 changes applied",
+        "512 changes processed, 255 changes applied",
+        "768 changes processed, 383 changes applied",
+    ]
+
+    # Updates are rate-limited
+    assert Execute(True, 60.0) == []
+
+    # Progress is only displayed on interactive streams
+    assert Execute(False, 0.0) == []
+
+
+# ----------------------------------------------------------------------
+def test_DefaultCommitDataBatchExtractor():
+    commit_infos = [
+        _CreateCommitInfo(description)
+        for description in [
+            "",
+            "Commit",
+            "+major",
+            "+minor",
+            "+patch",
+            "+feature",
+            "+feature and +patch",
+            "+patch and +minor",
+            "Title (+minor)\n\nDetails (+major)",
+            "+majority",
+            "+ minor",
+            "minor",
+            "+MINOR",
+            "++feature",
+        ]
+    ]
+
+    with DoneManager.Create(StringIO(), "") as dm:
+        assert DefaultCommitDataBatchExtractor(commit_infos) == [
+            DefaultCommitDataExtractor(dm, commit_info) for commit_info in commit_infos
+        ]
+
+    assert DefaultCommitDataBatchExtractor([]) == []
+
+
+# ----------------------------------------------------------------------
+class TestBatchExtraction:
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("executor_type", [None, "thread", "process"])
+    def test_SameResults(self, tmp_path_factory, executor_type):
+        repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+        (repo_dir / "A").mkdir()
+        (repo_dir / "A" / "AutoGitSemVer.yaml").write_text('version_prefix: "A-"\n')
+
+        TestCheckpoints._Commit(repo_dir, "Commit 1 MAJOR")
+        TestCheckpoints._Commit(repo_dir, "Commit 2 MINOR", tag="v1.0.0")
+        TestCheckpoints._Commit(repo_dir, "Commit 3 PATCH")
+        TestCheckpoints._Commit(repo_dir, "Commit 4", filename="A/File.txt")
+        TestCheckpoints._Commit(repo_dir, "Commit 5 MINOR", filename="A/File.txt")
+        TestCheckpoints._Commit(repo_dir, "Commit 6 PATCH")
+        TestCheckpoints._Commit(repo_dir, "Commit 7 MINOR", filename="A/File.txt", tag="A-2.0.0")
+        TestCheckpoints._Commit(repo_dir, "Commit 8 PATCH", filename="A/File.txt")
+
+        with DoneManager.Create(StringIO(), "") as dm:
+            expected = [
+                GetSemanticVersion(
+                    dm,
+                    path,
+                    commit_delta_extraction_func=_CustomCommitDeltaExtractor,
+                    **TestAsync._KWARGS,
+                )
+                for path in [repo_dir, repo_dir / "A"]
+            ]
+
+            expected_all = GetSemanticVersions(
+                dm,
+                repo_dir,
+                commit_delta_extraction_func=_CustomCommitDeltaExtractor,
+                **TestAsync._KWARGS,
+            )
+
+        assert [result.semantic_version_string for result in expected] == ["1.0.2", "A-2.0.1"]
+
+        # The repository root doesn't have a configuration file
+        assert expected_all == expected[1:]
+
+        if executor_type is None:
+            executor = None
+        elif executor_type == "thread":
+            executor = ThreadPoolExecutor(max_workers=2)
+        elif executor_type == "process":
+            # Use "spawn", as forking a multi-threaded process is deprecated
+            executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        else:
+            assert False, executor_type  # pragma: no cover
+
+        try:
+            for batch_size in [1, 2, 256]:
+                with (
+                    patch("AutoGitSemVer.Lib._COMMIT_DELTA_BATCH_SIZE", batch_size),
+                    patch("AutoGitSemVer.Lib._MAX_NUM_PENDING_COMMIT_DELTA_BATCHES", 1),
+                    DoneManager.Create(StringIO(), "") as dm,
+                ):
+                    kwargs = {
+                        **TestAsync._KWARGS,
+                        "commit_delta_batch_extraction_func": _CustomCommitDeltaBatchExtractor,
+                        "executor": executor,
+                    }
+
+                    assert [
+                        GetSemanticVersion(dm, path, **kwargs) for path in [repo_dir, repo_dir / "A"]
+                    ] == expected
+
+                    assert GetSemanticVersions(dm, repo_dir, **kwargs) == expected_all
+
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    # ----------------------------------------------------------------------
+    def test_PerCommitFunc(self):
+        commits = [_CreateCommitInfo("MINOR"), _CreateCommitInfo(""), _CreateCommitInfo("PATCH")]
+
+        with ThreadPoolExecutor() as executor:
+            for batch_size in [1, 2]:
+                with patch("AutoGitSemVer.Lib._COMMIT_DELTA_BATCH_SIZE", batch_size):
+                    result, semver = _GetSemanticVersionImpl(
+                        commits,
+                        commit_delta_extraction_func=_CustomCommitDeltaExtractor,
+                        executor=executor,
+                        include_branch_name_when_necessary=False,
+                        no_metadata=True,
+                    )
+
+                assert result == 0
+                assert semver.semantic_version_string == "0.1.0"
+
+    # ----------------------------------------------------------------------
+    def test_InvalidResults(self):
+        with pytest.raises(
+            Exception,
+            match=re.escape("The commit delta batch extraction function returned 1 result for 2 commits."),
+        ):
+            _GetSemanticVersionImpl(
+                [_CreateCommitInfo("One"), _CreateCommitInfo("Two")],
+                commit_delta_batch_extraction_func=lambda commit_infos: [None],
+            )
+
+
+# ----------------------------------------------------------------------
+class TestGetSemanticVersions:
+    # ----------------------------------------------------------------------
+    def test_MultipleRoots(self, tmp_path_factory):
+        repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+        (repo_dir / "A" / "B").mkdir(parents=True)
+        (repo_dir / "C").mkdir()
+        (repo_dir / "Shared").mkdir()
+
+        (repo_dir / "AutoGitSemVer.yaml").write_text("initial_version: 1.0.0\n")
+        (repo_dir / "A" / "AutoGitSemVer.yaml").write_text("{}\n")
+        (repo_dir / "A" / "B" / "AutoGitSemVer.json").write_text("{}\n")
+        (repo_dir / "C" / "AutoGitSemVer.yml").write_text(
+            'version_prefix: "C-"\nadditional_dependencies: ["../Shared"]\n'
+        )
+
+        TestCheckpoints._Commit(repo_dir, "Commit 1")
+        TestCheckpoints._Commit(repo_dir, "Commit 2 (+minor)", filename="A/File.txt")
+        TestCheckpoints._Commit(repo_dir, "Commit 3", filename="A/B/File.txt", tag="v3.0.0")
+        TestCheckpoints._Commit(repo_dir, "Commit 4", filename="C/File.txt", tag="C-v2.0.0")
+        TestCheckpoints._Commit(repo_dir, "Commit 5 (+minor)", filename="Shared/File.txt")
+        TestCheckpoints._Commit(repo_dir, "Commit 6", filename="A/B/File.txt")
+        TestCheckpoints._Commit(repo_dir, "Commit 7 (+major)", filename="C/File.txt")
+        TestCheckpoints._Commit(repo_dir, "Commit 8", filename="File.txt")
+
+        results = self._Validate(repo_dir)
+
+        assert [(result.configuration_filename, result.semantic_version_string) for result in results] == [
+            (repo_dir / "AutoGitSemVer.yaml", "1.1.1"),
+            (repo_dir / "A" / "AutoGitSemVer.yaml", "0.1.0"),
+            (repo_dir / "A" / "B" / "AutoGitSemVer.json", "3.0.1"),
+            (repo_dir / "C" / "AutoGitSemVer.yml", "C-3.0.0"),
+        ]
+
+        # Working changes
+        (repo_dir / "A" / "File.txt").write_text("Working changes")
+        assert SubprocessEx.Run("git add .", cwd=repo_dir).returncode == 0
+
+        results = self._Validate(repo_dir)
+        assert results[1].semantic_version_string == "0.1.1+working_changes"
+
+    # ----------------------------------------------------------------------
+    def test_UncommittedNestedConfiguration(self, tmp_path_factory):
+        repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+        (repo_dir / "lib" / "sub").mkdir(parents=True)
+        (repo_dir / "AutoGitSemVer.yaml").write_text("initial_version: 1.0.0\n")
+
+        TestCheckpoints._Commit(repo_dir, "Commit 1")
+        TestCheckpoints._Commit(repo_dir, "Commit 2 (+minor)", filename="lib/sub/File.txt")
+        TestCheckpoints._Commit(repo_dir, "Commit 3", filename="File.txt")
+
+        kwargs = {
+            "include_branch_name_when_necessary": False,
+            "include_timestamp_when_necessary": False,
+            "include_computer_name_when_necessary": False,
+            "use_checkpoints": True,
+        }
+
+        with DoneManager.Create(StringIO(), "") as dm:
+            assert GetSemanticVersion(dm, repo_dir, **kwargs).semantic_version_string == "1.1.1"
+
+        # The nested configuration hasn't been committed, but it owns the changes in 'lib/sub'
+        (repo_dir / "lib" / "sub" / "AutoGitSemVer.yaml").write_text("{}\n")
+
+        results = self._Validate(repo_dir)
+
+        assert [(result.configuration_filename, result.semantic_version_string) for result in results] == [
+            (repo_dir / "AutoGitSemVer.yaml", "1.0.2"),
+            (repo_dir / "lib" / "sub" / "AutoGitSemVer.yaml", "0.1.0"),
+        ]
+
+        # The checkpoint created before the nested configuration existed isn't used
+        with DoneManager.Create(StringIO(), "") as dm:
+            assert GetSemanticVersion(dm, repo_dir, **kwargs).semantic_version_string == "1.0.2"
+
+    # ----------------------------------------------------------------------
+    def test_NoConfigurations(self, tmp_path_factory):
+        repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+        TestCheckpoints._Commit(repo_dir, "Commit 1")
+        TestCheckpoints._Commit(repo_dir, "Commit 2")
+
+        results = self._Validate(repo_dir)
+
+        assert len(results) == 1
+        assert results[0].configuration_filename is None
+        assert results[0].semantic_version_string == "0.1.1"
+
+    # ----------------------------------------------------------------------
+    def test_NotRepositoryRoot(self, tmp_path_factory):
+        repo_dir = TestCheckpoints._CreateRepo(tmp_path_factory)
+
+        (repo_dir / "src").mkdir()
+
+        with pytest.raises(
+            Exception,
+            match=re.escape("'{}' is not the root of a git repository.".format(repo_dir / "src")),
+        ):
+            GetSemanticVersions(DoneManager.Create(StringIO(), ""), repo_dir / "src")
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Validate(
+        repo_dir: Path,
+    ) -> list[GetSemanticVersionResult]:
+        kwargs = {
+            "include_branch_name_when_necessary": False,
+            "include_timestamp_when_necessary": False,
+            "include_computer_name_when_necessary": False,
+        }
+
+        sink = StringIO()
+
+        with patch("AutoGitSemVer.Lib.EnumCommits", side_effect=EnumCommits) as enum_commits:
+            with DoneManager.Create(sink, "") as dm:
+                results = GetSemanticVersions(dm, repo_dir, **kwargs)
+
+            assert dm.result == 0, sink.getvalue()
+
+        # The history is only enumerated once
+        assert enum_commits.call_count == 1
+
+        for result in results:
+            with DoneManager.Create(StringIO(), "") as dm:
+                expected = GetSemanticVersion(
+                    dm,
+                    result.configuration_filename.parent if result.configuration_filename else repo_dir,
+                    **kwargs,
+                )
+
+            assert result == expected
+
+        return results
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateCommitInfo(
+    description: str,
+    files: Optional[list[PurePath]] = None,
+    tags: Optional[list[str]] = None,
+    *,
+    is_working_change: bool = False,
+) -> CommitInfo:
+    id = CommitInfo.WORKING_CHANGES_COMMIT_ID if is_working_change else str(uuid4())
+
+    if files is None:
+        files = [PurePath("File.txt")]
+
+    return CommitInfo(id, description, tags or [], "Author", datetime.now(), files)
+
+
+# ----------------------------------------------------------------------
+def _CustomCommitDeltaExtractor(
+    dm: DoneManager,  # pylint: disable=unused-argument
+    commit_info: CommitInfo,
+) -> Optional[VersionDelta]:
+    if "MAJOR" in commit_info.description:
+        return VersionDelta(1, 0, 0, None, None)
+    if "MINOR" in commit_info.description:
+        return VersionDelta(0, 1, 0, None, None)
+    if "PATCH" in commit_info.description:
+        return VersionDelta(0, 0, 1, None, None)
+
+    return None
+
+
+# ----------------------------------------------------------------------
+def _CustomCommitDeltaBatchExtractor(
+    commit_infos: list[CommitInfo],
+) -> list[Optional[VersionDelta]]:
+    return [_CustomCommitDeltaExtractor(cast(DoneManager, None), commit_info) for commit_info in commit_infos]
+
+
+# ----------------------------------------------------------------------
+def _GetSemanticVersionImpl(
+    commits: list[CommitInfo],
+    *,
+    working_dir: Path = Path.cwd(),
+    **kwargs,
+) -> tuple[int, GetSemanticVersionResult]:
+    with patch("AutoGitSemVer.Lib.EnumCommits", return_value=commits):
+        sink = StringIO()
+
+        with DoneManager.Create(sink, "_GetSemanticVersionImpl...") as dm:
+            # Don't cache information in this package's repository
+            result = GetSemanticVersion(dm, working_dir, use_cache=False, **kwargs)
+
+        return dm.result, result
+
+
+# ----------------------------------------------------------------------
+@contextlib.contextmanager
+def _PatchWatchSleep(
+    side_effect: Any,
+) -> Iterator[Mock]:
+    """Patches the sleep between polls in `WatchSemanticVersion`; other sleeps (for example, while waiting for processes to exit) are not impacted."""
+
+    original_sleep = time.sleep
+    sleep_mock = Mock(side_effect=side_effect)
+
+    # ----------------------------------------------------------------------
+    def Sleep(
+        seconds: float,
+    ) -> None:
+        if sys._getframe(1).f_code.co_name == WatchSemanticVersion.__name__:  # pylint: disable=protected-access
+            sleep_mock(seconds)
+        else:
+            original_sleep(seconds)
+
+    # ----------------------------------------------------------------------
+
+    with patch("AutoGitSemVer.Lib.time.sleep", new=Sleep):
+        yield sleep_mock
@@ -0,0 +1,98 @@
+# ----------------------------------------------------------------------
+# |
+# |  PathTable_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 21:51:07
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for AutoGitSemVer/PathTable.py"""
+
+import pickle
+
+from pathlib import PurePath
+
+import pytest
+
+from AutoGitSemVer.PathTable import *
+
+
+# ----------------------------------------------------------------------
+def test_Standard():
+    table = PathTable()
+
+    paths1 = table.CreateList(["A.txt", "Dir/B.txt", "A.txt"])
+    paths2 = table.CreateList(["Dir/B.txt", "C.txt"])
+
+    # Paths are only stored once
+    assert len(table) == 3
+
+    assert len(paths1) == 3
+    assert list(paths1) == [PurePath("A.txt"), PurePath("Dir/B.txt"), PurePath("A.txt")]
+    assert paths1[1] == PurePath("Dir/B.txt")
+    assert paths1[-1] == PurePath("A.txt")
+    assert list(paths1.EnumStrings()) == ["A.txt", "Dir/B.txt", "A.txt"]
+
+    # Path objects are shared
+    assert paths1[1] is paths2[0]
+    assert paths1[0] is paths1[2]
+
+    assert paths1[1:] == [PurePath("Dir/B.txt"), PurePath("A.txt")]
+    assert isinstance(paths1[1:], PathList)
+
+    with pytest.raises(IndexError):
+        paths1[3]
+
+    assert PurePath("C.txt") in paths2
+    assert PurePath("A.txt") not in paths2
+
+    assert not table.CreateList([])
+    assert repr(paths2) == "PathList({!r})".format([PurePath("Dir/B.txt"), PurePath("C.txt")])
+
+
+# ----------------------------------------------------------------------
+def test_Equality():
+    table = PathTable()
+
+    paths = table.CreateList(["A.txt", "B.txt"])
+
+    assert paths == table.CreateList(["A.txt", "B.txt"])
+    assert paths != table.CreateList(["B.txt", "A.txt"])
+
+    # Lists created by different tables
+    assert paths == PathTable().CreateList(["A.txt", "B.txt"])
+    assert paths != PathTable().CreateList(["A.txt"])
+
+    # Other sequences
+    assert paths == [PurePath("A.txt"), PurePath("B.txt")]
+    assert paths == (PurePath("A.txt"), PurePath("B.txt"))
+    assert paths != [PurePath("A.txt")]
+
+    assert paths != "A.txt"
+    assert paths != 1
+
+    with pytest.raises(TypeError):
+        hash(paths)
+
+
+# ----------------------------------------------------------------------
+def test_Pickle():
+    table = PathTable()
+
+    table.CreateList(["Unrelated{}.txt".format(index) for index in range(100)])
+    paths = table.CreateList(["A.txt", "B.txt"])
+
+    pickled = pickle.dumps(paths)
+
+    # The table isn't pickled
+    assert b"Unrelated" not in pickled
+
+    unpickled = pickle.loads(pickled)
+
+    assert isinstance(unpickled, PathList)
+    assert unpickled == paths
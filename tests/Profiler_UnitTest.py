@@ -0,0 +1,128 @@
+# ----------------------------------------------------------------------
+# |
+# |  Profiler_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 23:14:02
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for AutoGitSemVer/Profiler.py"""
+
+import json
+import threading
+
+from AutoGitSemVer.Profiler import *
+
+
+# ----------------------------------------------------------------------
+def test_Inactive():
+    assert GetActiveProfile() is None
+
+    with Phase("phase"):
+        Increment("counter")
+
+    with Profile() as profile:
+        assert GetActiveProfile() is profile
+
+    assert GetActiveProfile() is None
+
+    # Nothing was recorded while the profile wasn't active
+    assert not profile.phases
+    assert not profile.counters
+
+
+# ----------------------------------------------------------------------
+def test_Phases():
+    with Profile() as profile:
+        with Phase("one"):
+            with Phase("two"):
+                pass
+
+            with Phase("two"):
+                Increment("counter")
+
+        with Phase("three"):
+            Increment("counter", 10)
+
+    assert list(profile.phases) == ["one", "one/two", "three"]
+
+    assert profile.phases["one"].num_calls == 1
+    assert profile.phases["one/two"].num_calls == 2
+    assert profile.phases["three"].num_calls == 1
+
+    assert profile.phases["one"].wall_time >= profile.phases["one/two"].wall_time
+    assert profile.wall_time >= profile.phases["one"].wall_time + profile.phases["three"].wall_time
+
+    assert profile.counters == {"counter": 11}
+
+
+# ----------------------------------------------------------------------
+def test_Threads():
+    with Profile() as profile:
+        # ----------------------------------------------------------------------
+        def Execute():
+            # Threads don't inherit the context of the thread that created them
+            assert GetActiveProfile() is None
+
+        # ----------------------------------------------------------------------
+
+        thread = threading.Thread(target=Execute)
+
+        thread.start()
+        thread.join()
+
+    assert not profile.phases
+
+
+# ----------------------------------------------------------------------
+def test_CacheHitRates():
+    with Profile() as profile:
+        Increment("cache1.hits", 3)
+        Increment("cache1.misses", 1)
+        Increment("cache2.misses", 2)
+        Increment("cache3.hits", 0)
+        Increment("other")
+
+    assert profile.GetCacheHitRates() == {"cache1": 0.75, "cache2": 0.0, "cache3": 0.0}
+
+
+# ----------------------------------------------------------------------
+def test_Output():
+    with Profile() as profile:
+        with Phase("one"):
+            with Phase("two"):
+                Increment("cache.hits")
+
+    content = profile.ToJson()
+
+    # The content can be serialized
+    assert json.loads(json.dumps(content)) == content
+
+    assert content["wall_time"] == profile.wall_time
+    assert list(content["phases"]) == ["one", "one/two"]
+    assert content["phases"]["one/two"] == {
+        "num_calls": 1,
+        "wall_time": profile.phases["one/two"].wall_time,
+        "cpu_time": profile.phases["one/two"].cpu_time,
+    }
+    assert content["counters"] == {"cache.hits": 1}
+    assert content["cache_hit_rates"] == {"cache": 1.0}
+
+    lines = profile.ToTable().split("\n")
+
+    assert lines[0].split() == ["Phase", "Calls", "Wall", "(ms)", "CPU", "(ms)", "Wall", "%"]
+    assert lines[2].split()[:2] == ["one", "1"]
+    assert lines[3].split()[:2] == ["one/two", "1"]
+    assert lines[4].startswith("<total>")
+    assert lines[6].split() == ["cache.hits", "1"]
+    assert lines[8].split() == ["cache", "100.0%", "hits"]
+
+
+# ----------------------------------------------------------------------
+def test_EmptyTable():
+    assert Profile().ToTable().split("\n")[2].split() == ["<total>", "0.00"]
@@ -0,0 +1,317 @@
+# ----------------------------------------------------------------------
+# |
+# |  Server_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2026-10-17 19:58:12
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2026
+# |  Distributed under the MIT License.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for AutoGitSemVer/Server.py"""
+
+import json
+import os
+import socket
+import stat
+import subprocess
+import threading
+
+from io import StringIO
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from typer.testing import CliRunner
+
+from dbrownell_Common.Streams.DoneManager import DoneManager  # type: ignore [import-untyped]
+
+from AutoGitSemVer import Lib
+from AutoGitSemVer.EntryPoint import app
+from AutoGitSemVer.Lib import GetSemanticVersion
+from AutoGitSemVer.Server import *
+
+
+# ----------------------------------------------------------------------
+pytestmark = pytest.mark.skipif(not IsSupported(), reason="Unix domain sockets are not supported")
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def socket_filename(tmp_path_factory) -> Iterator[Path]:
+    # Use a short path, as the length of socket filenames is limited
+    socket_dir = Path(tmp_path_factory.mktemp("s"))
+
+    yield socket_dir / "s.sock"
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def server(socket_filename) -> Iterator[Server]:
+    with Server(socket_filename) as server:
+        thread = threading.Thread(target=server.ServeForever)
+        thread.start()
+
+        try:
+            yield server
+        finally:
+            server.Shutdown()
+            thread.join()
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def repo_dir(tmp_path_factory) -> Path:
+    repo_dir = Path(tmp_path_factory.mktemp("repo"))
+
+    for args in [
+        ["init", "--quiet"],
+        ["commit", "--quiet", "--allow-empty", "-m", "Commit 1"],
+        ["commit", "--quiet", "--allow-empty", "-m", "Commit 2 (+minor)"],
+    ]:
+        subprocess.run(
+            ["git", "-c", "user.name=Test", "-c", "user.email=a@b.com", *args],
+            cwd=repo_dir,
+            check=True,
+        )
+
+    return repo_dir
+
+
+# ----------------------------------------------------------------------
+def test_Generate(server, repo_dir):
+    response = Generate(repo_dir, socket_filename=server.socket_filename, no_metadata=True)
+
+    assert response is not None
+    assert response.result == 0
+    assert response.output.startswith("Generating with the server at '{}'...".format(server.socket_filename))
+
+    with DoneManager.Create(StringIO(), "") as dm:
+        expected = GetSemanticVersion(dm, repo_dir, no_metadata=True)
+
+    assert response.semantic_version_result == expected
+
+    # Checkpoints are used for subsequent requests
+    for _ in range(2):
+        response = Generate(repo_dir, socket_filename=server.socket_filename, no_metadata=True)
+
+        assert response is not None
+        assert response.semantic_version_result == expected
+
+
+# ----------------------------------------------------------------------
+def test_SameAsLocal(server, repo_dir):
+    # ----------------------------------------------------------------------
+    def Git(*args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=Test", "-c", "user.email=a@b.com", *args],
+            cwd=repo_dir,
+            check=True,
+            capture_output=True,
+        )
+
+    # ----------------------------------------------------------------------
+    def Commit(message: str) -> None:
+        with (repo_dir / "File.txt").open("a") as f:
+            f.write(message)
+
+        Git("add", ".")
+        Git("commit", "--quiet", "-m", message)
+
+    # ----------------------------------------------------------------------
+    def Execute(*args: str) -> str:
+        with patch("AutoGitSemVer.EntryPoint.Server.Generate", side_effect=Generate) as generate_mock:
+            result = CliRunner().invoke(
+                app,
+                [str(repo_dir), "--quiet", "--no-branch-name", "--no-metadata", *args],
+            )
+
+        assert result.exit_code == 0, result.output
+
+        # The server is used unless '--no-server' is provided
+        assert generate_mock.call_count == (0 if "--no-server" in args else 1)
+
+        return result.output
+
+    # ----------------------------------------------------------------------
+
+    # Create a history where a checkpoint created before a merge can't be reused
+    Git("checkout", "--quiet", "-B", "main")
+    Git("branch", "feature")
+
+    Commit("Commit 3")
+    Git("tag", "v1.0.0")
+    Commit("Commit 4 (+minor)")
+
+    with patch.dict(os.environ, {SOCKET_ENVIRONMENT_VARIABLE_NAME: str(server.socket_filename)}):
+        for use_checkpoints in [False, True]:
+            args = ["--use-checkpoints"] if use_checkpoints else []
+
+            assert Execute(*args) == Execute("--no-server", *args) == "1.1.0"
+
+        Git("checkout", "--quiet", "feature")
+        Commit("Feature (+major)")
+        Git("merge", "--quiet", "--no-ff", "-X", "theirs", "-m", "Merge", "main")
+
+        for use_checkpoints in [True, False]:
+            args = ["--use-checkpoints"] if use_checkpoints else []
+
+            assert Execute(*args) == Execute("--no-server", *args) == "1.1.0"
+
+
+# ----------------------------------------------------------------------
+def test_Environment(server, repo_dir):
+    environments: list[dict[str, str]] = []
+
+    # ----------------------------------------------------------------------
+    def GetSemanticVersionWrapper(*args, **kwargs):
+        result = Lib.GetSemanticVersion(*args, **kwargs)
+
+        environments.append(dict(kwargs["environment"]))
+        return result
+
+    # ----------------------------------------------------------------------
+
+    with (
+        patch.dict(os.environ, {"AUTO_GIT_SEM_VER_PRERELEASE_NAME": "client", "OTHER_VARIABLE": "secret"}),
+        patch("AutoGitSemVer.Server.GetSemanticVersion", side_effect=GetSemanticVersionWrapper),
+    ):
+        response = Generate(repo_dir, socket_filename=server.socket_filename, no_metadata=True)
+
+    assert response is not None
+    assert response.semantic_version_result is not None
+    assert response.semantic_version_result.semantic_version_string.endswith("-client")
+
+    # Only the environment variables read by the server are sent by the client
+    assert environments == [{"AUTO_GIT_SEM_VER_PRERELEASE_NAME": "client"}]
+
+    # Environment variables aren't requested when the prerelease name is provided
+    environments.clear()
+
+    with patch("AutoGitSemVer.Server.GetSemanticVersion", side_effect=GetSemanticVersionWrapper):
+        response = Generate(
+            repo_dir,
+            socket_filename=server.socket_filename,
+            prerelease_name="explicit",
+            no_metadata=True,
+        )
+
+    assert response is not None
+    assert response.semantic_version_result is not None
+    assert response.semantic_version_result.semantic_version_string.endswith("-explicit")
+
+    assert environments == [{}]
+
+
+# ----------------------------------------------------------------------
+def test_Error(server, tmp_path):
+    response = Generate(tmp_path, socket_filename=server.socket_filename)
+
+    assert response is not None
+    assert response.result != 0
+    assert response.semantic_version_result is None
+    assert "does not appear to be a git repository" in response.output
+
+
+# ----------------------------------------------------------------------
+def test_UnexpectedError(server, repo_dir, capsys):
+    with patch("AutoGitSemVer.Server.DoneManager.Create", side_effect=Exception("Unexpected error")):
+        response = Generate(repo_dir, socket_filename=server.socket_filename)
+
+    assert response is not None
+    assert response.result != 0
+    assert response.semantic_version_result is None
+    assert "Unexpected error" in response.output
+
+    # The error is written by the server
+    assert "Unexpected error" in capsys.readouterr().err
+
+
+# ----------------------------------------------------------------------
+def test_Concurrent(server, repo_dir):
+    responses: list[GenerateResponse] = []
+
+    # ----------------------------------------------------------------------
+    def Execute():
+        response = Generate(repo_dir, socket_filename=server.socket_filename, no_metadata=True)
+        assert response is not None
+
+        responses.append(response)
+
+    # ----------------------------------------------------------------------
+
+    threads = [threading.Thread(target=Execute) for _ in range(8)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(responses) == 8
+    assert all(response.result == 0 for response in responses)
+    assert len(set(response.semantic_version_result for response in responses)) == 1
+
+
+# ----------------------------------------------------------------------
+def test_InvalidRequests(server):
+    for request in [
+        b"this is not json\n",
+        b'{"version": 0}\n',
+        json.dumps({"version": PROTOCOL_VERSION, "command": "Invalid"}).encode("utf-8") + b"\n",
+    ]:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(str(server.socket_filename))
+            connection.sendall(request)
+
+            with connection.makefile("rb") as f:
+                response = json.loads(f.readline())
+
+        assert "error" in response
+
+
+# ----------------------------------------------------------------------
+def test_NotRunning(socket_filename, repo_dir):
+    assert Generate(repo_dir, socket_filename=socket_filename) is None
+
+    # Socket left behind by a server that did not exit cleanly
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.bind(str(socket_filename))
+
+    assert socket_filename.exists()
+    assert Generate(repo_dir, socket_filename=socket_filename) is None
+
+    # The socket is replaced when a new server is started
+    with Server(socket_filename):
+        assert socket_filename.exists()
+
+    assert not socket_filename.exists()
+
+
+# ----------------------------------------------------------------------
+def test_AlreadyRunning(server):
+    with pytest.raises(Exception, match="A server is already running at"):
+        with Server(server.socket_filename):
+            pass
+
+    # The running server is still available
+    assert server.socket_filename.exists()
+
+
+# ----------------------------------------------------------------------
+def test_Permissions(server):
+    assert stat.S_IMODE(server.socket_filename.stat().st_mode) & 0o077 == 0
+
+
+# ----------------------------------------------------------------------
+def test_DefaultSocketFilename(tmp_path):
+    with patch.dict(os.environ, {SOCKET_ENVIRONMENT_VARIABLE_NAME: str(tmp_path / "custom.sock")}):
+        assert GetDefaultSocketFilename() == tmp_path / "custom.sock"
+
+    with patch.dict(os.environ, {SOCKET_ENVIRONMENT_VARIABLE_NAME: ""}):
+        assert GetDefaultSocketFilename().name.startswith("autogitsemver-")